@@ -0,0 +1,19 @@
+"""
+JIT Compilation Helpers
+Exposes numba's njit when numba is installed and a pure-Python stand-in otherwise.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# Fast-math flags that keep NaN/Inf semantics intact (unlike fastmath=True)
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
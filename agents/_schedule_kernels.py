@@ -0,0 +1,36 @@
+"""
+Scheduling Kernels
+Compiled graph kernels behind the Implementer agent's critical-path scheduling.
+Task graphs are given in CSR form over task ids numbered in topological order.
+"""
+
+import numpy as np
+from ._jit import njit
+
+@njit("f8[::1](i4[::1], i4[::1], f8[::1])", nogil=True, cache=True)
+def backflow(succ_ptr, succ_idx, durations):
+    """
+    Compute Backflow priorities: each task's duration plus the largest priority of its successors.
+    
+    Ids follow topological order, so walking them backwards ranks every
+    successor before its prerequisites; the result is the length of the
+    longest path starting at each task.
+    
+    Args:
+        succ_ptr: Contiguous int32 CSR offsets, length n + 1
+        succ_idx: Contiguous int32 successor ids
+        durations: Contiguous float64 duration per task
+        
+    Returns:
+        float64 priority per task
+    """
+    n = durations.size
+    priorities = np.empty(n, dtype=np.float64)
+    for u in range(n - 1, -1, -1):
+        best = 0.0
+        for k in range(succ_ptr[u], succ_ptr[u + 1]):
+            v = succ_idx[k]
+            if priorities[v] > best:
+                best = priorities[v]
+        priorities[u] = durations[u] + best
+    return priorities
@@ -0,0 +1,65 @@
+"""
+Scoring Kernels
+Compiled numeric kernels behind the Challenger agent's severity, confidence and impact scores.
+"""
+
+import numpy as np
+from ._jit import njit, FASTMATH
+
+@njit("f8(f4[::1], f4[::1])", fastmath=FASTMATH, nogil=True, cache=True)
+def weighted_score(values, weights):
+    """
+    Compute the weighted mean of values, clipped to [0, 1].
+    
+    Args:
+        values: Contiguous float32 scores
+        weights: Contiguous float32 weights, same length as values
+    
+    Returns:
+        The weighted mean, or 0.0 when the weights sum to zero
+    """
+    total = 0.0
+    weight_sum = 0.0
+    for i in range(values.size):
+        total += float(values[i]) * float(weights[i])
+        weight_sum += float(weights[i])
+    if weight_sum <= 0.0:
+        return 0.0
+    return min(max(total / weight_sum, 0.0), 1.0)
+
+@njit("f8(f4[::1])", fastmath=FASTMATH, nogil=True, cache=True)
+def combined_confidence(strengths):
+    """
+    Combine independent pieces of evidence with a noisy-OR.
+    
+    Args:
+        strengths: Contiguous float32 evidence strengths in [0, 1]
+    
+    Returns:
+        Probability that at least one piece of evidence holds
+    """
+    miss = 1.0
+    for i in range(strengths.size):
+        miss *= 1.0 - min(max(float(strengths[i]), 0.0), 1.0)
+    return 1.0 - miss if strengths.size else 0.0
+
+@njit("f8(f4[::1], f4[::1], f4[::1])", fastmath=FASTMATH, nogil=True, cache=True)
+def impact_score(severities, implication_weights, risk_weights):
+    """
+    Average each challenge's severity scaled by its implication and risk weights.
+    
+    Args:
+        severities: Contiguous float32 severity per challenge
+        implication_weights: Contiguous float32 implication weight per challenge
+        risk_weights: Contiguous float32 risk weight per challenge
+    
+    Returns:
+        Mean weighted severity, or 0.0 for no challenges
+    """
+    n = severities.size
+    if n == 0:
+        return 0.0
+    total = 0.0
+    for i in range(n):
+        total += float(severities[i]) * float(implication_weights[i]) * float(risk_weights[i])
+    return total / n
@@ -3,22 +3,112 @@ Analyst Agent
 Specializes in data-driven pattern recognition, statistical analysis, and insight generation.
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Awaitable, Callable, Deque, List, Mapping, Optional, Tuple, Union
+from dataclasses import dataclass
 from .base_agent import BaseAgent, AgentPersonality
+from ._stats_kernels import basic_stats, shape_stats, find_all_patterns
 import asyncio
 import numpy as np
+from collections import ChainMap, deque
 from datetime import datetime
+from itertools import chain
+from types import MappingProxyType
+
+try:
+    import polars as pl
+    import polars.selectors as cs
+    _HAS_POLARS = True
+except ImportError:  # pragma: no cover - depends on the environment
+    pl = None
+    _HAS_POLARS = False
+
+class AnalysisError(Exception):
+    """Raised when an analysis or collaborative analysis cannot be completed."""
+    pass
 
 class AnalysisResult(Dict[str, Any]):
     """Type alias for analysis results with proper structure."""
     pass
 
+# Numeric codes for pattern labels, per pattern family row of InsightContext.pattern_ids
+_PATTERN_CODES = MappingProxyType({
+    "increasing": 1, "decreasing": -1, "stable": 0,
+    "oscillating": 1, "smooth": 0,
+    "persistent": 1, "erratic": 0
+})
+_PATTERN_ROWS = MappingProxyType({"temporal": 0, "structural": 1, "behavioral": 2})
+
+@dataclass(slots=True, frozen=True)
+class InsightContext:
+    """
+    Flattened view of one analysis shared by every insight deriver.
+    
+    stats_matrix rows follow STATS_ROWS; every array has one entry (or
+    column) per analyzed variable, in the order of columns.
+    """
+    STATS_ROWS = ("mean", "std", "min", "max", "skewness", "kurtosis")
+    
+    columns: Tuple[str, ...]
+    stats_matrix: np.ndarray
+    correlations: np.ndarray
+    pattern_ids: np.ndarray
+    trend_slopes: np.ndarray
+    trend_strength: np.ndarray
+    
+    @classmethod
+    def from_analyses(
+        cls,
+        statistical_analysis: Mapping[str, Any],
+        pattern_analysis: List[Dict[str, Any]],
+        trend_analysis: Mapping[str, Any]
+    ) -> 'InsightContext':
+        """Extract every array the derivers need from the nested analyses in one walk."""
+        basic = statistical_analysis["basic_statistics"]
+        advanced = statistical_analysis["advanced_statistics"]
+        columns = tuple(basic["columns"])
+        stats_matrix = np.vstack([
+            basic["mean"], basic["std"], basic["min"], basic["max"],
+            advanced["skewness"], advanced["kurtosis"]
+        ]) if columns else np.empty((len(cls.STATS_ROWS), 0))
+        
+        index = {column: i for i, column in enumerate(columns)}
+        pattern_ids = np.zeros((len(_PATTERN_ROWS), len(columns)), dtype=np.int8)
+        for pattern in pattern_analysis:
+            row = _PATTERN_ROWS.get(pattern.get("type"))
+            col = index.get(pattern.get("column"))
+            if row is not None and col is not None:
+                pattern_ids[row, col] = _PATTERN_CODES.get(pattern["pattern"], 0)
+                
+        trends = trend_analysis["identified_trends"]
+        return cls(
+            columns=columns,
+            stats_matrix=stats_matrix,
+            correlations=statistical_analysis["correlations"]["matrix"],
+            pattern_ids=pattern_ids,
+            trend_slopes=trends["slopes"],
+            trend_strength=trends["strength"]
+        )
+
 class AnalystAgent(BaseAgent):
     """
     The Analyst agent focuses on detailed data analysis and pattern recognition.
     It excels at finding insights in complex data and providing evidence-based recommendations.
     """
     
+    # Maximum number of past analyses kept in analysis_history
+    HISTORY_MAX = 128
+    
+    # Number of future observations estimated by _project_trends
+    PROJECTION_HORIZON = 5
+    
+    # Immutable, so a single instance is shared by every analysis result
+    _METHODOLOGY = MappingProxyType({
+        "methods": ("statistical_analysis", "pattern_recognition", "trend_analysis"),
+        "tools": ("numpy", "custom_analytics"),
+        "validation_approach": "cross_validation",
+        "dtype": MappingProxyType({"storage": "float32", "accumulation": "float64"})
+    })
+    
     def __init__(self):
         personality = AgentPersonality(
             name="Analyst",
@@ -39,8 +129,9 @@ class AnalystAgent(BaseAgent):
             description="Data-driven analyst focused on pattern recognition and detailed analysis"
         )
         super().__init__(personality)
-        self.analysis_history: List[AnalysisResult] = []
+        self.analysis_history: Deque[AnalysisResult] = deque(maxlen=self.HISTORY_MAX)
         self.current_analysis: Optional[AnalysisResult] = None
+        self._pipeline_cache: Dict[Tuple[Any, ...], Callable] = {}
         
     async def process(self, input_data: Any) -> Dict[str, Any]:
         """
@@ -52,16 +143,15 @@ class AnalystAgent(BaseAgent):
         Returns:
             Dict containing analysis results and insights
         """
-        await self.update_state({"current_task": "data_analysis"})
+        self.update_state({"current_task": "data_analysis"})
         
         try:
             # Initial data validation and preparation
             prepared_data = await self._prepare_data(input_data)
             
-            # Perform comprehensive analysis
-            statistical_analysis = await self._perform_statistical_analysis(prepared_data)
-            pattern_analysis = await self._identify_patterns(prepared_data)
-            trend_analysis = await self._analyze_trends(prepared_data)
+            # Perform comprehensive analysis with the pipeline specialized for this input shape
+            pipeline = self._get_pipeline(self._pipeline_signature(input_data, prepared_data))
+            statistical_analysis, pattern_analysis, trend_analysis = await pipeline(prepared_data)
             
             # Generate insights
             insights = await self._generate_insights(
@@ -75,7 +165,7 @@ class AnalystAgent(BaseAgent):
             
             # Compile final analysis
             analysis_result = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),
                 "data_summary": self._summarize_data(prepared_data),
                 "statistical_analysis": statistical_analysis,
                 "pattern_analysis": pattern_analysis,
@@ -94,7 +184,7 @@ class AnalystAgent(BaseAgent):
             
         except Exception as e:
             self.state.confidence *= 0.8
-            raise Exception(f"Analysis failed: {str(e)}")
+            raise AnalysisError("Analysis failed") from e
             
     async def collaborate(self, other_agent: 'BaseAgent', context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -107,13 +197,13 @@ class AnalystAgent(BaseAgent):
         Returns:
             Dict containing collaboration results
         """
-        await self.update_state({
+        self.update_state({
             "current_task": f"collaboration_with_{other_agent.personality.name}"
         })
         
         try:
             # Get other agent's perspective
-            other_analysis = await other_agent.process(context)
+            other_analysis = await self.consult(other_agent, context)
             
             # Validate and integrate external analysis
             validated_analysis = await self._validate_external_analysis(other_analysis)
@@ -136,93 +226,96 @@ class AnalystAgent(BaseAgent):
                 "confidence_score": self.state.confidence,
                 "collaboration_metadata": {
                     "partner": other_agent.personality.name,
-                    "timestamp": datetime.now().isoformat()
+                    "trait_affinity": self.personality.affinity(other_agent.personality),
+                    "timestamp": datetime.now()
                 }
             }
             
         except Exception as e:
             self.state.confidence *= 0.9
-            raise Exception(f"Collaborative analysis failed: {str(e)}")
+            raise AnalysisError("Collaborative analysis failed") from e
             
     async def _prepare_data(self, input_data: Any) -> Dict[str, Any]:
         """Prepare and validate input data for analysis."""
-        try:
-            # Data validation
-            validated_data = self._validate_data(input_data)
-            
-            # Data cleaning
-            cleaned_data = self._clean_data(validated_data)
-            
-            # Data structuring
-            structured_data = self._structure_data(cleaned_data)
-            
-            return structured_data
-            
-        except Exception as e:
-            raise Exception(f"Data preparation failed: {str(e)}")
-            
-    async def _perform_statistical_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Perform comprehensive statistical analysis on the data."""
-        try:
-            # Basic statistics
-            basic_stats = self._calculate_basic_statistics(data)
-            
-            # Advanced statistics
-            advanced_stats = self._calculate_advanced_statistics(data)
-            
-            # Correlation analysis
-            correlations = self._analyze_correlations(data)
-            
-            return {
-                "basic_statistics": basic_stats,
-                "advanced_statistics": advanced_stats,
+        # Data validation
+        validated_data = self._validate_data(input_data)
+        
+        # Data cleaning
+        cleaned_data = self._clean_data(validated_data)
+        
+        # Data structuring
+        structured_data = self._structure_data(cleaned_data)
+        
+        return structured_data
+            
+    def _pipeline_signature(self, input_data: Any, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Describe the input by the properties that decide which analyses can apply."""
+        n_rows, n_cols = data["matrix"].shape
+        return (
+            type(input_data).__name__,
+            str(getattr(input_data, "dtype", "")),
+            n_rows >= 2,
+            n_cols >= 2
+        )
+        
+    def _get_pipeline(
+        self,
+        signature: Tuple[Any, ...]
+    ) -> Callable[[Dict[str, Any]], Awaitable[Tuple[Dict[str, Any], List[Dict[str, Any]], Dict[str, Any]]]]:
+        """Return the cached analysis pipeline for a signature, building it on first use."""
+        pipeline = self._pipeline_cache.get(signature)
+        if pipeline is None:
+            _, _, has_time_axis, multivariate = signature
+            pipeline = self._pipeline_cache[signature] = self._build_pipeline(has_time_axis, multivariate)
+        return pipeline
+        
+    def _build_pipeline(
+        self,
+        has_time_axis: bool,
+        multivariate: bool
+    ) -> Callable[[Dict[str, Any]], Awaitable[Tuple[Dict[str, Any], List[Dict[str, Any]], Dict[str, Any]]]]:
+        """
+        Build an analysis pipeline with only the stages that apply to the input.
+        
+        Stages that need several observations (patterns, trends) or several
+        variables (correlations) are dropped up front when the data can't
+        support them, so no executor hop is spent on a degenerate result.
+        The remaining stages are independent and run concurrently.
+        """
+        run_sync = self._run_sync
+        stages = [self._calculate_basic_statistics, self._calculate_advanced_statistics]
+        if multivariate:
+            stages.append(self._analyze_correlations)
+        if has_time_axis:
+            stages += [self._find_patterns, self._analyze_trends]
+            
+        async def pipeline(data):
+            results = await asyncio.gather(*(run_sync(stage, data) for stage in stages))
+            basic, advanced = results[0], results[1]
+            correlations = results[2] if multivariate else self._analyze_correlations(data)
+            if has_time_axis:
+                patterns, trends = results[-2], results[-1]
+            else:
+                patterns, trends = [], self._analyze_trends(data)
+            statistical = {
+                "basic_statistics": basic,
+                "advanced_statistics": advanced,
                 "correlations": correlations
             }
+            return statistical, patterns, trends
             
-        except Exception as e:
-            raise Exception(f"Statistical analysis failed: {str(e)}")
-            
-    async def _identify_patterns(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Identify patterns and regularities in the data."""
-        patterns = []
-        try:
-            # Temporal patterns
-            temporal_patterns = self._find_temporal_patterns(data)
-            patterns.extend(temporal_patterns)
-            
-            # Structural patterns
-            structural_patterns = self._find_structural_patterns(data)
-            patterns.extend(structural_patterns)
-            
-            # Behavioral patterns
-            behavioral_patterns = self._find_behavioral_patterns(data)
-            patterns.extend(behavioral_patterns)
-            
-            return patterns
-            
-        except Exception as e:
-            raise Exception(f"Pattern identification failed: {str(e)}")
+        return pipeline
             
-    async def _analyze_trends(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_trends(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze trends and their characteristics."""
-        try:
-            # Trend identification
-            trends = self._identify_trends(data)
-            
-            # Trend classification
-            classified_trends = self._classify_trends(trends)
-            
-            # Trend projection
-            projections = self._project_trends(classified_trends)
-            
-            return {
-                "identified_trends": trends,
-                "trend_classification": classified_trends,
-                "trend_projections": projections
-            }
-            
-        except Exception as e:
-            raise Exception(f"Trend analysis failed: {str(e)}")
+        # Trend identification
+        trends = self._identify_trends(data)
+        
+        return {
+            "identified_trends": trends,
+            "trend_classification": self._classify_trends(trends),
+            "trend_projections": self._project_trends(trends)
+        }
             
     async def _generate_insights(
         self,
@@ -231,32 +324,16 @@ class AnalystAgent(BaseAgent):
         trend_analysis: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """Generate insights from analyzed data."""
-        insights = []
-        try:
-            # Statistical insights
-            statistical_insights = self._derive_statistical_insights(statistical_analysis)
-            insights.extend(statistical_insights)
-            
-            # Pattern insights
-            pattern_insights = self._derive_pattern_insights(pattern_analysis)
-            insights.extend(pattern_insights)
-            
-            # Trend insights
-            trend_insights = self._derive_trend_insights(trend_analysis)
-            insights.extend(trend_insights)
-            
-            # Cross-analysis insights
-            cross_insights = self._derive_cross_analysis_insights(
-                statistical_analysis,
-                pattern_analysis,
-                trend_analysis
-            )
-            insights.extend(cross_insights)
-            
-            return insights
-            
-        except Exception as e:
-            raise Exception(f"Insight generation failed: {str(e)}")
+        ctx = InsightContext.from_analyses(statistical_analysis, pattern_analysis, trend_analysis)
+        
+        # The derivers are independent of each other, so run them concurrently
+        derived = await asyncio.gather(
+            self._run_sync(self._derive_statistical_insights, ctx),
+            self._run_sync(self._derive_pattern_insights, ctx),
+            self._run_sync(self._derive_trend_insights, ctx),
+            self._run_sync(self._derive_cross_analysis_insights, ctx)
+        )
+        return list(chain.from_iterable(derived))
             
     # Helper methods (implement based on specific needs)
     def _validate_data(self, data: Any) -> Any:
@@ -264,81 +341,299 @@ class AnalystAgent(BaseAgent):
         return data  # Implementation needed
         
     def _clean_data(self, data: Any) -> Any:
-        """Clean and preprocess data."""
-        return data  # Implementation needed
+        """
+        Clean and preprocess data.
+        
+        When polars is available, tabular input (column mappings, lists of
+        records, polars frames) becomes a lazy query that keeps the numeric
+        columns as float32 and drops incomplete rows. Execution is deferred
+        to _structure_data so conversion, casting and filtering run as one
+        fused pass.
+        """
+        if not _HAS_POLARS or not isinstance(data, (dict, list, pl.DataFrame)):
+            return data
+        if isinstance(data, list) and not all(isinstance(record, dict) for record in data):
+            return data
+        try:
+            frame = data if isinstance(data, pl.DataFrame) else pl.DataFrame(data)
+        except (TypeError, ValueError, pl.exceptions.PolarsError):
+            return data
+        return (
+            frame.lazy()
+            .select(cs.numeric().cast(pl.Float32))
+            .drop_nulls()
+            .filter(pl.all_horizontal(pl.all().is_not_nan()))
+        )
         
     def _structure_data(self, data: Any) -> Dict[str, Any]:
-        """Structure data for analysis."""
-        return {"data": data}  # Implementation needed
+        """
+        Structure data for analysis.
+        
+        Numeric fields are stacked into a single float32 matrix (rows are
+        observations, columns are variables) stored column-contiguous, with
+        the column labels kept alongside.
+        """
+        if _HAS_POLARS and isinstance(data, pl.LazyFrame):
+            frame = data.collect()
+            if frame.width == 0:
+                matrix = np.empty((0, 0), dtype=np.float32)
+            else:
+                matrix = frame.to_numpy(order="fortran")
+            return {
+                "data": frame,
+                "matrix": matrix,
+                "columns": frame.columns
+            }
+            
+        columns, series = self._extract_numeric_columns(data)
+        if series:
+            matrix = np.array(series, dtype=np.float32).T
+        else:
+            matrix = np.empty((0, 0), dtype=np.float32)
+        return {"data": data, "matrix": matrix, "columns": columns}
+        
+    def _extract_numeric_columns(self, data: Any) -> Tuple[List[str], List[np.ndarray]]:
+        """Extract equally sized numeric columns from mappings, records or arrays."""
+        if isinstance(data, dict):
+            candidates = list(data.items())
+        elif isinstance(data, (list, tuple)) and data and all(isinstance(r, dict) for r in data):
+            keys = [k for k in data[0] if all(k in record for record in data[1:])]
+            candidates = [(k, [record[k] for record in data]) for k in keys]
+        else:
+            try:
+                array = np.asarray(data, dtype=np.float32)
+            except (TypeError, ValueError):
+                return [], []
+            if array.ndim == 1 and array.size:
+                return ["value"], [array]
+            if array.ndim == 2 and array.size:
+                return [f"col_{i}" for i in range(array.shape[1])], list(array.T)
+            return [], []
+            
+        columns: List[str] = []
+        series: List[np.ndarray] = []
+        for name, values in candidates:
+            try:
+                column = np.asarray(values, dtype=np.float32)
+            except (TypeError, ValueError):
+                continue
+            if column.ndim != 1 or not column.size:
+                continue
+            if series and column.shape != series[0].shape:
+                continue
+            columns.append(str(name))
+            series.append(column)
+        return columns, series
         
     def _calculate_basic_statistics(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate basic statistical measures."""
-        return {"stats": "Implementation needed"}
+        count, mean, variance, minimum, maximum = basic_stats(data["matrix"])
+        return {
+            "columns": data["columns"],
+            "count": count,
+            "mean": mean,
+            "variance": variance,
+            "std": np.sqrt(variance),
+            "min": minimum,
+            "max": maximum
+        }
         
     def _calculate_advanced_statistics(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate advanced statistical measures."""
-        return {"advanced_stats": "Implementation needed"}
+        skewness, kurtosis = shape_stats(data["matrix"])
+        return {
+            "columns": data["columns"],
+            "skewness": skewness,
+            "kurtosis": kurtosis
+        }
         
     def _analyze_correlations(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze correlations in the data."""
-        return {"correlations": "Implementation needed"}
+        """
+        Analyze correlations in the data.
+        
+        Computes the full Pearson correlation matrix with one centered GEMM
+        over the structured matrix instead of looping over column pairs.
+        Correlations that are undefined (fewer than two rows, or a constant
+        column) are NaN.
+        """
+        matrix = data["matrix"]
+        n_rows, n_cols = matrix.shape
+        if n_rows < 2:
+            return {"columns": data["columns"], "matrix": np.full((n_cols, n_cols), np.nan, dtype=np.float32)}
+            
+        # Work on a centered copy; the structured matrix is shared with other analyses.
+        # Column reductions accumulate in float64, the product itself stays float32.
+        centered = matrix - matrix.mean(axis=0, dtype=np.float64).astype(np.float32)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            centered /= centered.std(axis=0, dtype=np.float64).astype(np.float32)
+            correlations = (centered.T @ centered) / n_rows
+        np.clip(correlations, -1.0, 1.0, out=correlations)
+        
+        return {"columns": data["columns"], "matrix": correlations}
         
-    def _find_temporal_patterns(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _find_patterns(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the fused pattern kernel once and convert each detector's output."""
+        columns = data["columns"]
+        temporal, structural, behavioral = find_all_patterns(data["matrix"])
+        n_rows = data["matrix"].shape[0]
+        return [
+            *self._find_temporal_patterns(columns, temporal),
+            *self._find_structural_patterns(columns, structural, n_rows),
+            *self._find_behavioral_patterns(columns, behavioral, n_rows)
+        ]
+        
+    def _find_temporal_patterns(self, columns: List[str], direction: np.ndarray) -> List[Dict[str, Any]]:
         """Find patterns over time."""
-        return [{"pattern": "Implementation needed"}]
+        return [
+            {
+                "type": "temporal",
+                "column": column,
+                "pattern": "increasing" if score > 0.5 else "decreasing" if score < -0.5 else "stable",
+                "direction_score": float(score)
+            }
+            for column, score in zip(columns, direction)
+        ]
         
-    def _find_structural_patterns(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _find_structural_patterns(
+        self,
+        columns: List[str],
+        turning_points: np.ndarray,
+        n_rows: int
+    ) -> List[Dict[str, Any]]:
         """Find structural patterns."""
-        return [{"pattern": "Implementation needed"}]
+        # A series can turn at most once per interior point
+        interior = max(n_rows - 2, 1)
+        return [
+            {
+                "type": "structural",
+                "column": column,
+                "pattern": "oscillating" if turns / interior > 0.5 else "smooth",
+                "turning_points": int(turns)
+            }
+            for column, turns in zip(columns, turning_points)
+        ]
         
-    def _find_behavioral_patterns(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _find_behavioral_patterns(
+        self,
+        columns: List[str],
+        longest_runs: np.ndarray,
+        n_rows: int
+    ) -> List[Dict[str, Any]]:
         """Find behavioral patterns."""
-        return [{"pattern": "Implementation needed"}]
+        return [
+            {
+                "type": "behavioral",
+                "column": column,
+                "pattern": "persistent" if run >= max(3, n_rows // 2) else "erratic",
+                "longest_run": int(run)
+            }
+            for column, run in zip(columns, longest_runs)
+        ]
         
-    def _identify_trends(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Identify trends in the data."""
-        return [{"trend": "Implementation needed"}]
+    def _identify_trends(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Identify trends in the data.
         
-    def _classify_trends(self, trends: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        Fits a least-squares line against the observation index for every
+        column at once; strength is the Pearson correlation with that index.
+        """
+        matrix = data["matrix"]
+        n_rows, n_cols = matrix.shape
+        if n_rows < 2:
+            empty = np.zeros(n_cols)
+            return {"columns": data["columns"], "slopes": empty, "intercepts": empty, "strength": empty}
+            
+        t = np.arange(n_rows, dtype=np.float64)
+        t -= t.mean()
+        t_ss = t @ t
+        means = matrix.mean(axis=0, dtype=np.float64)
+        slopes = (t @ matrix) / t_ss
+        with np.errstate(divide="ignore", invalid="ignore"):
+            strength = slopes * np.sqrt(t_ss / n_rows) / matrix.std(axis=0, dtype=np.float64)
+        return {
+            "columns": data["columns"],
+            "slopes": slopes,
+            "intercepts": means - slopes * (n_rows - 1) / 2,
+            "strength": np.nan_to_num(strength),
+            "n_observations": n_rows
+        }
+        
+    def _classify_trends(self, trends: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
         """Classify identified trends."""
-        return {"classifications": []}  # Implementation needed
+        classifications = []
+        for column, slope, strength in zip(trends["columns"], trends["slopes"], trends["strength"]):
+            magnitude = abs(strength)
+            classifications.append({
+                "column": column,
+                "direction": "upward" if slope > 0 else "downward" if slope < 0 else "flat",
+                "strength": "strong" if magnitude >= 0.7 else "moderate" if magnitude >= 0.3 else "weak"
+            })
+        return {"classifications": classifications}
         
-    def _project_trends(self, trends: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    def _project_trends(self, trends: Dict[str, Any]) -> Dict[str, Any]:
         """Project future trend trajectories."""
-        return {"projections": "Implementation needed"}
+        n_rows = trends.get("n_observations", 0)
+        steps = np.arange(n_rows, n_rows + self.PROJECTION_HORIZON, dtype=np.float64)
+        return {
+            "columns": trends["columns"],
+            "horizon": self.PROJECTION_HORIZON,
+            "projections": trends["intercepts"] + np.outer(steps, trends["slopes"])
+        }
         
-    def _derive_statistical_insights(self, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _derive_statistical_insights(self, ctx: InsightContext) -> List[Dict[str, Any]]:
         """Derive insights from statistical analysis."""
-        return [{"insight": "Implementation needed"}]
+        skewness = ctx.stats_matrix[InsightContext.STATS_ROWS.index("skewness")]
+        return [
+            {"type": "statistical", "column": ctx.columns[i], "insight": "Distribution is strongly skewed",
+             "skewness": float(skewness[i])}
+            for i in np.flatnonzero(np.abs(skewness) > 1.0)
+        ]
         
-    def _derive_pattern_insights(self, patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _derive_pattern_insights(self, ctx: InsightContext) -> List[Dict[str, Any]]:
         """Derive insights from pattern analysis."""
-        return [{"insight": "Implementation needed"}]
+        oscillating = np.flatnonzero(ctx.pattern_ids[_PATTERN_ROWS["structural"]] == 1)
+        return [
+            {"type": "pattern", "column": ctx.columns[i], "insight": "Series oscillates frequently"}
+            for i in oscillating
+        ]
         
-    def _derive_trend_insights(self, trends: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _derive_trend_insights(self, ctx: InsightContext) -> List[Dict[str, Any]]:
         """Derive insights from trend analysis."""
-        return [{"insight": "Implementation needed"}]
+        if not ctx.columns:
+            return []
+        strongest = int(np.argmax(np.abs(ctx.trend_strength)))
+        if ctx.trend_strength[strongest] == 0:
+            return []
+        return [{
+            "type": "trend",
+            "column": ctx.columns[strongest],
+            "insight": "Strongest linear trend",
+            "slope": float(ctx.trend_slopes[strongest]),
+            "strength": float(ctx.trend_strength[strongest])
+        }]
         
-    def _derive_cross_analysis_insights(
-        self,
-        statistical_analysis: Dict[str, Any],
-        pattern_analysis: List[Dict[str, Any]],
-        trend_analysis: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    def _derive_cross_analysis_insights(self, ctx: InsightContext) -> List[Dict[str, Any]]:
         """Derive insights from cross-analysis."""
-        return [{"insight": "Implementation needed"}]
+        n_cols = len(ctx.columns)
+        if n_cols < 2:
+            return []
+        # Pairs that are both strongly correlated and trending the same way
+        signs = np.sign(ctx.trend_slopes)
+        co_moving = (np.abs(ctx.correlations) > 0.8) & (np.outer(signs, signs) > 0)
+        rows, cols = np.nonzero(np.triu(co_moving, k=1))
+        return [
+            {"type": "cross_analysis", "columns": [ctx.columns[i], ctx.columns[j]],
+             "insight": "Variables move together", "correlation": float(ctx.correlations[i, j])}
+            for i, j in zip(rows, cols)
+        ]
         
     async def _create_recommendations(self, insights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Create actionable recommendations based on insights."""
         return [{"recommendation": "Implementation needed"}]
         
-    def _document_methodology(self) -> Dict[str, Any]:
+    def _document_methodology(self) -> Mapping[str, Any]:
         """Document the analysis methodology used."""
-        return {
-            "methods": ["statistical_analysis", "pattern_recognition", "trend_analysis"],
-            "tools": ["numpy", "custom_analytics"],
-            "validation_approach": "cross_validation"
-        }
+        return self._METHODOLOGY
         
     def _summarize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a summary of the analyzed data."""
@@ -346,15 +641,35 @@ class AnalystAgent(BaseAgent):
         
     async def _validate_external_analysis(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Validate analysis from other agents."""
-        return analysis  # Implementation needed
+        # Checked in place; the partner's result is passed on without copying
+        if not isinstance(analysis, Mapping):
+            raise TypeError(f"Expected a mapping from collaborator, got {type(analysis).__name__}")
+        return analysis
         
     async def _combine_analyses(
         self,
-        internal_analysis: Optional[Dict[str, Any]],
-        external_analysis: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Combine multiple analyses."""
-        return {"combined": "Implementation needed"}
+        internal_analysis: Optional[Mapping[str, Any]],
+        external_analysis: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        """
+        Combine multiple analyses.
+        
+        Returns a read-only view of both analyses in which the collaborator's
+        keys take precedence over our own, so neither analysis is copied.
+        The view is read-only because a bare ChainMap writes into its first
+        map, which is the collaborator's (possibly cached) result. Use
+        _merge_analyses when an independent, writable dict is required.
+        """
+        return MappingProxyType(ChainMap(external_analysis, internal_analysis or {}))
+        
+    @staticmethod
+    def _merge_analyses(*analyses: Mapping[str, Any]) -> Dict[str, Any]:
+        """Merge analyses into a new dict; later analyses win on key collisions."""
+        # Pre-size with every key so the dict never resizes while being filled
+        merged = dict.fromkeys(chain.from_iterable(analyses))
+        for analysis in analyses:
+            merged.update(analysis)
+        return merged
         
     async def _generate_collaborative_insights(
         self,
@@ -3,46 +3,141 @@ Base Agent Class
 Defines the core functionality and interface that all agents must implement.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
-from pydantic import BaseModel
+import asyncio
+import copy
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, asdict
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Callable, ClassVar, Mapping, Protocol, Sequence, Tuple
+from weakref import WeakKeyDictionary
 
-class AgentPersonality(BaseModel):
-    """Defines the personality traits of an agent."""
+import numpy as np
+from decouple import config
+
+from .serialization import dumps
+
+# Shared pool for synchronous, CPU-bound helpers so they don't block the event loop
+_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="agent-worker")
+
+# Caps LLM-backed agent calls in flight across all agents (same setting as SystemConfig.max_concurrent_tasks).
+# Waiters are admitted in arrival order, so no collaboration starves.
+LLM_CONCURRENCY = config('MAX_CONCURRENT_TASKS', default=3, cast=int)
+
+# A semaphore binds to the first loop that waits on it, so each event loop gets its own,
+# dropped together with the loop
+_LLM_SEMAPHORES: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
+
+def llm_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore that caps LLM-backed calls on the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(LLM_CONCURRENCY)
+    return semaphore
+
+@dataclass(slots=True, frozen=True)
+class AgentPersonality:
+    """Defines the personality traits of an agent. Immutable, so one instance can be shared by every agent of a kind."""
+    # Fixed trait order shared by every personality's trait_vec
+    TRAIT_NAMES: ClassVar[Tuple[str, ...]] = (
+        "analytical", "creative", "critical", "strategic", "systematic",
+        "methodical", "detail_oriented", "thorough", "objective", "skeptical",
+        "risk_aware", "constructive", "curious", "intuitive", "open_minded",
+        "divergent_thinking", "experimental", "adaptable", "holistic", "integrative",
+        "pattern_recognition", "practical", "efficient", "organized", "leadership"
+    )
+    
     name: str
-    traits: Dict[str, float]  # e.g., {'analytical': 0.8, 'creative': 0.4}
-    expertise: List[str]
+    # Taken as any mapping and sequence, stored as a read-only mapping and a tuple
+    traits: Mapping[str, float]  # e.g., {'analytical': 0.8, 'creative': 0.4}
+    expertise: Sequence[str]
     description: str
+    trait_vec: np.ndarray = field(init=False, repr=False, compare=False)
+    # Lowercased, interned name that workflow nodes match agents by
+    normalized_name: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Copied, so the caller's dict and list can't change a shared personality
+        object.__setattr__(self, "traits", MappingProxyType(dict(self.traits)))
+        object.__setattr__(self, "expertise", tuple(self.expertise))
+        trait_vec = np.fromiter(
+            (self.traits.get(name, 0.0) for name in self.TRAIT_NAMES),
+            dtype=np.float32,
+            count=len(self.TRAIT_NAMES)
+        )
+        trait_vec.flags.writeable = False
+        object.__setattr__(self, "trait_vec", trait_vec)
+        object.__setattr__(self, "normalized_name", sys.intern(self.name.lower()))
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the personality's public fields as a plain dict."""
+        return {
+            "name": self.name,
+            "traits": dict(self.traits),
+            "expertise": list(self.expertise),
+            "description": self.description
+        }
+        
+    def affinity(self, other: 'AgentPersonality') -> float:
+        """Score how strongly two personalities share traits (dot product of trait vectors)."""
+        return float(self.trait_vec @ other.trait_vec)
 
-class AgentState(BaseModel):
+@dataclass(slots=True)
+class AgentState:
     """Represents the current state of an agent."""
     current_task: Optional[str] = None
-    memory: Dict[str, Any] = {}
+    memory: Dict[str, Any] = field(default_factory=dict)
     confidence: float = 1.0
-    context: Dict[str, Any] = {}
+    context: Dict[str, Any] = field(default_factory=dict)
+
+_STATE_FIELDS = frozenset(f.name for f in fields(AgentState))
 
-class BaseAgent(ABC):
-    """Abstract base class for all agents in the think tank."""
+class AgentProtocol(Protocol):
+    """Static interface every think-tank agent satisfies."""
+    
+    personality: AgentPersonality
+    
+    async def process(self, input_data: Any) -> Dict[str, Any]: ...
+    
+    async def collaborate(self, other_agent: 'AgentProtocol', context: Dict[str, Any]) -> Dict[str, Any]: ...
+
+class BaseAgent:
+    """Base class for all agents in the think tank; subclasses implement process and collaborate."""
+    
+    # Bounds for the memoized process() results used during collaboration
+    PROCESS_CACHE_SIZE = 64
+    PROCESS_CACHE_MIN_BYTES = 256
+    # Agents whose process() has side effects (stored plans, random draws) must run every call
+    PROCESS_CACHEABLE: ClassVar[bool] = True
     
     def __init__(self, personality: AgentPersonality):
         self.personality = personality
         self.state = AgentState()
         self.knowledge_base = None
+        self._process_cache: "OrderedDict[str, asyncio.Task]" = OrderedDict()
+        # Serializes this agent's state-mutating sections; other agents keep running in parallel
+        self._lock = asyncio.Lock()
         
-    @abstractmethod
     async def process(self, input_data: Any) -> Dict[str, Any]:
         """
         Process input data according to the agent's specialty.
         
+        Every result carries a "timestamp" key holding the local datetime at
+        which it was produced, and timestamps in collaborate() results use the
+        same representation; serialize() renders them as ISO-8601 strings.
+        
         Args:
             input_data: The data to be processed
             
         Returns:
             Dict containing the processing results
         """
-        pass
+        raise NotImplementedError
         
-    @abstractmethod
     async def collaborate(self, other_agent: 'BaseAgent', context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Collaborate with another agent on a task.
@@ -54,13 +149,106 @@ class BaseAgent(ABC):
         Returns:
             Dict containing the collaboration results
         """
-        pass
+        raise NotImplementedError
+        
+    async def process_cached(self, input_data: Any) -> Dict[str, Any]:
+        """
+        Process input data, reusing the result of an identical earlier call.
+        
+        Results are kept in a small LRU keyed by a digest of the input.
+        Inputs whose serialized form is below PROCESS_CACHE_MIN_BYTES are
+        processed directly, since they are cheap and rarely repeated, and
+        so is everything for agents that set PROCESS_CACHEABLE to False.
+        Every caller gets its own deep copy of the result, so one caller's
+        changes never reach another. Agents call invalidate_process_cache()
+        when state that process() reads changes.
+        
+        Args:
+            input_data: The data to be processed
+            
+        Returns:
+            Dict containing the processing results
+        """
+        if not self.PROCESS_CACHEABLE:
+            return await self.process(input_data)
+        try:
+            payload = dumps(input_data)
+        except (TypeError, ValueError):
+            return await self.process(input_data)
+        if len(payload) < self.PROCESS_CACHE_MIN_BYTES:
+            return await self.process(input_data)
+            
+        key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        task = self._process_cache.get(key)
+        if task is not None and (task.done() or task.get_loop() is asyncio.get_running_loop()):
+            self._process_cache.move_to_end(key)
+        else:
+            task = asyncio.ensure_future(self.process(input_data))
+            self._process_cache[key] = task
+            if len(self._process_cache) > self.PROCESS_CACHE_SIZE:
+                self._process_cache.popitem(last=False)
+                
+        try:
+            result = await asyncio.shield(task) if not task.done() else task.result()
+        except BaseException:
+            # Never keep failed or cancelled runs around
+            if self._process_cache.get(key) is task:
+                del self._process_cache[key]
+            raise
+        return copy.deepcopy(result)
+        
+    def invalidate_process_cache(self):
+        """Forget every memoized process() result, e.g. after state that process() reads changed."""
+        self._process_cache.clear()
+        
+    async def consult(self, other_agent: 'BaseAgent', context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get another agent's (cached) take on a context, waiting for a free LLM slot first.
+        
+        The partner runs on this event loop. A partner whose process() makes
+        blocking calls should move them onto the worker pool with _run_sync;
+        running it on a private event loop in another thread is not supported,
+        as agents hold asyncio locks and semaphores bound to the loop that
+        first used them.
+        
+        Args:
+            other_agent: The agent to consult
+            context: Shared context for the collaboration
+            
+        Returns:
+            The other agent's processing results
+        """
+        async with llm_semaphore():
+            return await other_agent.process_cached(context)
+            
+    def serialize(self, result: Dict[str, Any]) -> bytes:
+        """
+        Encode a result from process() or collaborate() as JSON bytes.
+        
+        datetime values, numpy arrays and read-only mappings are encoded
+        directly, so results can keep rich values until they are published.
+        """
+        return dumps(result)
+        
+    def _run_sync(self, fn: Callable[..., Any], *args: Any) -> "asyncio.Future[Any]":
+        """
+        Run a synchronous helper on the shared worker pool.
+        
+        Args:
+            fn: The synchronous callable to run
+            *args: Positional arguments passed to fn
+            
+        Returns:
+            Awaitable resolving to fn's return value
+        """
+        return asyncio.get_running_loop().run_in_executor(_EXECUTOR, fn, *args)
         
-    async def update_state(self, new_state: Dict[str, Any]):
+    def update_state(self, new_state: Dict[str, Any]):
         """Update the agent's current state."""
+        state = self.state
         for key, value in new_state.items():
-            if hasattr(self.state, key):
-                setattr(self.state, key, value)
+            if key in _STATE_FIELDS:
+                object.__setattr__(state, key, value)
                 
     async def access_knowledge_base(self, query: str) -> Any:
         """
@@ -85,7 +273,7 @@ class BaseAgent(ABC):
         """
         # TODO: Implement reflection logic
         return {
-            "state": self.state.dict(),
+            "state": asdict(self.state),
             "confidence": self.state.confidence,
             "current_focus": self.state.current_task
         }
@@ -3,14 +3,62 @@ Challenger Agent
 Specializes in critical evaluation, identifying potential flaws, and playing devil's advocate.
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Set, Tuple
 from .base_agent import BaseAgent, AgentPersonality
+from .serialization import lru_cache_by_key
 import asyncio
+import sys
+import time
 from datetime import datetime
+from itertools import chain
+from types import MappingProxyType
+
+import numpy as np
+
+from ._scoring_kernels import combined_confidence, impact_score, weighted_score
+
+# Read-only and shared by every ChallengerAgent
+_EVALUATION_FRAMEWORKS = MappingProxyType({
+    "logical": MappingProxyType({
+        "fallacies": ("circular_reasoning", "false_dichotomy", "ad_hominem"),
+        "validity_tests": ("consistency", "completeness", "soundness")
+    }),
+    "practical": MappingProxyType({
+        "feasibility": ("resource_constraints", "technical_limitations", "time_constraints"),
+        "scalability": ("load_handling", "growth_adaptation", "resource_scaling")
+    }),
+    "strategic": MappingProxyType({
+        "alignment": ("goal_alignment", "stakeholder_interests", "long_term_viability"),
+        "competition": ("market_forces", "competitive_advantage", "entry_barriers")
+    })
+})
+
+# Assumption detection depends only on the input, so results are shared across
+# agents and calls; callers get copies since the cached tuples are shared
+@lru_cache_by_key(maxsize=2048)
+def _identify_explicit_assumptions_impl(input_data: Any) -> Tuple[Dict[str, Any], ...]:
+    """Identify explicit assumptions in the input."""
+    return ({"assumption": "Implementation needed"},)
+
+@lru_cache_by_key(maxsize=2048)
+def _identify_implicit_assumptions_impl(input_data: Any) -> Tuple[Dict[str, Any], ...]:
+    """Identify implicit assumptions in the input."""
+    return ({"assumption": "Implementation needed"},)
 
 class Challenge:
     """Represents a specific challenge or critique."""
-    def __init__(self, target: str, challenge_type: str, description: str):
+    __slots__ = (
+        "target", "challenge_type", "description", "evidence", "severity",
+        "impact_areas", "proposed_solutions", "timestamp", "status"
+    )
+    
+    def __init__(
+        self,
+        target: str,
+        challenge_type: str,
+        description: str,
+        timestamp: Optional[datetime] = None
+    ):
         self.target = target
         self.challenge_type = challenge_type
         self.description = description
@@ -18,52 +66,213 @@ class Challenge:
         self.severity = 0.0
         self.impact_areas: List[str] = []
         self.proposed_solutions: List[Dict[str, Any]] = []
-        self.timestamp = datetime.now()
+        self.timestamp = timestamp or datetime.now()
         self.status = "open"
+        
+    @classmethod
+    def from_tuple(cls, record: "ChallengeRecord") -> "Challenge":
+        """Materialize a Challenge from a (target, type, description, ts_ns) history record."""
+        target, challenge_type, description, ts_ns = record
+        seconds, remainder = divmod(ts_ns, 1_000_000_000)
+        timestamp = datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000)
+        return cls(target, challenge_type, description, timestamp=timestamp)
+
+# Lightweight history entry: (target, challenge_type, description, timestamp in ns)
+ChallengeRecord = Tuple[str, str, str, int]
+
+# Identical for every instance, so built once and shared
+_CHALLENGER_PERSONALITY = AgentPersonality(
+    name="Challenger",
+    traits={
+        "critical": 0.95,
+        "analytical": 0.9,
+        "objective": 0.88,
+        "skeptical": 0.85,
+        "constructive": 0.8,
+        "thorough": 0.87
+    },
+    expertise=[
+        "critical analysis",
+        "assumption testing",
+        "risk assessment",
+        "logical evaluation",
+        "argument analysis",
+        "problem identification"
+    ],
+    description="Critical evaluator focused on identifying and addressing potential flaws"
+)
 
+class ChallengeStore:
+    """
+    Columnar (struct-of-arrays) history of challenges.
+    
+    Severity, confidence, type and timestamp live in parallel NumPy arrays so
+    that aggregates over the whole history are single vector operations;
+    targets and descriptions are kept in plain lists alongside. Storage grows
+    geometrically up to max_size and then works as a ring buffer: each new
+    row overwrites the oldest one in place, so no rows are ever shifted.
+    
+    Scores are fractions in [0, 1] and are stored as float32. With
+    quantized=True they are stored as int8 (round(x * 127)) instead, a
+    quarter of the memory at a resolution of about 0.008.
+    """
+    __slots__ = (
+        "severity", "confidence", "type_id", "timestamp_ns", "targets", "descriptions",
+        "type_names", "_type_ids", "n", "_head", "max_size", "quantized"
+    )
+    
+    # Scale applied to scores when storing them as int8
+    QUANT_SCALE = 127
+    
+    def __init__(self, max_size: int, initial_capacity: int = 64, quantized: bool = False):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        capacity = min(initial_capacity, max_size)
+        score_dtype = np.int8 if quantized else np.float32
+        self.severity = np.empty(capacity, dtype=score_dtype)
+        self.confidence = np.empty(capacity, dtype=score_dtype)
+        self.type_id = np.empty(capacity, dtype=np.int16)
+        self.timestamp_ns = np.empty(capacity, dtype=np.int64)
+        # Indexed by row position like the arrays; unused positions hold None
+        self.targets: List[Optional[str]] = [None] * capacity
+        self.descriptions: List[Optional[str]] = [None] * capacity
+        self.type_names: List[str] = []
+        self._type_ids: Dict[str, int] = {}
+        self.n = 0
+        # Position of the oldest row; only moves once the ring is full
+        self._head = 0
+        self.max_size = max_size
+        self.quantized = quantized
+        
+    def __len__(self) -> int:
+        return self.n
+        
+    def _columns(self) -> Tuple[np.ndarray, ...]:
+        """Every per-row NumPy column, in a fixed order."""
+        return (self.severity, self.confidence, self.type_id, self.timestamp_ns)
+        
+    def _type_id(self, challenge_type: str) -> int:
+        """Map a challenge type name to its small integer id."""
+        type_id = self._type_ids.get(challenge_type)
+        if type_id is None:
+            type_id = self._type_ids[challenge_type] = len(self.type_names)
+            self.type_names.append(challenge_type)
+        return type_id
+        
+    def _reserve(self, count: int):
+        """Grow storage towards max_size so count more rows fit without overwriting, where possible."""
+        capacity = self.severity.shape[0]
+        needed = self.n + count
+        if needed > capacity and capacity < self.max_size:
+            # The ring only wraps at max_size, so rows still start at position 0 here
+            grown = min(max(needed, capacity * 2), self.max_size)
+            self.severity, self.confidence, self.type_id, self.timestamp_ns = (
+                np.resize(column, grown) for column in self._columns()
+            )
+            padding = [None] * (grown - capacity)
+            self.targets.extend(padding)
+            self.descriptions.extend(padding)
+            
+    def _positions(self, start: int, count: int) -> np.ndarray:
+        """Row positions of logical rows start .. start + count - 1, oldest row being 0."""
+        return (self._head + start + np.arange(count)) % self.severity.shape[0]
+            
+    def _quant(self, scores: List[float]) -> np.ndarray:
+        """Convert scores to the storage dtype."""
+        values = np.clip(np.asarray(scores, dtype=np.float32), 0.0, 1.0)
+        if self.quantized:
+            return np.rint(values * self.QUANT_SCALE).astype(np.int8)
+        return values
+        
+    def dequant(self, column: np.ndarray) -> np.ndarray:
+        """Convert a stored score column back to float32 values in [0, 1]."""
+        if self.quantized:
+            return column.astype(np.float32) / self.QUANT_SCALE
+        return column
+        
+    def extend(self, challenges: List[Dict[str, Any]], target: str, timestamp_ns: int):
+        """Append a batch of challenge dicts about one target, recorded at the same time."""
+        batch = challenges[-self.max_size:]
+        count = len(batch)
+        if not count:
+            return
+        self._reserve(count)
+        capacity = self.severity.shape[0]
+        positions = self._positions(self.n, count)
+        self.severity[positions] = self._quant([challenge["severity"] for challenge in batch])
+        self.confidence[positions] = self._quant([challenge.get("confidence", 0.0) for challenge in batch])
+        self.type_id[positions] = [self._type_id(challenge["type"]) for challenge in batch]
+        self.timestamp_ns[positions] = timestamp_ns
+        for position, challenge in zip(positions.tolist(), batch):
+            self.targets[position] = target
+            self.descriptions[position] = challenge["description"]
+        overwritten = max(self.n + count - capacity, 0)
+        self.n = min(self.n + count, capacity)
+        self._head = (self._head + overwritten) % capacity
+        
+    def _ordered(self, column: np.ndarray) -> np.ndarray:
+        """The stored rows of a column, oldest first (a view until the ring wraps)."""
+        if self._head == 0:
+            return column[:self.n]
+        return np.concatenate((column[self._head:self.n], column[:self._head]))
+        
+    def records(self) -> List[ChallengeRecord]:
+        """Return every stored challenge as a (target, type, description, ts_ns) record, oldest first."""
+        positions = self._positions(0, self.n)
+        type_ids = self.type_id[positions].tolist()
+        timestamps = self.timestamp_ns[positions].tolist()
+        return [
+            (self.targets[position], self.type_names[type_id], self.descriptions[position], ts_ns)
+            for position, type_id, ts_ns in zip(positions.tolist(), type_ids, timestamps)
+        ]
+        
+    def _scores(self, column: np.ndarray) -> np.ndarray:
+        """Read-only float32 scores for the stored rows of a score column, oldest first."""
+        view = self.dequant(self._ordered(column))
+        view.flags.writeable = False
+        return view
+        
+    def severities(self) -> np.ndarray:
+        """Read-only float32 view of every stored severity."""
+        return self._scores(self.severity)
+        
+    def confidences(self) -> np.ndarray:
+        """Read-only float32 view of every stored confidence."""
+        return self._scores(self.confidence)
+        
 class ChallengerAgent(BaseAgent):
     """
     The Challenger agent focuses on critical evaluation and identifying potential flaws.
     It excels at testing assumptions and strengthening ideas through constructive criticism.
     """
     
+    # Maximum number of past challenges kept in challenge_store
+    HISTORY_MAX = 10_000
+    
+    # Severity above which a challenge counts as high severity
+    HIGH_SEVERITY = 0.8
+    
+    # Each evaluation is recorded and shifts later severity assessments, so none is reused
+    PROCESS_CACHEABLE = False
+    
+    # Issue risk factors and their weight in _calculate_severity
+    SEVERITY_WEIGHTS = MappingProxyType({"likelihood": 0.4, "impact": 0.4, "scope": 0.2})
+    _SEVERITY_WEIGHT_VECTOR = np.array(tuple(SEVERITY_WEIGHTS.values()), dtype=np.float32)
+    
+    evaluation_frameworks: Mapping[str, Mapping[str, Tuple[str, ...]]] = _EVALUATION_FRAMEWORKS
+    
     def __init__(self):
-        personality = AgentPersonality(
-            name="Challenger",
-            traits={
-                "critical": 0.95,
-                "analytical": 0.9,
-                "objective": 0.88,
-                "skeptical": 0.85,
-                "constructive": 0.8,
-                "thorough": 0.87
-            },
-            expertise=[
-                "critical analysis",
-                "assumption testing",
-                "risk assessment",
-                "logical evaluation",
-                "argument analysis",
-                "problem identification"
-            ],
-            description="Critical evaluator focused on identifying and addressing potential flaws"
-        )
-        super().__init__(personality)
-        self.challenge_history: List[Challenge] = []
-        self.evaluation_frameworks: Dict[str, Dict[str, Any]] = {
-            "logical": {
-                "fallacies": ["circular_reasoning", "false_dichotomy", "ad_hominem"],
-                "validity_tests": ["consistency", "completeness", "soundness"]
-            },
-            "practical": {
-                "feasibility": ["resource_constraints", "technical_limitations", "time_constraints"],
-                "scalability": ["load_handling", "growth_adaptation", "resource_scaling"]
-            },
-            "strategic": {
-                "alignment": ["goal_alignment", "stakeholder_interests", "long_term_viability"],
-                "competition": ["market_forces", "competitive_advantage", "entry_barriers"]
-            }
-        }
+        super().__init__(_CHALLENGER_PERSONALITY)
+        # The single record of past challenges; see history_snapshot() and iter_challenges()
+        self.challenge_store = ChallengeStore(self.HISTORY_MAX)
+        
+    def history_snapshot(self) -> List[ChallengeRecord]:
+        """Return a point-in-time list of challenge records, e.g. for serialization."""
+        return self.challenge_store.records()
+        
+    def iter_challenges(self) -> Iterator[Challenge]:
+        """Lazily materialize Challenge objects from the challenge history."""
+        return map(Challenge.from_tuple, self.history_snapshot())
         
     async def process(self, input_data: Any) -> Dict[str, Any]:
         """
@@ -75,7 +284,9 @@ class ChallengerAgent(BaseAgent):
         Returns:
             Dict containing challenges and critical analysis
         """
-        await self.update_state({"current_task": "critical_evaluation"})
+        self.update_state({"current_task": "critical_evaluation"})
+        # One timestamp for the result of this call
+        now = datetime.now()
         
         try:
             # Analyze assumptions
@@ -102,7 +313,7 @@ class ChallengerAgent(BaseAgent):
             )
             
             result = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now,
                 "assumptions": assumptions,
                 "issues": issues,
                 "challenges": challenges,
@@ -112,19 +323,15 @@ class ChallengerAgent(BaseAgent):
                 "confidence_score": self.state.confidence
             }
             
-            # Store challenges
-            for challenge in challenges:
-                self.challenge_history.append(Challenge(
-                    str(input_data),
-                    challenge["type"],
-                    challenge["description"]
-                ))
+            # Store challenges as rows sharing one interned target string
+            target = sys.intern(str(input_data))
+            self.challenge_store.extend(challenges, target, time.time_ns())
                 
             return result
             
-        except Exception as e:
+        except Exception:
             self.state.confidence *= 0.8
-            raise Exception(f"Critical evaluation failed: {str(e)}")
+            raise
             
     async def collaborate(self, other_agent: 'BaseAgent', context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -137,13 +344,13 @@ class ChallengerAgent(BaseAgent):
         Returns:
             Dict containing collaborative evaluation results
         """
-        await self.update_state({
+        self.update_state({
             "current_task": f"collaborative_evaluation_with_{other_agent.personality.name}"
         })
         
         try:
             # Get other agent's perspective
-            other_perspective = await other_agent.process(context)
+            other_perspective = await self.consult(other_agent, context)
             
             # Challenge other agent's assumptions
             challenged_assumptions = await self._challenge_assumptions(
@@ -169,30 +376,28 @@ class ChallengerAgent(BaseAgent):
                 "collaborative_critique": collaborative_critique,
                 "collaboration_metadata": {
                     "partner": other_agent.personality.name,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": datetime.now()
                 }
             }
             
-        except Exception as e:
+        except Exception:
             self.state.confidence *= 0.9
-            raise Exception(f"Collaborative evaluation failed: {str(e)}")
+            raise
             
     async def _analyze_assumptions(self, input_data: Any) -> List[Dict[str, Any]]:
         """Analyze underlying assumptions in the input."""
-        try:
-            # Identify explicit assumptions
-            explicit = self._identify_explicit_assumptions(input_data)
-            
-            # Identify implicit assumptions
-            implicit = self._identify_implicit_assumptions(input_data)
-            
-            # Validate assumptions
-            validated = self._validate_assumptions(explicit + implicit)
-            
-            return validated
-            
-        except Exception as e:
-            raise Exception(f"Assumption analysis failed: {str(e)}")
+        # Explicit and implicit assumptions are identified independently
+        explicit, implicit = await asyncio.gather(
+            self._run_sync(self._identify_explicit_assumptions, input_data),
+            self._run_sync(self._identify_implicit_assumptions, input_data)
+        )
+        
+        # Validate while concatenating, in a single pass
+        return [
+            assumption
+            for assumption in chain(explicit, implicit)
+            if self._validate_assumption(assumption)
+        ]
             
     async def _identify_issues(
         self,
@@ -200,90 +405,64 @@ class ChallengerAgent(BaseAgent):
         assumptions: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Identify potential issues and weaknesses."""
-        issues = []
-        try:
-            # Logical issues
-            logical_issues = self._identify_logical_issues(input_data, assumptions)
-            issues.extend(logical_issues)
-            
-            # Practical issues
-            practical_issues = self._identify_practical_issues(input_data, assumptions)
-            issues.extend(practical_issues)
-            
-            # Strategic issues
-            strategic_issues = self._identify_strategic_issues(input_data, assumptions)
-            issues.extend(strategic_issues)
-            
-            return issues
-            
-        except Exception as e:
-            raise Exception(f"Issue identification failed: {str(e)}")
+        # Logical, practical and strategic issues are independent of each other
+        logical_issues, practical_issues, strategic_issues = await asyncio.gather(
+            self._run_sync(self._identify_logical_issues, input_data, assumptions),
+            self._run_sync(self._identify_practical_issues, input_data, assumptions),
+            self._run_sync(self._identify_strategic_issues, input_data, assumptions)
+        )
+        return list(chain(logical_issues, practical_issues, strategic_issues))
             
     async def _generate_challenges(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Generate specific challenges based on identified issues."""
-        challenges = []
-        try:
-            for issue in issues:
-                # Create challenge
-                challenge = self._create_challenge(issue)
-                
-                # Gather evidence
-                evidence = self._gather_challenge_evidence(issue)
-                
-                # Formulate critique
-                critique = self._formulate_critique(issue, evidence)
-                
-                challenges.append({
-                    "challenge": challenge,
-                    "evidence": evidence,
-                    "critique": critique,
-                    "severity": self._calculate_severity(issue),
-                    "confidence": self._calculate_confidence(evidence)
-                })
-                
-            return challenges
-            
-        except Exception as e:
-            raise Exception(f"Challenge generation failed: {str(e)}")
+        return [
+            {
+                "type": issue.get("type", "general"),
+                "description": issue.get("description", ""),
+                "challenge": self._create_challenge(issue),
+                "evidence": (evidence := self._gather_challenge_evidence(issue)),
+                "critique": self._formulate_critique(issue, evidence),
+                "severity": self._calculate_severity(issue),
+                "confidence": self._calculate_confidence(evidence)
+            }
+            for issue in issues
+        ]
             
     async def _evaluate_impact(self, challenges: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Evaluate the potential impact of identified challenges."""
-        try:
-            # Assess severity
-            severity_assessment = self._assess_severity(challenges)
-            
-            # Analyze implications
-            implications = self._analyze_implications(challenges)
-            
-            # Evaluate risks
-            risks = self._evaluate_risks(challenges)
-            
-            return {
-                "severity_assessment": severity_assessment,
-                "implications": implications,
-                "risks": risks,
-                "overall_impact_score": self._calculate_impact_score(
-                    severity_assessment,
-                    implications,
-                    risks
-                )
-            }
-            
-        except Exception as e:
-            raise Exception(f"Impact evaluation failed: {str(e)}")
+        # The store may grow meanwhile from another process() on this loop, so the worker
+        # thread gets a snapshot taken here rather than reading the live columns
+        history = self.challenge_store.severities().copy()
+        # Severity, implications and risks only read the challenges, so assess them concurrently
+        severity_assessment, implications, risks = await asyncio.gather(
+            self._run_sync(self._assess_severity, challenges, history),
+            self._run_sync(self._analyze_implications, challenges),
+            self._run_sync(self._evaluate_risks, challenges)
+        )
+        
+        return {
+            "severity_assessment": severity_assessment,
+            "implications": implications,
+            "risks": risks,
+            "overall_impact_score": self._calculate_impact_score(
+                challenges,
+                implications,
+                risks
+            )
+        }
             
     # Helper methods (implement based on specific needs)
     def _identify_explicit_assumptions(self, input_data: Any) -> List[Dict[str, Any]]:
         """Identify explicit assumptions in the input."""
-        return [{"assumption": "Implementation needed"}]
+        return [dict(item) for item in _identify_explicit_assumptions_impl(input_data)]
         
     def _identify_implicit_assumptions(self, input_data: Any) -> List[Dict[str, Any]]:
         """Identify implicit assumptions in the input."""
-        return [{"assumption": "Implementation needed"}]
+        return [dict(item) for item in _identify_implicit_assumptions_impl(input_data)]
         
-    def _validate_assumptions(self, assumptions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Validate identified assumptions."""
-        return assumptions
+    def _validate_assumption(self, assumption: Dict[str, Any]) -> bool:
+        """Check whether a single identified assumption holds up."""
+        return True
         
     def _identify_logical_issues(
         self,
@@ -326,16 +505,32 @@ class ChallengerAgent(BaseAgent):
         return {"critique": "Implementation needed"}
         
     def _calculate_severity(self, issue: Dict[str, Any]) -> float:
-        """Calculate the severity of an issue."""
-        return 0.5
+        """Calculate the severity of an issue as a weighted mean of its risk factors."""
+        factors = np.array(
+            [issue.get(factor, 0.5) for factor in self.SEVERITY_WEIGHTS],
+            dtype=np.float32
+        )
+        return weighted_score(factors, self._SEVERITY_WEIGHT_VECTOR)
         
     def _calculate_confidence(self, evidence: List[Dict[str, Any]]) -> float:
-        """Calculate confidence in a challenge based on evidence."""
-        return 0.5
+        """Calculate confidence in a challenge by combining its evidence strengths."""
+        strengths = np.array([item.get("strength", 0.5) for item in evidence], dtype=np.float32)
+        return combined_confidence(strengths)
         
-    def _assess_severity(self, challenges: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Assess the severity of challenges."""
-        return {"severity": "Implementation needed"}
+    def _assess_severity(self, challenges: List[Dict[str, Any]], history: np.ndarray) -> Dict[str, Any]:
+        """Assess the severity of challenges, relative to the recorded severities in history."""
+        severity = np.fromiter(
+            (challenge["severity"] for challenge in challenges),
+            dtype=np.float32,
+            count=len(challenges)
+        )
+        return {
+            "mean": float(severity.mean()) if severity.size else 0.0,
+            "max": float(severity.max()) if severity.size else 0.0,
+            "high_severity_count": int((severity > self.HIGH_SEVERITY).sum()),
+            "historical_mean": float(history.mean()) if history.size else None,
+            "historical_high_share": float((history > self.HIGH_SEVERITY).mean()) if history.size else None
+        }
         
     def _analyze_implications(self, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Analyze implications of challenges."""
@@ -347,12 +542,31 @@ class ChallengerAgent(BaseAgent):
         
     def _calculate_impact_score(
         self,
-        severity: Dict[str, Any],
+        challenges: List[Dict[str, Any]],
         implications: List[Dict[str, Any]],
         risks: List[Dict[str, Any]]
     ) -> float:
-        """Calculate overall impact score."""
-        return 0.5
+        """
+        Calculate overall impact score.
+        
+        Implications and risks weight the challenge at the same position;
+        when they don't line up one-to-one with the challenges, a neutral
+        weight of 1.0 is used.
+        """
+        count = len(challenges)
+        severities = np.array([challenge["severity"] for challenge in challenges], dtype=np.float32)
+        return impact_score(
+            severities,
+            self._aligned_weights(implications, "weight", count),
+            self._aligned_weights(risks, "likelihood", count)
+        )
+        
+    @staticmethod
+    def _aligned_weights(items: List[Dict[str, Any]], key: str, count: int) -> np.ndarray:
+        """Pack one float32 weight per challenge from items, defaulting to 1.0."""
+        if len(items) != count:
+            return np.ones(count, dtype=np.float32)
+        return np.array([item.get(key, 1.0) for item in items], dtype=np.float32)
         
     async def _propose_solutions(
         self,
@@ -3,59 +3,127 @@ Creative Thinker Agent
 Specializes in generating novel ideas, innovative solutions, and thinking outside the box.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, DefaultDict, Deque, List, Optional, Tuple
 from .base_agent import BaseAgent, AgentPersonality
+from .embeddings import HashingEmbedder, embed_all, top_k_similar
+from .serialization import lru_cache_by_key
 import asyncio
+from collections import defaultdict, deque
 import random
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
 
 class IdeaGeneration:
     """Represents a single idea generation session."""
-    def __init__(self, context: str, approach: str):
+    __slots__ = ("context", "approach", "ideas", "timestamp", "iterations", "refinements")
+    
+    def __init__(self, context: str, approach: str, timestamp: Optional[datetime] = None):
         self.context = context
         self.approach = approach
         self.ideas: List[Dict[str, Any]] = []
-        self.timestamp = datetime.now()
+        self.timestamp = timestamp or datetime.now()
         self.iterations = 0
         self.refinements: List[Dict[str, Any]] = []
 
+# Concept generation and potential scoring depend only on the context, so results
+# are shared across agents and calls; callers get copies of the cached dicts
+@lru_cache_by_key(maxsize=2048)
+def _generate_concept_impl(context: Any) -> Dict[str, Any]:
+    """Generate a new concept based on context."""
+    return {"concept": "Implementation needed"}
+
+@lru_cache_by_key(maxsize=2048)
+def _evaluate_potential_impl(context: Any) -> Dict[str, float]:
+    """Evaluate the potential of an idea in the given context."""
+    return {"potential": 0.0}
+
+# Source domains analogies are drawn from, matched to ideas by embedding similarity
+_ANALOGY_DOMAINS: Tuple[str, ...] = (
+    "ant colony foraging and swarm intelligence",
+    "immune system detecting and adapting to threats",
+    "river delta branching and flow distribution",
+    "market supply and demand pricing",
+    "orchestra conductor coordinating many players",
+    "city traffic routing and congestion",
+    "evolution by mutation and natural selection",
+    "restaurant kitchen preparing orders in parallel",
+    "library catalog organizing and retrieving knowledge",
+    "sports team strategy and role specialization",
+    "electrical grid balancing load and supply",
+    "garden ecosystem growth and pruning",
+)
+
+_EMBEDDER = HashingEmbedder()
+
+@lru_cache(maxsize=1)
+def _analogy_bank() -> np.ndarray:
+    """Embeddings of _ANALOGY_DOMAINS, computed once on first use."""
+    return _EMBEDDER.encode_batch(_ANALOGY_DOMAINS)
+
+# Identical for every instance, so built once and shared
+_CREATIVE_PERSONALITY = AgentPersonality(
+    name="Creative Thinker",
+    traits={
+        "creative": 0.95,
+        "intuitive": 0.85,
+        "open_minded": 0.9,
+        "experimental": 0.88,
+        "adaptable": 0.87,
+        "divergent_thinking": 0.92
+    },
+    expertise=[
+        "brainstorming",
+        "lateral thinking",
+        "innovation",
+        "conceptual blending",
+        "design thinking",
+        "creative problem solving"
+    ],
+    description="Innovative thinker focused on generating novel ideas and creative solutions"
+)
+
 class CreativeThinkerAgent(BaseAgent):
     """
     The Creative Thinker agent focuses on generating novel ideas and innovative solutions.
     It excels at thinking outside the box and finding unique approaches to problems.
     """
     
-    def __init__(self):
-        personality = AgentPersonality(
-            name="Creative Thinker",
-            traits={
-                "creative": 0.95,
-                "intuitive": 0.85,
-                "open_minded": 0.9,
-                "experimental": 0.88,
-                "adaptable": 0.87,
-                "divergent_thinking": 0.92
-            },
-            expertise=[
-                "brainstorming",
-                "lateral thinking",
-                "innovation",
-                "conceptual blending",
-                "design thinking",
-                "creative problem solving"
-            ],
-            description="Innovative thinker focused on generating novel ideas and creative solutions"
-        )
-        super().__init__(personality)
-        self.idea_history: List[IdeaGeneration] = []
-        self.creative_approaches = [
-            "analogical_thinking",
-            "reverse_thinking",
-            "random_association",
-            "morphological_analysis",
-            "provocative_operation",
-            "biomimicry"
-        ]
+    # Maximum number of past entries kept in idea_history
+    HISTORY_MAX = 10_000
+    
+    # Number of raw ideas drawn per session
+    IDEAS_PER_SESSION = 5
+    
+    # Minimum evaluation score for an idea to be refined
+    REFINEMENT_THRESHOLD = 0.6
+    
+    # Number of analogy domains attached to each enhanced idea
+    ANALOGIES_PER_IDEA = 5
+    
+    # Every session draws fresh approaches from the agent's RNG, so results are never reused
+    PROCESS_CACHEABLE = False
+    
+    creative_approaches: Tuple[str, ...] = (
+        "analogical_thinking",
+        "reverse_thinking",
+        "random_association",
+        "morphological_analysis",
+        "provocative_operation",
+        "biomimicry"
+    )
+    
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(_CREATIVE_PERSONALITY)
+        # Private generator: no contention on the shared module RNG, reproducible when seeded
+        self._rng = random.Random(seed)
+        self._embedder = _EMBEDDER
+        self.idea_history: Deque[IdeaGeneration] = deque(maxlen=self.HISTORY_MAX)
+        
+    def history_snapshot(self) -> List[IdeaGeneration]:
+        """Return a point-in-time copy of idea_history, e.g. for serialization."""
+        return list(self.idea_history)
         
     async def process(self, input_data: Any) -> Dict[str, Any]:
         """
@@ -67,14 +135,16 @@ class CreativeThinkerAgent(BaseAgent):
         Returns:
             Dict containing generated ideas and creative solutions
         """
-        await self.update_state({"current_task": "idea_generation"})
+        self.update_state({"current_task": "idea_generation"})
+        # One timestamp for the session, its raw ideas and the result
+        now = datetime.now()
         
         try:
             # Initialize idea generation session
-            session = IdeaGeneration(str(input_data), random.choice(self.creative_approaches))
+            session = IdeaGeneration(str(input_data), self._rng.choice(self.creative_approaches), now)
             
             # Generate initial ideas
-            raw_ideas = await self._generate_raw_ideas(input_data)
+            raw_ideas = await self._generate_raw_ideas(input_data, now)
             
             # Apply creative techniques
             enhanced_ideas = await self._apply_creative_techniques(raw_ideas)
@@ -82,15 +152,15 @@ class CreativeThinkerAgent(BaseAgent):
             # Evaluate and refine ideas
             refined_ideas = await self._evaluate_and_refine_ideas(enhanced_ideas)
             
-            # Combine and synthesize ideas
-            synthesized_ideas = await self._synthesize_ideas(refined_ideas)
+            # Combine and synthesize ideas (nothing to combine if none passed refinement)
+            synthesized_ideas = await self._synthesize_ideas(refined_ideas) if refined_ideas else []
             
             # Document the creative process
             creative_process = self._document_creative_process(session)
             
             # Store results
             result = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now,
                 "approach_used": session.approach,
                 "raw_ideas": raw_ideas,
                 "enhanced_ideas": enhanced_ideas,
@@ -105,9 +175,9 @@ class CreativeThinkerAgent(BaseAgent):
             
             return result
             
-        except Exception as e:
+        except Exception:
             self.state.confidence *= 0.8
-            raise Exception(f"Creative process failed: {str(e)}")
+            raise
             
     async def collaborate(self, other_agent: 'BaseAgent', context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -120,13 +190,13 @@ class CreativeThinkerAgent(BaseAgent):
         Returns:
             Dict containing collaborative creative results
         """
-        await self.update_state({
+        self.update_state({
             "current_task": f"creative_collaboration_with_{other_agent.personality.name}"
         })
         
         try:
             # Get other agent's perspective
-            other_perspective = await other_agent.process(context)
+            other_perspective = await self.consult(other_agent, context)
             
             # Generate ideas based on collaboration
             collaborative_ideas = await self._generate_collaborative_ideas(
@@ -152,92 +222,106 @@ class CreativeThinkerAgent(BaseAgent):
                 "synthesis": synthesis,
                 "collaboration_metadata": {
                     "partner": other_agent.personality.name,
-                    "timestamp": datetime.now().isoformat(),
-                    "approach": random.choice(self.creative_approaches)
+                    "timestamp": datetime.now(),
+                    "approach": self._rng.choice(self.creative_approaches)
                 }
             }
             
-        except Exception as e:
+        except Exception:
             self.state.confidence *= 0.9
-            raise Exception(f"Creative collaboration failed: {str(e)}")
-            
-    async def _generate_raw_ideas(self, context: Any) -> List[Dict[str, Any]]:
-        """Generate initial raw ideas."""
-        ideas = []
-        try:
-            # Apply different creative techniques
-            for _ in range(5):  # Generate multiple ideas
-                idea = {
-                    "concept": self._generate_concept(context),
-                    "approach": random.choice(self.creative_approaches),
-                    "associations": self._generate_associations(context),
-                    "potential": self._evaluate_potential(context),
-                    "timestamp": datetime.now().isoformat()
-                }
-                ideas.append(idea)
-            return ideas
+            raise
             
-        except Exception as e:
-            raise Exception(f"Raw idea generation failed: {str(e)}")
+    async def _generate_raw_ideas(self, context: Any, timestamp: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Generate initial raw ideas, all stamped with the given (or current) time."""
+        # Draw every approach, concept, association set and potential in batches
+        count = self.IDEAS_PER_SESSION
+        approaches = self._rng.choices(self.creative_approaches, k=count)
+        concepts = self._generate_concepts_batch(context, count)
+        associations = self._generate_associations_batch(context, count)
+        potentials = self._evaluate_potential_batch(context, count)
+        timestamp = timestamp or datetime.now()
+        return [
+            {
+                "concept": concept,
+                "approach": approach,
+                "associations": association,
+                "potential": potential,
+                "timestamp": timestamp
+            }
+            for approach, concept, association, potential
+            in zip(approaches, concepts, associations, potentials)
+        ]
             
     async def _apply_creative_techniques(self, ideas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Apply various creative techniques to enhance ideas."""
-        enhanced_ideas = []
-        try:
-            for idea in ideas:
-                enhanced = {
-                    **idea,
-                    "analogies": self._generate_analogies(idea),
-                    "variations": self._generate_variations(idea),
-                    "combinations": self._generate_combinations([idea]),
-                    "transformations": self._apply_transformations(idea)
-                }
-                enhanced_ideas.append(enhanced)
-            return enhanced_ideas
-            
-        except Exception as e:
-            raise Exception(f"Creative technique application failed: {str(e)}")
+        # Analogies for every idea come from one embedding batch and one matrix product
+        embeddings = embed_all(self._embedder, (idea["concept"] for idea in ideas))
+        analogies = self._generate_analogies_batch(embeddings)
+        # Each idea is enhanced independently, so enhance them all concurrently
+        enhanced_ideas = await asyncio.gather(
+            *(self._run_sync(self._enhance_idea, idea, idea_analogies)
+              for idea, idea_analogies in zip(ideas, analogies))
+        )
+        return list(enhanced_ideas)
             
     async def _evaluate_and_refine_ideas(self, ideas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Evaluate and refine generated ideas."""
+        """
+        Evaluate and refine generated ideas.
+        
+        Ideas that pass REFINEMENT_THRESHOLD are refined in place rather
+        than copied, so the same dicts (now carrying their evaluation) are
+        also what the caller sees in its enhanced idea list.
+        """
         refined_ideas = []
-        try:
-            for idea in ideas:
-                evaluation = self._evaluate_idea(idea)
-                if evaluation["score"] > 0.6:  # Threshold for refinement
-                    refined = {
-                        **idea,
-                        "refinements": self._refine_idea(idea),
-                        "evaluation": evaluation,
-                        "potential_applications": self._identify_applications(idea)
-                    }
-                    refined_ideas.append(refined)
-            return refined_ideas
-            
-        except Exception as e:
-            raise Exception(f"Idea evaluation and refinement failed: {str(e)}")
+        threshold = self.REFINEMENT_THRESHOLD
+        for idea in ideas:
+            evaluation = self._evaluate_idea(idea)
+            if evaluation["score"] > threshold:
+                idea["evaluation"] = evaluation
+                idea["refinements"] = self._refine_idea(idea)
+                idea["potential_applications"] = self._identify_applications(idea)
+                refined_ideas.append(idea)
+        return refined_ideas
             
     async def _synthesize_ideas(self, ideas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Synthesize and combine promising ideas."""
-        try:
-            # Group related ideas
-            grouped_ideas = self._group_related_ideas(ideas)
-            
-            # Combine ideas within groups
-            combined_ideas = []
-            for group in grouped_ideas.values():
-                synthesis = self._combine_group_ideas(group)
-                combined_ideas.extend(synthesis)
-                
-            return combined_ideas
+        # Group related ideas
+        grouped_ideas = self._group_related_ideas(ideas)
+        
+        # Combine ideas within groups
+        combined_ideas = []
+        for group in grouped_ideas.values():
+            synthesis = self._combine_group_ideas(group)
+            combined_ideas.extend(synthesis)
             
-        except Exception as e:
-            raise Exception(f"Idea synthesis failed: {str(e)}")
+        return combined_ideas
             
     # Helper methods (implement based on specific needs)
+    def _enhance_idea(self, idea: Dict[str, Any], analogies: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Enhance a single idea with every creative technique, given its precomputed analogies."""
+        return {
+            **idea,
+            "analogies": analogies,
+            "variations": self._generate_variations(idea),
+            "combinations": self._generate_combinations([idea]),
+            "transformations": self._apply_transformations(idea)
+        }
+        
     def _generate_concept(self, context: Any) -> Dict[str, Any]:
         """Generate a new concept based on context."""
-        return {"concept": "Implementation needed"}
+        return dict(_generate_concept_impl(context))
+        
+    def _generate_concepts_batch(self, context: Any, count: int) -> List[Dict[str, Any]]:
+        """Generate several concepts for the same context in one call."""
+        return [self._generate_concept(context) for _ in range(count)]
+        
+    def _generate_associations_batch(self, context: Any, count: int) -> List[List[str]]:
+        """Generate several association lists for the same context in one call."""
+        return [self._generate_associations(context) for _ in range(count)]
+        
+    def _evaluate_potential_batch(self, context: Any, count: int) -> List[Dict[str, float]]:
+        """Evaluate the potential of several ideas in the same context in one call."""
+        return [self._evaluate_potential(context) for _ in range(count)]
         
     def _generate_associations(self, context: Any) -> List[str]:
         """Generate associations related to the context."""
@@ -245,11 +329,30 @@ class CreativeThinkerAgent(BaseAgent):
         
     def _evaluate_potential(self, context: Any) -> Dict[str, float]:
         """Evaluate the potential of an idea in the given context."""
-        return {"potential": 0.0}
+        return dict(_evaluate_potential_impl(context))
         
     def _generate_analogies(self, idea: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate analogies for an idea."""
-        return [{"analogy": "Implementation needed"}]
+        return self._generate_analogies_batch(embed_all(self._embedder, [idea["concept"]]))[0]
+        
+    def _generate_analogies_batch(self, embeddings: np.ndarray) -> List[List[Dict[str, Any]]]:
+        """
+        Generate analogies for many ideas at once.
+        
+        Args:
+            embeddings: Idea embeddings, shape (N, D)
+            
+        Returns:
+            For each idea, its ANALOGIES_PER_IDEA closest analogy domains, most similar first
+        """
+        indices, sims = top_k_similar(embeddings, _analogy_bank(), self.ANALOGIES_PER_IDEA)
+        return [
+            [
+                {"analogy": _ANALOGY_DOMAINS[j], "similarity": sim}
+                for j, sim in zip(row_indices, row_sims)
+            ]
+            for row_indices, row_sims in zip(indices.tolist(), sims.tolist())
+        ]
         
     def _generate_variations(self, idea: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate variations of an idea."""
@@ -281,8 +384,17 @@ class CreativeThinkerAgent(BaseAgent):
         return [{"application": "Implementation needed"}]
         
     def _group_related_ideas(self, ideas: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-        """Group related ideas together."""
-        return {"group": []}
+        """
+        Group related ideas together.
+        
+        Ideas are bucketed by the creative approach that produced them in a
+        single pass, rather than compared pairwise, so grouping is linear in
+        the number of ideas.
+        """
+        grouped: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for idea in ideas:
+            grouped[idea.get("approach", "unknown")].append(idea)
+        return grouped
         
     def _combine_group_ideas(self, group: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Combine ideas within a group."""
@@ -294,7 +406,7 @@ class CreativeThinkerAgent(BaseAgent):
             "approach": session.approach,
             "techniques_used": self.creative_approaches,
             "iterations": session.iterations,
-            "timestamp": session.timestamp.isoformat()
+            "timestamp": session.timestamp
         }
         
     async def _generate_collaborative_ideas(
@@ -0,0 +1,164 @@
+"""
+Text Embeddings
+Dependency-free feature-hashing embeddings used for similarity between ideas, plans and queries.
+"""
+
+import re
+import zlib
+from typing import Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+_V = TypeVar("_V")
+
+class HashingEmbedder:
+    """
+    Embeds text by hashing its lowercase tokens into a fixed number of buckets.
+    
+    Each token adds +1 or -1 (chosen by a hash bit) to one bucket and the result
+    is L2-normalized, so the dot product of two embeddings is their cosine
+    similarity. No vocabulary is stored, so any text can be embedded and the same
+    text always maps to the same vector.
+    """
+    __slots__ = ("dim",)
+    
+    def __init__(self, dim: int = 256):
+        if dim <= 0:
+            raise ValueError("dim must be positive")
+        self.dim = dim
+        
+    def _accumulate(self, text: str, row: np.ndarray) -> None:
+        """Add the hashed tokens of text into row in place."""
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            h = zlib.crc32(token.encode())
+            row[h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+            
+    def encode(self, text: str) -> np.ndarray:
+        """Embed a single text as a float32 vector of length dim."""
+        return self.encode_batch([text])[0]
+        
+    def encode_batch(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed several texts at once.
+        
+        Args:
+            texts: The texts to embed
+            
+        Returns:
+            A C-contiguous float32 array of shape (len(texts), dim) with unit-length
+            rows (all-zero rows for texts without tokens)
+        """
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in zip(out, texts):
+            self._accumulate(text, row)
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        np.divide(out, norms, out=out, where=norms > 0)
+        return out
+
+def top_k_similar(queries: np.ndarray, bank: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find, for each query row, its k most similar bank rows.
+    
+    Similarities for all queries are computed with one matrix product and the
+    top k are selected with argpartition, then only those k are sorted.
+    
+    Args:
+        queries: Unit-length embeddings, shape (N, D)
+        bank: Unit-length embeddings, shape (M, D)
+        k: Number of neighbours per query (clamped to M)
+        
+    Returns:
+        (indices, similarities), both of shape (N, k), most similar first
+    """
+    k = max(min(k, bank.shape[0]), 0)
+    sims = queries @ bank.T
+    if k == 0:
+        return np.empty((sims.shape[0], 0), dtype=np.intp), sims[:, :0]
+    if k < bank.shape[0]:
+        top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(k), sims.shape)
+    top_sims = np.take_along_axis(sims, top, axis=1)
+    order = np.argsort(-top_sims, axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_sims, order, axis=1)
+
+def as_text(value: object) -> str:
+    """
+    Flatten a (possibly nested) value into the text that gets embedded.
+    
+    Dict keys are kept in front of their values, so {"goal": x} and
+    {"avoid": x} embed differently.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return " ".join(f"{as_text(k)} {as_text(v)}" for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return " ".join(as_text(v) for v in value)
+    return str(value)
+
+def embed_all(embedder: HashingEmbedder, values: Iterable[object]) -> np.ndarray:
+    """Embed arbitrary values via as_text in a single batch."""
+    return embedder.encode_batch([as_text(value) for value in values])
+
+class SemanticCache(Generic[_V]):
+    """
+    Fixed-size cache of values keyed by unit-length embeddings.
+    
+    A lookup returns the value stored under the most similar embedding when
+    the cosine similarity exceeds threshold. Entries live in a ring buffer,
+    so once capacity is reached each new entry replaces the oldest.
+    """
+    __slots__ = ("threshold", "_embeddings", "_values", "_next")
+    
+    def __init__(self, dim: int, capacity: int = 256, threshold: float = 0.95):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.threshold = threshold
+        self._embeddings = np.zeros((capacity, dim), dtype=np.float32)
+        self._values: List[Optional[_V]] = []
+        self._next = 0
+        
+    def __len__(self) -> int:
+        return sum(value is not None for value in self._values)
+        
+    def get(self, embedding: np.ndarray) -> Optional[_V]:
+        """Return the value of the most similar entry above threshold, or None."""
+        count = len(self._values)
+        if not count:
+            return None
+        similarities = self._embeddings[:count] @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] > self.threshold:
+            return self._values[best]
+        return None
+        
+    def put(self, embedding: np.ndarray, value: _V):
+        """Store value under embedding, replacing the oldest entry when full."""
+        slot = self._next
+        self._embeddings[slot] = embedding
+        if slot < len(self._values):
+            self._values[slot] = value
+        else:
+            self._values.append(value)
+        self._next = (slot + 1) % self._embeddings.shape[0]
+        
+    def invalidate(self, embedding: np.ndarray, threshold: float) -> int:
+        """
+        Drop every entry whose similarity to embedding is at least threshold.
+        
+        Returns:
+            The number of entries dropped
+        """
+        count = len(self._values)
+        stale = np.flatnonzero(self._embeddings[:count] @ embedding >= threshold)
+        # A zero embedding never clears a positive threshold, so the slot just waits to be reused
+        self._embeddings[stale] = 0.0
+        dropped = 0
+        for slot in stale.tolist():
+            if self._values[slot] is not None:
+                self._values[slot] = None
+                dropped += 1
+        return dropped
@@ -3,13 +3,26 @@ Implementer Agent
 Specializes in practical execution planning, resource allocation, and turning ideas into actionable steps.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from .base_agent import BaseAgent, AgentPersonality
+from ._jit import HAS_NUMBA
+from ._schedule_kernels import backflow
+from .embeddings import HashingEmbedder, SemanticCache
+from .serialization import lru_cache_by_key
 import asyncio
+import heapq
+from collections import deque
 from datetime import datetime, timedelta
 
+import numpy as np
+
 class Task:
     """Represents a single task in the implementation plan."""
+    __slots__ = (
+        "name", "description", "duration", "dependencies", "resources", "status",
+        "progress", "start_date", "end_date", "assigned_to", "priority", "risk_level", "id", "_hash"
+    )
+    
     def __init__(
         self,
         name: str,
@@ -30,9 +43,35 @@ class Task:
         self.assigned_to: Optional[str] = None
         self.priority = 0
         self.risk_level = "low"
+        # Position in the owning plan's topological order, assigned when its graph is built
+        self.id = -1
+        self._hash: Optional[int] = None
+        
+    def __hash__(self) -> int:
+        # Tasks are identified by name, which never changes, so hash it only once
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(self.name)
+        return h
+        
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Task):
+            return NotImplemented
+        return self.name == other.name
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the task's fields as a plain dict."""
+        return {field: getattr(self, field) for field in self.__slots__ if not field.startswith("_")}
 
 class ImplementationPlan:
     """Represents a complete implementation plan."""
+    __slots__ = (
+        "name", "description", "tasks", "dependencies", "resources", "timeline",
+        "status", "created_at", "updated_at", "version", "scope", "objectives",
+        "dirty", "_adjacency", "_indegree", "_topo_order", "_level_ptr", "_succ_ptr",
+        "_succ_idx", "_pred_ptr", "_pred_idx", "_task_arr"
+    )
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
@@ -42,8 +81,183 @@ class ImplementationPlan:
         self.timeline: Dict[str, Dict[str, datetime]] = {}
         self.status = "draft"
         self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.updated_at = self.created_at
         self.version = "1.0"
+        self.scope: Dict[str, Any] = {}
+        self.objectives: List[Dict[str, Any]] = []
+        # Names of tasks added or changed since the timeline was last computed
+        self.dirty: Set[str] = set()
+        # Task graph, filled in once tasks are broken down: successors of each
+        # task, number of unfinished prerequisites, and a topological order
+        self._adjacency: Dict[str, List[str]] = {}
+        self._indegree: Dict[str, int] = {}
+        self._topo_order: List[str] = []
+        # Columnar view of the same graph, indexed by task id (topological
+        # position): where each level of the order starts, successor and
+        # prerequisite lists in CSR form, and per-task numeric columns
+        self._level_ptr = np.zeros(1, dtype=np.int32)
+        self._succ_ptr = np.zeros(1, dtype=np.int32)
+        self._succ_idx = np.zeros(0, dtype=np.int32)
+        self._pred_ptr = np.zeros(1, dtype=np.int32)
+        self._pred_idx = np.zeros(0, dtype=np.int32)
+        self._task_arr = np.zeros(0, dtype=_TASK_DTYPE)
+        
+    def add_task(self, task: Task):
+        """Add a task to the plan and mark it for rescheduling."""
+        self.tasks[task.name] = task
+        self.dirty.add(task.name)
+        self.updated_at = datetime.now()
+        
+    def set_duration(self, name: str, duration: timedelta):
+        """Change a task's duration and mark it for rescheduling."""
+        self.tasks[name].duration = duration
+        self.dirty.add(name)
+        self.updated_at = datetime.now()
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the plan's public fields as a plain dict, with tasks expanded."""
+        data = {field: getattr(self, field) for field in self.__slots__ if not field.startswith("_")}
+        data["tasks"] = {name: task.to_dict() for name, task in self.tasks.items()}
+        return data
+
+def _toposort(adjacency: Dict[str, List[str]], indegree: Dict[str, int]) -> Tuple[List[str], List[int]]:
+    """
+    Order tasks so every task comes after all of its prerequisites (Kahn's algorithm).
+    
+    Tasks are released in rounds: round k holds the tasks whose longest chain
+    of prerequisites has k links. Every successor of a task therefore sits in
+    a later round, which lets whole rounds be processed as one vector step.
+    
+    Args:
+        adjacency: Successor names for every task name
+        indegree: Number of prerequisites of every task name
+        
+    Returns:
+        (order, level_ptr): task names in topological order, ties kept in
+        insertion order, and the offsets in order where each round starts,
+        followed by len(order)
+        
+    Raises:
+        ValueError: If the dependencies contain a cycle
+    """
+    remaining = dict(indegree)
+    frontier = [name for name, degree in remaining.items() if degree == 0]
+    order: List[str] = []
+    level_ptr = [0]
+    while frontier:
+        order.extend(frontier)
+        level_ptr.append(len(order))
+        released = []
+        for name in frontier:
+            for successor in adjacency[name]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    released.append(successor)
+        frontier = released
+    if len(order) != len(remaining):
+        cyclic = sorted(name for name, degree in remaining.items() if degree > 0)
+        raise ValueError(f"Task dependencies contain a cycle through: {', '.join(cyclic)}")
+    return order, level_ptr
+
+# Requirement, scope and objective derivation depend only on their input, so
+# results are shared across agents and calls; callers get copies
+@lru_cache_by_key(maxsize=1024)
+def _extract_requirements_impl(input_data: Any) -> Dict[str, Any]:
+    """Extract implementation requirements."""
+    return {"requirements": "Implementation needed"}
+
+@lru_cache_by_key(maxsize=1024)
+def _define_scope_impl(requirements: Dict[str, Any]) -> Dict[str, Any]:
+    """Define the implementation scope."""
+    return {"scope": "Implementation needed"}
+
+@lru_cache_by_key(maxsize=1024)
+def _define_objectives_impl(requirements: Dict[str, Any]) -> Tuple[Dict[str, Any], ...]:
+    """Define implementation objectives."""
+    return ({"objective": "Implementation needed"},)
+
+def _closure(names: Set[str], edges: Dict[str, List[str]]) -> Set[str]:
+    """Return names together with everything reachable from them along edges."""
+    reached = set(names)
+    stack = list(names)
+    while stack:
+        for neighbour in edges.get(stack.pop(), ()):
+            if neighbour not in reached:
+                reached.add(neighbour)
+                stack.append(neighbour)
+    return reached
+
+def _earliest_start(
+    busy: List[Tuple[datetime, datetime]],
+    ready_at: datetime,
+    duration: timedelta,
+    capacity: int
+) -> datetime:
+    """
+    Find the earliest start at or after ready_at where a task fits on capacity slots.
+    
+    Args:
+        busy: (start, end) of every task already holding a slot
+        ready_at: When the task's prerequisites have all finished
+        duration: How long the task holds its slot
+        capacity: Number of tasks that can run at the same time
+        
+    Returns:
+        The first moment from which fewer than capacity busy tasks overlap the task
+    """
+    # Occupancy only drops when a busy task ends, so those are the only candidates besides ready_at
+    for candidate in sorted({ready_at, *(end for _, end in busy if end > ready_at)}):
+        finish = candidate + duration
+        overlapping = [(s, e) for s, e in busy if s < finish and e > candidate]
+        # Occupancy within [candidate, finish) peaks at its start or where a busy task starts
+        points = [candidate, *(s for s, _ in overlapping if s > candidate)]
+        if all(sum(s <= point < e for s, e in overlapping) < capacity for point in points):
+            return candidate
+    return ready_at
+
+def _csr(plan: ImplementationPlan, order: List[str], edges: Dict[str, List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack per-task name lists into CSR arrays of task ids.
+    
+    Returns:
+        (ptr, idx): the ids linked to task id i are idx[ptr[i]:ptr[i + 1]]
+    """
+    ptr = np.zeros(len(order) + 1, dtype=np.int32)
+    np.cumsum([len(edges[name]) for name in order], out=ptr[1:])
+    idx = np.fromiter(
+        (plan.tasks[linked].id for name in order for linked in edges[name]),
+        dtype=np.int32,
+        count=int(ptr[-1])
+    )
+    return ptr, idx
+
+_EMBEDDER = HashingEmbedder()
+
+# Per-task numeric columns, indexed by position in the plan's topological order
+# (durations and priorities in seconds)
+_TASK_DTYPE = np.dtype([("dur", "f8"), ("prio", "f8"), ("indeg", "i4")])
+
+# Identical for every instance, so built once and shared
+_IMPLEMENTER_PERSONALITY = AgentPersonality(
+    name="Implementer",
+    traits={
+        "practical": 0.95,
+        "detail_oriented": 0.9,
+        "systematic": 0.85,
+        "efficient": 0.88,
+        "organized": 0.92,
+        "risk_aware": 0.85
+    },
+    expertise=[
+        "execution planning",
+        "resource allocation",
+        "task management",
+        "risk mitigation",
+        "process optimization",
+        "project management"
+    ],
+    description="Practical implementer focused on execution and resource management"
+)
 
 class ImplementerAgent(BaseAgent):
     """
@@ -51,31 +265,52 @@ class ImplementerAgent(BaseAgent):
     It excels at creating detailed plans and managing resources effectively.
     """
     
-    def __init__(self):
-        personality = AgentPersonality(
-            name="Implementer",
-            traits={
-                "practical": 0.95,
-                "detail_oriented": 0.9,
-                "systematic": 0.85,
-                "efficient": 0.88,
-                "organized": 0.92,
-                "risk_aware": 0.85
-            },
-            expertise=[
-                "execution planning",
-                "resource allocation",
-                "task management",
-                "risk mitigation",
-                "process optimization",
-                "project management"
-            ],
-            description="Practical implementer focused on execution and resource management"
-        )
-        super().__init__(personality)
+    # Number of tasks that can run at the same time when scheduling
+    MAX_PARALLEL_TASKS = 4
+    
+    # Number of plans kept for reuse by goal similarity
+    PLAN_CACHE_SIZE = 256
+    
+    # Cosine similarity above which a cached plan is adapted instead of planning from scratch
+    PLAN_CACHE_THRESHOLD = 0.90
+    
+    # Every call stores a new implementation plan, so results are never reused
+    PROCESS_CACHEABLE = False
+    
+    def __init__(self, plan_cache_enabled: bool = True):
+        super().__init__(_IMPLEMENTER_PERSONALITY)
         self.implementation_plans: Dict[str, ImplementationPlan] = {}
         self.resource_pool: Dict[str, Dict[str, Any]] = {}
         self.risk_registry: List[Dict[str, Any]] = []
+        # Completed plans keyed by their goal embedding
+        self.plan_cache_enabled = plan_cache_enabled
+        self._embedder = _EMBEDDER
+        self._plan_cache: SemanticCache[ImplementationPlan] = SemanticCache(
+            _EMBEDDER.dim, self.PLAN_CACHE_SIZE, self.PLAN_CACHE_THRESHOLD
+        )
+        
+    def _adapt_plan(self, template: ImplementationPlan, input_data: Any) -> ImplementationPlan:
+        """Create a fresh plan for input_data from a cached template, with copies of its tasks."""
+        plan = ImplementationPlan(
+            name=f"Implementation Plan {len(self.implementation_plans) + 1}",
+            description=str(input_data)
+        )
+        plan.scope = dict(template.scope)
+        plan.objectives = list(template.objectives)
+        tasks = []
+        for name in template._topo_order:
+            source = template.tasks[name]
+            task = Task(
+                source.name,
+                source.description,
+                source.duration,
+                list(source.dependencies),
+                dict(source.resources)
+            )
+            task.risk_level = source.risk_level
+            tasks.append(task)
+        self._build_task_graph(plan, tasks)
+        return plan
         
     async def process(self, input_data: Any) -> Dict[str, Any]:
         """
@@ -87,23 +322,34 @@ class ImplementerAgent(BaseAgent):
         Returns:
             Dict containing implementation plans and details
         """
-        await self.update_state({"current_task": "implementation_planning"})
+        self.update_state({"current_task": "implementation_planning"})
         
         try:
-            # Create implementation plan
-            plan = await self._create_implementation_plan(input_data)
-            
-            # Break down into tasks
-            tasks = await self._break_down_tasks(plan)
-            
-            # Allocate resources
-            resource_allocation = await self._allocate_resources(tasks)
+            # Reuse the plan of a sufficiently similar earlier goal, if any
+            goal_embedding = self._embedder.encode(str(input_data)) if self.plan_cache_enabled else None
+            template = self._plan_cache.get(goal_embedding) if goal_embedding is not None else None
+            
+            if template is not None:
+                # Adapt the cached plan; its tasks are already broken down
+                plan = self._adapt_plan(template, input_data)
+                tasks = [plan.tasks[name] for name in plan._topo_order]
+            else:
+                # Create implementation plan
+                plan = await self._create_implementation_plan(input_data)
+                
+                # Break down into tasks
+                tasks = await self._break_down_tasks(plan)
             
-            # Create timeline
-            timeline = await self._create_timeline(tasks, resource_allocation)
+            # Resource allocation and risk assessment only need the tasks, so run them
+            # concurrently; if either fails the other is cancelled
+            async with asyncio.TaskGroup() as group:
+                allocation_task = group.create_task(self._allocate_resources(tasks))
+                risks_task = group.create_task(self._assess_risks(plan, tasks))
+            resource_allocation = allocation_task.result()
+            risks = risks_task.result()
             
-            # Risk assessment
-            risks = await self._assess_risks(plan, tasks)
+            # Create timeline (depends on the resource allocation)
+            timeline = await self._create_timeline(plan, tasks, resource_allocation)
             
             # Generate execution strategy
             strategy = await self._generate_execution_strategy(
@@ -115,7 +361,7 @@ class ImplementerAgent(BaseAgent):
             )
             
             result = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),
                 "plan": plan,
                 "tasks": tasks,
                 "resource_allocation": resource_allocation,
@@ -128,12 +374,16 @@ class ImplementerAgent(BaseAgent):
             # Store the plan
             plan_id = str(len(self.implementation_plans) + 1)
             self.implementation_plans[plan_id] = plan
+            plan.timeline = timeline["tasks"]
+            plan.dirty.clear()
+            if goal_embedding is not None and template is None:
+                self._plan_cache.put(goal_embedding, plan)
             
             return result
             
-        except Exception as e:
+        except Exception:
             self.state.confidence *= 0.8
-            raise Exception(f"Implementation planning failed: {str(e)}")
+            raise
             
     async def collaborate(self, other_agent: 'BaseAgent', context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -146,13 +396,13 @@ class ImplementerAgent(BaseAgent):
         Returns:
             Dict containing collaborative implementation results
         """
-        await self.update_state({
+        self.update_state({
             "current_task": f"implementation_collaboration_with_{other_agent.personality.name}"
         })
         
         try:
             # Get other agent's perspective
-            other_perspective = await other_agent.process(context)
+            other_perspective = await self.consult(other_agent, context)
             
             # Integrate implementation considerations
             integrated_plan = await self._integrate_implementation_perspectives(
@@ -172,105 +422,106 @@ class ImplementerAgent(BaseAgent):
                 adjusted_strategy
             )
             
+            # Fold tasks the partner proposes into the plan under discussion, if
+            # any, and reschedule only the part of the plan they touch
+            timeline = None
+            plan = self.implementation_plans.get(str(context.get("plan_id"))) if isinstance(context, dict) else None
+            if plan is not None:
+                self._merge_partner_tasks(plan, other_perspective.get("tasks", ()))
+                timeline = self._incremental_reschedule(plan)
+            
             return {
                 "integrated_plan": integrated_plan,
                 "adjusted_strategy": adjusted_strategy,
                 "execution_plan": execution_plan,
+                "timeline": timeline,
                 "collaboration_metadata": {
                     "partner": other_agent.personality.name,
-                    "timestamp": datetime.now().isoformat()
+                    "trait_affinity": self.personality.affinity(other_agent.personality),
+                    "timestamp": datetime.now()
                 }
             }
             
-        except Exception as e:
+        except Exception:
             self.state.confidence *= 0.9
-            raise Exception(f"Implementation collaboration failed: {str(e)}")
+            raise
             
     async def _create_implementation_plan(self, input_data: Any) -> ImplementationPlan:
         """Create a detailed implementation plan."""
-        try:
-            # Extract requirements
-            requirements = self._extract_requirements(input_data)
-            
-            # Create plan structure
-            plan = ImplementationPlan(
-                name=f"Implementation Plan {len(self.implementation_plans) + 1}",
-                description=str(input_data)
-            )
-            
-            # Define scope and objectives
-            scope = self._define_scope(requirements)
-            objectives = self._define_objectives(requirements)
-            
-            # Update plan with initial components
-            plan.scope = scope
-            plan.objectives = objectives
-            
-            return plan
-            
-        except Exception as e:
-            raise Exception(f"Plan creation failed: {str(e)}")
+        # Extract requirements
+        requirements = self._extract_requirements(input_data)
+        
+        # Create plan structure
+        plan = ImplementationPlan(
+            name=f"Implementation Plan {len(self.implementation_plans) + 1}",
+            description=str(input_data)
+        )
+        
+        # Define scope and objectives
+        scope = self._define_scope(requirements)
+        objectives = self._define_objectives(requirements)
+        
+        # Update plan with initial components
+        plan.scope = scope
+        plan.objectives = objectives
+        
+        return plan
             
     async def _break_down_tasks(self, plan: ImplementationPlan) -> List[Task]:
         """Break down the plan into detailed tasks."""
         tasks = []
-        try:
-            # Identify main components
-            components = self._identify_components(plan)
-            
-            # Break down each component
-            for component in components:
-                component_tasks = self._break_down_component(component)
-                tasks.extend(component_tasks)
-                
-            # Establish dependencies
-            tasks = self._establish_task_dependencies(tasks)
-            
-            return tasks
+        # Identify main components
+        components = self._identify_components(plan)
+        
+        # Break down each component
+        for component in components:
+            component_tasks = self._break_down_component(component)
+            tasks.extend(component_tasks)
             
-        except Exception as e:
-            raise Exception(f"Task breakdown failed: {str(e)}")
+        # Establish dependencies
+        tasks = self._establish_task_dependencies(tasks)
+        
+        # Sort once; every later pass walks the tasks in this order
+        self._build_task_graph(plan, tasks)
+        
+        return [plan.tasks[name] for name in plan._topo_order]
             
     async def _allocate_resources(self, tasks: List[Task]) -> Dict[str, Dict[str, Any]]:
         """Allocate resources to tasks."""
-        try:
-            # Analyze resource requirements
-            requirements = self._analyze_resource_requirements(tasks)
-            
-            # Check resource availability
-            availability = self._check_resource_availability(requirements)
-            
-            # Optimize resource allocation
-            allocation = self._optimize_resource_allocation(
-                requirements,
-                availability
-            )
-            
-            return allocation
-            
-        except Exception as e:
-            raise Exception(f"Resource allocation failed: {str(e)}")
+        # Analyze resource requirements
+        requirements = self._analyze_resource_requirements(tasks)
+        
+        # Check resource availability
+        availability = self._check_resource_availability(requirements)
+        
+        # Optimize resource allocation
+        allocation = self._optimize_resource_allocation(
+            requirements,
+            availability
+        )
+        
+        return allocation
             
     async def _create_timeline(
         self,
+        plan: ImplementationPlan,
         tasks: List[Task],
         resources: Dict[str, Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Create a timeline for task execution."""
-        try:
-            # Calculate task durations
-            durations = self._calculate_task_durations(tasks, resources)
-            
-            # Create schedule
-            schedule = self._create_schedule(tasks, durations)
-            
-            # Optimize timeline
-            optimized = self._optimize_timeline(schedule)
-            
-            return optimized
-            
-        except Exception as e:
-            raise Exception(f"Timeline creation failed: {str(e)}")
+        # Calculate task durations
+        durations = self._calculate_task_durations(tasks, resources)
+        
+        # Rank tasks by the length of the longest path they start
+        self._calculate_priorities(plan, durations)
+        
+        # Create schedule
+        schedule = self._create_schedule(plan)
+        
+        # Optimize timeline
+        optimized = self._optimize_timeline(plan, schedule)
+        
+        return optimized
             
     async def _assess_risks(
         self,
@@ -278,33 +529,29 @@ class ImplementerAgent(BaseAgent):
         tasks: List[Task]
     ) -> List[Dict[str, Any]]:
         """Assess implementation risks."""
-        try:
-            # Identify risks
-            risks = self._identify_risks(plan, tasks)
-            
-            # Analyze impact and probability
-            analyzed_risks = self._analyze_risks(risks)
-            
-            # Create mitigation strategies
-            mitigated_risks = self._create_risk_mitigation(analyzed_risks)
-            
-            return mitigated_risks
-            
-        except Exception as e:
-            raise Exception(f"Risk assessment failed: {str(e)}")
+        # Identify risks
+        risks = self._identify_risks(plan, tasks)
+        
+        # Analyze impact and probability
+        analyzed_risks = self._analyze_risks(risks)
+        
+        # Create mitigation strategies
+        mitigated_risks = self._create_risk_mitigation(analyzed_risks)
+        
+        return mitigated_risks
             
     # Helper methods (implement based on specific needs)
     def _extract_requirements(self, input_data: Any) -> Dict[str, Any]:
         """Extract implementation requirements."""
-        return {"requirements": "Implementation needed"}
+        return dict(_extract_requirements_impl(input_data))
         
     def _define_scope(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Define the implementation scope."""
-        return {"scope": "Implementation needed"}
+        return dict(_define_scope_impl(requirements))
         
     def _define_objectives(self, requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Define implementation objectives."""
-        return [{"objective": "Implementation needed"}]
+        return [dict(objective) for objective in _define_objectives_impl(requirements)]
         
     def _identify_components(self, plan: ImplementationPlan) -> List[Dict[str, Any]]:
         """Identify main components of the plan."""
@@ -318,6 +565,116 @@ class ImplementerAgent(BaseAgent):
         """Establish dependencies between tasks."""
         return tasks
         
+    def _build_task_graph(self, plan: ImplementationPlan, tasks: List[Task]):
+        """
+        Record tasks, their dependency graph and a topological order on the plan.
+        
+        Raises:
+            ValueError: On duplicate task names, unknown dependencies or cycles
+        """
+        plan.tasks = {}
+        for task in tasks:
+            if task.name in plan.tasks:
+                raise ValueError(f"Duplicate task name: {task.name}")
+            plan.tasks[task.name] = task
+        plan.dependencies = {task.name: list(task.dependencies) for task in tasks}
+        plan._adjacency = {name: [] for name in plan.tasks}
+        plan._indegree = dict.fromkeys(plan.tasks, 0)
+        for task in tasks:
+            for dependency in task.dependencies:
+                if dependency not in plan.tasks:
+                    raise ValueError(f"Task {task.name} depends on unknown task {dependency}")
+                plan._adjacency[dependency].append(task.name)
+                plan._indegree[task.name] += 1
+        order, level_ptr = _toposort(plan._adjacency, plan._indegree)
+        plan._topo_order = order
+        for index, name in enumerate(order):
+            plan.tasks[name].id = index
+        plan._level_ptr = np.asarray(level_ptr, dtype=np.int32)
+        plan._succ_ptr, plan._succ_idx = _csr(plan, order, plan._adjacency)
+        plan._pred_ptr, plan._pred_idx = _csr(plan, order, plan.dependencies)
+        plan._task_arr = np.zeros(len(order), dtype=_TASK_DTYPE)
+        plan._task_arr["indeg"] = np.diff(plan._pred_ptr)
+        
+    def _merge_partner_tasks(self, plan: ImplementationPlan, tasks: Any):
+        """Add copies of a partner's new tasks whose prerequisites the plan already has."""
+        for task in tasks:
+            if (
+                isinstance(task, Task)
+                and task.name not in plan.tasks
+                and all(dependency in plan.tasks for dependency in task.dependencies)
+            ):
+                plan.add_task(Task(
+                    task.name,
+                    task.description,
+                    task.duration,
+                    list(task.dependencies),
+                    dict(task.resources)
+                ))
+                
+    def _incremental_reschedule(self, plan: ImplementationPlan) -> Dict[str, Any]:
+        """
+        Update a scheduled plan after tasks were added or changed, touching only what they affect.
+        
+        A task's priority depends only on its successors, so only the dirty
+        tasks and their ancestors are re-ranked; a task's earliest start
+        depends only on its prerequisites, so only the dirty tasks and their
+        descendants are re-placed. They are list-scheduled by priority into
+        the earliest gap after their prerequisites finish where fewer than
+        MAX_PARALLEL_TASKS tasks are running. Everything else keeps its
+        priority and slot. The graph itself is rebuilt only when tasks were
+        added.
+        
+        Earlier process() results share the plan's timeline, so a new
+        timeline is built rather than editing the old one in place.
+        
+        Returns:
+            The updated timeline, in the same form _create_timeline returns
+        """
+        dirty = plan.dirty
+        if any(name not in plan._indegree for name in dirty):
+            self._build_task_graph(plan, list(plan.tasks.values()))
+        ancestors = _closure(dirty, plan.dependencies)
+        descendants = _closure(dirty, plan._adjacency)
+        
+        # Re-rank, successors first
+        for name in reversed(plan._topo_order):
+            if name in ancestors:
+                task = plan.tasks[name]
+                task.priority = task.duration.total_seconds() + max(
+                    (plan.tasks[successor].priority for successor in plan._adjacency[name]),
+                    default=0.0
+                )
+        plan._task_arr["dur"] = [plan.tasks[name].duration.total_seconds() for name in plan._topo_order]
+        plan._task_arr["prio"] = [plan.tasks[name].priority for name in plan._topo_order]
+        
+        # Re-place by priority around the slots the untouched tasks keep
+        entries = {name: dict(entry) for name, entry in plan.timeline.items() if name not in descendants}
+        start = min((entry["start"] for entry in entries.values()), default=datetime.now())
+        busy = [(entry["start"], entry["end"]) for entry in entries.values()]
+        remaining = {
+            name: sum(dep in descendants for dep in plan.dependencies[name])
+            for name in descendants
+        }
+        ready = [(-plan.tasks[name].priority, plan.tasks[name].id, name) for name, count in remaining.items() if count == 0]
+        heapq.heapify(ready)
+        while ready:
+            _, _, name = heapq.heappop(ready)
+            task = plan.tasks[name]
+            ready_at = max((entries[dep]["end"] for dep in plan.dependencies[name]), default=start)
+            task_start = _earliest_start(busy, ready_at, task.duration, self.MAX_PARALLEL_TASKS)
+            entries[name] = {"start": task_start, "end": task_start + task.duration}
+            busy.append((task_start, task_start + task.duration))
+            for successor in plan._adjacency[name]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    heapq.heappush(ready, (-plan.tasks[successor].priority, plan.tasks[successor].id, successor))
+        end = max((entry["end"] for entry in entries.values()), default=start)
+        
+        plan.timeline = entries
+        dirty.clear()
+        return self._optimize_timeline(plan, {"start": start, "end": end, "tasks": entries})
+        
     def _analyze_resource_requirements(self, tasks: List[Task]) -> Dict[str, Any]:
         """Analyze resource requirements for tasks."""
         return {"requirements": "Implementation needed"}
@@ -340,19 +697,122 @@ class ImplementerAgent(BaseAgent):
         resources: Dict[str, Dict[str, Any]]
     ) -> Dict[str, timedelta]:
         """Calculate task durations."""
-        return {"task": timedelta(days=1)}
+        return {task.name: task.duration for task in tasks}
         
-    def _create_schedule(
+    def _calculate_priorities(
         self,
-        tasks: List[Task],
+        plan: ImplementationPlan,
         durations: Dict[str, timedelta]
-    ) -> Dict[str, Any]:
-        """Create a schedule for tasks."""
-        return {"schedule": "Implementation needed"}
+    ) -> Dict[str, float]:
+        """
+        Assign Backflow priorities: a task's own duration plus the largest priority of its successors.
+        
+        A task's priority is the length, in seconds, of the longest path that
+        starts with it. With numba this is one compiled reverse pass over
+        the CSR successor arrays. Without it, levels of the topological
+        order are processed from the last to the first instead; all
+        successors of a level lie in later levels, so each level is a
+        single vectorized step over its contiguous successor range.
+        """
+        order = plan._topo_order
+        tasks = plan._task_arr
+        tasks["dur"] = [durations[name].total_seconds() for name in order]
+        succ_ptr, succ_idx = plan._succ_ptr, plan._succ_idx
+        if HAS_NUMBA:
+            tasks["prio"] = backflow(succ_ptr, succ_idx, np.ascontiguousarray(tasks["dur"]))
+        else:
+            prio = tasks["prio"]
+            level_ptr = plan._level_ptr
+            for level in range(len(level_ptr) - 2, -1, -1):
+                lo, hi = level_ptr[level], level_ptr[level + 1]
+                starts = succ_ptr[lo:hi]
+                counts = succ_ptr[lo + 1:hi + 1] - starts
+                best = np.zeros(hi - lo)
+                has_successors = counts > 0
+                if has_successors.any():
+                    successor_prio = prio[succ_idx[starts[0]:succ_ptr[hi]]]
+                    best[has_successors] = np.maximum.reduceat(
+                        successor_prio,
+                        (starts - starts[0])[has_successors]
+                    )
+                prio[lo:hi] = tasks["dur"][lo:hi] + best
+        priorities = dict(zip(order, tasks["prio"].tolist()))
+        for name, priority in priorities.items():
+            plan.tasks[name].priority = priority
+        return priorities
+        
+    def _create_schedule(self, plan: ImplementationPlan) -> Dict[str, Any]:
+        """
+        Create a schedule by list scheduling on MAX_PARALLEL_TASKS slots.
+        
+        Whenever a slot frees up, the ready task with the highest priority
+        is started, so work on the critical path is never delayed by less
+        urgent tasks. Each task starts once its slot is free and all of its
+        prerequisites have finished. Works on task ids and the plan's
+        dur/prio columns, as filled in by _calculate_priorities.
+        """
+        start = datetime.now()
+        order = plan._topo_order
+        count = len(order)
+        durations = plan._task_arr["dur"].tolist()
+        priorities = plan._task_arr["prio"].tolist()
+        remaining = plan._task_arr["indeg"].tolist()
+        succ_ptr, succ_idx = plan._succ_ptr.tolist(), plan._succ_idx.tolist()
+        pred_ptr, pred_idx = plan._pred_ptr.tolist(), plan._pred_idx.tolist()
+        # Offsets from start, in seconds; ties on priority go to the lower id
+        starts = [0.0] * count
+        finishes = [0.0] * count
+        ready = [(-priorities[i], i) for i in range(int(plan._level_ptr[1]) if count else 0)]
+        heapq.heapify(ready)
+        slots = [0.0] * min(self.MAX_PARALLEL_TASKS, max(count, 1))
+        while ready:
+            _, i = heapq.heappop(ready)
+            task_start = max(
+                heapq.heappop(slots),
+                max((finishes[j] for j in pred_idx[pred_ptr[i]:pred_ptr[i + 1]]), default=0.0)
+            )
+            starts[i] = task_start
+            finishes[i] = task_start + durations[i]
+            heapq.heappush(slots, finishes[i])
+            for j in succ_idx[succ_ptr[i]:succ_ptr[i + 1]]:
+                remaining[j] -= 1
+                if remaining[j] == 0:
+                    heapq.heappush(ready, (-priorities[j], j))
+        entries = {
+            name: {
+                "start": start + timedelta(seconds=starts[i]),
+                "end": start + timedelta(seconds=finishes[i])
+            }
+            for i, name in enumerate(order)
+        }
+        end = start + timedelta(seconds=max(finishes, default=0.0))
+        return {"start": start, "end": end, "tasks": entries}
+        
+    def _optimize_timeline(self, plan: ImplementationPlan, schedule: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Annotate the schedule with its critical path.
         
-    def _optimize_timeline(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
-        """Optimize the implementation timeline."""
-        return {"timeline": "Implementation needed"}
+        The critical path starts at the entry task with the highest
+        priority and repeatedly follows the successor with the highest
+        priority; its length bounds the makespan from below.
+        """
+        priorities = plan._task_arr["prio"]
+        succ_ptr, succ_idx = plan._succ_ptr, plan._succ_idx
+        path: List[int] = []
+        if plan._topo_order:
+            # Entry tasks make up the first level of the order
+            i = int(np.argmax(priorities[:plan._level_ptr[1]]))
+            path.append(i)
+            while succ_ptr[i] < succ_ptr[i + 1]:
+                successors = succ_idx[succ_ptr[i]:succ_ptr[i + 1]]
+                i = int(successors[np.argmax(priorities[successors])])
+                path.append(i)
+        return {
+            **schedule,
+            "critical_path": [plan._topo_order[i] for i in path],
+            "critical_path_length": timedelta(seconds=float(priorities[path[0]])) if path else timedelta(0),
+            "makespan": schedule["end"] - schedule["start"]
+        }
         
     def _identify_risks(
         self,
@@ -3,33 +3,57 @@ Researcher Agent
 Specializes in deep knowledge exploration, information gathering, and evidence-based investigation.
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, AsyncIterator, List, Optional, Set, Tuple
 from .base_agent import BaseAgent, AgentPersonality
 import asyncio
 from datetime import datetime
+from functools import lru_cache
 import json
 
+import numpy as np
+
 class ResearchQuery:
     """Represents a research query with its parameters and context."""
-    def __init__(self, topic: str, scope: str, depth: str = "comprehensive"):
+    __slots__ = (
+        "topic", "scope", "depth", "timestamp", "status", "sources",
+        "findings", "confidence_scores", "metadata"
+    )
+    
+    def __init__(
+        self,
+        topic: str,
+        scope: str,
+        depth: str = "comprehensive",
+        timestamp: Optional[datetime] = None
+    ):
         self.topic = topic
         self.scope = scope
         self.depth = depth
-        self.timestamp = datetime.now()
+        self.timestamp = timestamp or datetime.now()
         self.status = "initiated"
         self.sources: List[Dict[str, Any]] = []
         self.findings: List[Dict[str, Any]] = []
         self.confidence_scores: Dict[str, float] = {}
         self.metadata: Dict[str, Any] = {}
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the query's fields as a plain dict."""
+        return {field: getattr(self, field) for field in self.__slots__}
 
 class ResearchSource:
     """Represents a research source with metadata and credibility scoring."""
+    __slots__ = (
+        "title", "source_type", "url", "authors", "credibility_score", "relevance_score",
+        "accessed_date", "citations", "key_findings", "metadata", "_hash"
+    )
+    
     def __init__(
         self,
         title: str,
         source_type: str,
         url: Optional[str] = None,
-        authors: Optional[List[str]] = None
+        authors: Optional[List[str]] = None,
+        accessed_date: Optional[datetime] = None
     ):
         self.title = title
         self.source_type = source_type
@@ -37,10 +61,66 @@ class ResearchSource:
         self.authors = authors or []
         self.credibility_score = 0.0
         self.relevance_score = 0.0
-        self.accessed_date = datetime.now()
+        self.accessed_date = accessed_date or datetime.now()
         self.citations: List[str] = []
         self.key_findings: List[str] = []
         self.metadata: Dict[str, Any] = {}
+        self._hash: Optional[int] = None
+        
+    def __hash__(self) -> int:
+        # Sources are identified by their key (URL, else title), which never changes,
+        # so hash it only once
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(_source_key(self))
+        return h
+        
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ResearchSource):
+            return NotImplemented
+        return _source_key(self) == _source_key(other)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the source's fields as a plain dict."""
+        return {field: getattr(self, field) for field in self.__slots__ if not field.startswith("_")}
+
+def _source_key(source: ResearchSource) -> str:
+    """Identify a source by its URL, or by its case-folded title when it has none."""
+    return source.url or source.title.casefold()
+
+# Credibility and verification depend only on which source is checked, so
+# results are shared across agents and queries; callers get copies
+@lru_cache(maxsize=4096)
+def _assess_credibility_impl(url: Optional[str], title: str, source_type: str) -> Dict[str, Any]:
+    """Assess the credibility of the identified source."""
+    return {"score": 0.8, "factors": []}
+
+@lru_cache(maxsize=4096)
+def _verify_information_impl(url: Optional[str], title: str, source_type: str) -> Dict[str, Any]:
+    """Verify information from the identified source."""
+    return {"status": "verified", "details": []}
+
+# Identical for every instance, so built once and shared
+_RESEARCHER_PERSONALITY = AgentPersonality(
+    name="Researcher",
+    traits={
+        "analytical": 0.9,
+        "thorough": 0.95,
+        "skeptical": 0.85,
+        "curious": 0.92,
+        "methodical": 0.88,
+        "detail_oriented": 0.9
+    },
+    expertise=[
+        "research methodology",
+        "information synthesis",
+        "source validation",
+        "data collection",
+        "literature review",
+        "critical analysis"
+    ],
+    description="Deep knowledge explorer focused on comprehensive research and validation"
+)
 
 class ResearcherAgent(BaseAgent):
     """
@@ -48,31 +128,25 @@ class ResearcherAgent(BaseAgent):
     It excels at finding, validating, and synthesizing information from various sources.
     """
     
+    # Maximum number of sources processed concurrently during extraction
+    MAX_CONCURRENT_EXTRACTIONS = 8
+    
+    # Maximum number of sources validated concurrently
+    MAX_CONCURRENT_VALIDATIONS = 16
+    
+    # Weights of credibility and relevance when ranking sources
+    CREDIBILITY_WEIGHT = 0.6
+    RELEVANCE_WEIGHT = 0.4
+    
     def __init__(self):
-        personality = AgentPersonality(
-            name="Researcher",
-            traits={
-                "analytical": 0.9,
-                "thorough": 0.95,
-                "skeptical": 0.85,
-                "curious": 0.92,
-                "methodical": 0.88,
-                "detail_oriented": 0.9
-            },
-            expertise=[
-                "research methodology",
-                "information synthesis",
-                "source validation",
-                "data collection",
-                "literature review",
-                "critical analysis"
-            ],
-            description="Deep knowledge explorer focused on comprehensive research and validation"
-        )
-        super().__init__(personality)
+        super().__init__(_RESEARCHER_PERSONALITY)
         self.research_history: List[ResearchQuery] = []
         self.source_database: Dict[str, ResearchSource] = {}
-        self.credibility_metrics: Dict[str, Dict[str, float]] = {}
+        # Credibility assessments by source key (URL, else title), reused across queries
+        self.credibility_metrics: Dict[str, Dict[str, Any]] = {}
+        # Bound concurrent per-source work, which may call out to external services
+        self._extraction_slots = asyncio.Semaphore(self.MAX_CONCURRENT_EXTRACTIONS)
+        self._validation_slots = asyncio.Semaphore(self.MAX_CONCURRENT_VALIDATIONS)
         
     async def process(self, input_data: Any) -> Dict[str, Any]:
         """
@@ -84,26 +158,83 @@ class ResearcherAgent(BaseAgent):
         Returns:
             Dict containing research findings and analysis
         """
-        await self.update_state({"current_task": "research_investigation"})
+        parts: Dict[str, Any] = {}
+        sources: List[Dict[str, Any]] = []
+        findings: List[Dict[str, Any]] = []
+        async for record in self.stream(input_data):
+            phase = record["phase"]
+            if phase == "source":
+                sources.append(record["data"])
+            elif phase == "finding":
+                findings.append(record["data"])
+            else:
+                parts[phase] = record["data"]
+                
+        return {
+            "timestamp": parts["query"]["timestamp"],
+            "query": parts["query"],
+            "sources": sources,
+            "findings": findings,
+            "analysis": parts["analysis"],
+            "synthesis": parts["synthesis"],
+            "report": parts["report"],
+            "confidence_score": self.state.confidence
+        }
+        
+    async def stream(self, input_data: Any) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Research input, yielding each part of the result as soon as it is ready.
+        
+        Records are {"phase": ..., "data": ...} dicts, in this order: "query",
+        one "source" per validated source, one "finding" per source (in source
+        order, each as soon as it and those before it are extracted), then
+        "analysis", "synthesis" and "report". Consumers can act on sources
+        and findings before the analysis is done, and nothing is buffered
+        for them; process() collects the same records into one dict.
+        
+        Args:
+            input_data: The topic or question to research
+            
+        Yields:
+            Result records, as described above
+        """
+        self.update_state({"current_task": "research_investigation"})
         
         try:
             # Create research query
             query = ResearchQuery(str(input_data), "comprehensive")
+            yield {"phase": "query", "data": query.to_dict()}
             
             # Gather initial sources
             sources = await self._gather_sources(query)
             
             # Validate sources
             validated_sources = await self._validate_sources(sources)
-            
+            for source in validated_sources:
+                yield {"phase": "source", "data": source.to_dict()}
+                
             # Extract information
-            extracted_info = await self._extract_information(validated_sources)
-            
+            extracted_info = []
+            extractions = self._start_extraction(validated_sources)
+            try:
+                for extraction in extractions:
+                    finding = await extraction
+                    extracted_info.append(finding)
+                    yield {"phase": "finding", "data": finding}
+            finally:
+                # Stop outstanding work if the consumer stopped early or a step failed
+                for extraction in extractions:
+                    extraction.cancel()
+                # Retrieve every outcome, so failures after the first aren't reported as never retrieved
+                await asyncio.gather(*extractions, return_exceptions=True)
+                    
             # Analyze findings
             analysis = await self._analyze_findings(extracted_info)
+            yield {"phase": "analysis", "data": analysis}
             
             # Synthesize research
             synthesis = await self._synthesize_research(analysis)
+            yield {"phase": "synthesis", "data": synthesis}
             
             # Create research report
             report = await self._create_research_report(
@@ -113,23 +244,12 @@ class ResearcherAgent(BaseAgent):
                 synthesis
             )
             
-            result = {
-                "timestamp": datetime.now().isoformat(),
-                "query": query.__dict__,
-                "sources": [s.__dict__ for s in validated_sources],
-                "findings": extracted_info,
-                "analysis": analysis,
-                "synthesis": synthesis,
-                "report": report,
-                "confidence_score": self.state.confidence
-            }
-            
             self.research_history.append(query)
-            return result
+            yield {"phase": "report", "data": report}
             
-        except Exception as e:
+        except Exception:
             self.state.confidence *= 0.8
-            raise Exception(f"Research process failed: {str(e)}")
+            raise
             
     async def collaborate(self, other_agent: 'BaseAgent', context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -142,13 +262,13 @@ class ResearcherAgent(BaseAgent):
         Returns:
             Dict containing collaborative research results
         """
-        await self.update_state({
+        self.update_state({
             "current_task": f"research_collaboration_with_{other_agent.personality.name}"
         })
         
         try:
             # Get other agent's perspective
-            other_perspective = await other_agent.process(context)
+            other_perspective = await self.consult(other_agent, context)
             
             # Integrate research findings
             integrated_findings = await self._integrate_research_perspectives(
@@ -174,109 +294,113 @@ class ResearcherAgent(BaseAgent):
                 "collaborative_synthesis": collaborative_synthesis,
                 "collaboration_metadata": {
                     "partner": other_agent.personality.name,
-                    "timestamp": datetime.now().isoformat()
+                    "trait_affinity": self.personality.affinity(other_agent.personality),
+                    "timestamp": datetime.now()
                 }
             }
             
-        except Exception as e:
+        except Exception:
             self.state.confidence *= 0.9
-            raise Exception(f"Research collaboration failed: {str(e)}")
+            raise
             
     async def _gather_sources(self, query: ResearchQuery) -> List[ResearchSource]:
         """Gather relevant sources for the research query."""
         sources = []
-        try:
-            # Search knowledge base
-            kb_sources = await self._search_knowledge_base(query)
-            sources.extend(kb_sources)
-            
-            # Search external sources
-            external_sources = await self._search_external_sources(query)
-            sources.extend(external_sources)
-            
-            # Filter and rank sources
-            ranked_sources = self._rank_sources(sources, query)
-            
-            return ranked_sources
-            
-        except Exception as e:
-            raise Exception(f"Source gathering failed: {str(e)}")
+        # Search knowledge base
+        kb_sources = await self._search_knowledge_base(query)
+        sources.extend(kb_sources)
+        
+        # Search external sources
+        external_sources = await self._search_external_sources(query)
+        sources.extend(external_sources)
+        
+        # Drop duplicates (e.g. knowledge-base mirrors of external sources)
+        # so each source is validated only once; sources compare by key
+        unique = list(dict.fromkeys(sources))
+        
+        # Filter and rank sources
+        ranked_sources = self._rank_sources(unique, query)
+        
+        return ranked_sources
             
     async def _validate_sources(self, sources: List[ResearchSource]) -> List[ResearchSource]:
         """Validate and verify gathered sources."""
+        # Sources are checked independently, so check them concurrently (bounded)
+        checks = await asyncio.gather(*(self._check_source(source) for source in sources))
+        
         validated_sources = []
-        try:
-            for source in sources:
-                # Check credibility
-                credibility = self._assess_credibility(source)
-                
-                # Verify information
-                verification = self._verify_information(source)
-                
-                if credibility["score"] >= 0.7 and verification["status"] == "verified":
-                    source.credibility_score = credibility["score"]
-                    source.metadata["verification"] = verification
-                    validated_sources.append(source)
-                    
-            return validated_sources
-            
-        except Exception as e:
-            raise Exception(f"Source validation failed: {str(e)}")
-            
-    async def _extract_information(self, sources: List[ResearchSource]) -> List[Dict[str, Any]]:
-        """Extract relevant information from validated sources."""
-        findings = []
-        try:
-            for source in sources:
-                # Extract key points
-                key_points = self._extract_key_points(source)
-                
-                # Extract evidence
-                evidence = self._extract_evidence(source)
-                
-                # Extract relationships
-                relationships = self._extract_relationships(source)
+        for source, (credibility, verification) in zip(sources, checks):
+            if credibility["score"] >= 0.7 and verification["status"] == "verified":
+                source.credibility_score = credibility["score"]
+                source.metadata["verification"] = verification
+                validated_sources.append(source)
                 
-                findings.append({
-                    "source": source.title,
-                    "key_points": key_points,
-                    "evidence": evidence,
-                    "relationships": relationships,
-                    "metadata": {
-                        "credibility_score": source.credibility_score,
-                        "extraction_timestamp": datetime.now().isoformat()
-                    }
-                })
-                
-            return findings
-            
-        except Exception as e:
-            raise Exception(f"Information extraction failed: {str(e)}")
-            
+        return validated_sources
+            
+    async def _check_source(self, source: ResearchSource) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Assess credibility and verify information for one source, holding one validation slot."""
+        async with self._validation_slots:
+            # Reuse earlier credibility assessments of the same source
+            key = _source_key(source)
+            credibility = self.credibility_metrics.get(key)
+            if credibility is None:
+                credibility, verification = await asyncio.gather(
+                    self._assess_credibility(source),
+                    self._verify_information(source)
+                )
+                self.credibility_metrics[key] = credibility
+            else:
+                verification = await self._verify_information(source)
+            return credibility, verification
+            
+    def _start_extraction(self, sources: List[ResearchSource]) -> List["asyncio.Task[Dict[str, Any]]"]:
+        """Start extracting information from every validated source, one task per source."""
+        # Sources are independent, so extract from them concurrently (bounded);
+        # the whole batch shares one extraction timestamp
+        timestamp = datetime.now()
+        return [
+            asyncio.ensure_future(self._extract_source_information(source, timestamp))
+            for source in sources
+        ]
+        
+    async def _extract_source_information(self, source: ResearchSource, timestamp: datetime) -> Dict[str, Any]:
+        """Extract information from a single source, holding one extraction slot."""
+        async with self._extraction_slots:
+            return await self._run_sync(self._build_finding, source, timestamp)
+            
+    def _build_finding(self, source: ResearchSource, timestamp: datetime) -> Dict[str, Any]:
+        """Build the finding record for a single source."""
+        return {
+            "source": source.title,
+            "key_points": self._extract_key_points(source),
+            "evidence": self._extract_evidence(source),
+            "relationships": self._extract_relationships(source),
+            "metadata": {
+                "credibility_score": source.credibility_score,
+                "extraction_timestamp": timestamp
+            }
+        }
+        
     async def _analyze_findings(self, findings: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze extracted findings."""
-        try:
-            # Identify patterns
-            patterns = self._identify_patterns(findings)
-            
-            # Evaluate evidence
-            evidence_evaluation = self._evaluate_evidence(findings)
-            
-            # Generate insights
-            insights = self._generate_insights(findings, patterns)
-            
-            return {
-                "patterns": patterns,
-                "evidence_evaluation": evidence_evaluation,
-                "insights": insights,
-                "metadata": {
-                    "analysis_timestamp": datetime.now().isoformat(),
-                    "confidence_level": self.state.confidence
-                }
+        # Identify patterns
+        patterns = self._identify_patterns(findings)
+        
+        # Evaluate evidence
+        evidence_evaluation = self._evaluate_evidence(findings)
+        
+        # Generate insights
+        insights = self._generate_insights(findings, patterns)
+        
+        return {
+            "patterns": patterns,
+            "evidence_evaluation": evidence_evaluation,
+            "insights": insights,
+            "metadata": {
+                "analysis_timestamp": datetime.now(),
+                "confidence_level": self.state.confidence
             }
-            
-        except Exception as e:
-            raise Exception(f"Findings analysis failed: {str(e)}")
+        }
             
     # Helper methods (implement based on specific needs)
     async def _search_knowledge_base(self, query: ResearchQuery) -> List[ResearchSource]:
@@ -288,16 +412,20 @@ class ResearcherAgent(BaseAgent):
         return [ResearchSource("title", "external")]
         
     def _rank_sources(self, sources: List[ResearchSource], query: ResearchQuery) -> List[ResearchSource]:
-        """Rank sources by relevance and credibility."""
-        return sources
+        """Rank sources by a weighted blend of credibility and relevance, best first."""
+        count = len(sources)
+        credibility = np.fromiter((source.credibility_score for source in sources), dtype=np.float32, count=count)
+        relevance = np.fromiter((source.relevance_score for source in sources), dtype=np.float32, count=count)
+        scores = credibility * self.CREDIBILITY_WEIGHT + relevance * self.RELEVANCE_WEIGHT
+        return [sources[i] for i in np.argsort(-scores, kind="stable")]
         
-    def _assess_credibility(self, source: ResearchSource) -> Dict[str, Any]:
+    async def _assess_credibility(self, source: ResearchSource) -> Dict[str, Any]:
         """Assess the credibility of a source."""
-        return {"score": 0.8, "factors": []}
+        return dict(_assess_credibility_impl(source.url, source.title, source.source_type))
         
-    def _verify_information(self, source: ResearchSource) -> Dict[str, Any]:
+    async def _verify_information(self, source: ResearchSource) -> Dict[str, Any]:
         """Verify information from a source."""
-        return {"status": "verified", "details": []}
+        return dict(_verify_information_impl(source.url, source.title, source.source_type))
         
     def _extract_key_points(self, source: ResearchSource) -> List[Dict[str, Any]]:
         """Extract key points from a source."""
@@ -0,0 +1,70 @@
+"""
+Result Schemas
+Slotted, immutable result types returned by the Strategist and Synthesizer agents.
+The agents keep these objects internally (plan stores, histories, caches) and hand
+callers plain dicts via to_dict(), as the BaseAgent.process contract requires.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+@dataclass(slots=True, frozen=True)
+class StrategicOption:
+    """One candidate strategy for a given approach."""
+    approach: str
+    description: str
+    potential_outcomes: List[Dict[str, Any]]
+    resource_requirements: Dict[str, Any]
+    timeline: List[Dict[str, Any]]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the option's fields as a plain dict."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+@dataclass(slots=True, frozen=True)
+class StrategicPlan:
+    """The plan built around the selected strategic option."""
+    selected_approach: str
+    rationale: str
+    implementation_steps: List[Dict[str, Any]]
+    success_metrics: List[Dict[str, Any]]
+    contingency_plans: List[Dict[str, Any]]
+    resource_allocation: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the plan's fields as a plain dict."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+@dataclass(slots=True, frozen=True)
+class StrategicPlanResult:
+    """Everything produced by one strategic analysis."""
+    timestamp: datetime
+    plan_id: int
+    context_analysis: Dict[str, Any]
+    strategic_options: Tuple[StrategicOption, ...]
+    risk_assessment: Dict[str, List[Dict[str, Any]]]
+    strategic_plan: StrategicPlan
+    confidence: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a plain dict, with the nested options and plan as dicts too."""
+        data = {field: getattr(self, field) for field in self.__slots__}
+        data["strategic_options"] = [option.to_dict() for option in self.strategic_options]
+        data["strategic_plan"] = self.strategic_plan.to_dict()
+        return data
+
+@dataclass(slots=True, frozen=True)
+class SynthesisResult:
+    """Everything produced by one synthesis run."""
+    timestamp: datetime
+    concepts: List[Any]
+    patterns: List[Dict[str, Any]]
+    synthesis: Dict[str, Any]
+    framework: Dict[str, Any]
+    network_metrics: Dict[str, float]
+    confidence_score: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result's fields as a plain dict."""
+        return {field: getattr(self, field) for field in self.__slots__}
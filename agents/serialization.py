@@ -0,0 +1,204 @@
+"""
+Result Serialization
+Fast, deterministic encoding of agent results for logging, transport and cache keys.
+"""
+
+import hashlib
+import json
+import math
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache, wraps
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar, Union
+
+_T = TypeVar("_T")
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+    HAS_ORJSON = False
+
+if HAS_ORJSON:
+    _OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+def _default(obj: Any) -> Any:
+    """Convert types neither encoder handles natively into JSON-compatible values."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset)):
+        # Iteration order of a set depends on hashing, so elements are ordered by their encoding
+        return sorted(obj, key=dumps)
+    if isinstance(obj, (deque, tuple)):
+        return list(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    # numpy arrays orjson can't take zero-copy (e.g. Fortran-ordered) and numpy scalars
+    tolist = getattr(obj, "tolist", None)
+    if callable(tolist):
+        return tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+def _finite(obj: Any) -> Any:
+    """Replace NaN and infinities with None the way orjson does, for the standard library encoder."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact JSON bytes with sorted keys.
+    
+    Uses orjson when it is installed (numpy arrays are encoded natively)
+    and the standard library otherwise. Within one process the output for
+    equal objects is repeatable, sets included, so it is suitable as
+    cache-key material. Both encoders write NaN and infinities as null.
+    
+    The two encoders do not produce byte-identical output, so serialized
+    forms must not be compared across environments: orjson writes float32
+    values with float32 precision, while the standard library goes through
+    float64 (0.1 becomes 0.10000000149011612). Non-string keys are
+    converted to strings, so {1: a} and {"1": b} collide; the standard
+    library also cannot sort keys of mixed types and raises TypeError.
+    
+    Args:
+        obj: The object to serialize
+    
+    Returns:
+        UTF-8 encoded JSON
+    
+    Raises:
+        TypeError: If obj contains a value that cannot be serialized
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_default, option=_OPTIONS)
+    return json.dumps(
+        _finite(obj),
+        default=lambda value: _finite(_default(value)),
+        sort_keys=True,
+        separators=(",", ":")
+    ).encode()
+
+def stable_hash(obj: Any) -> str:
+    """Return a short, stable hex digest of obj's serialized form."""
+    return hashlib.blake2b(dumps(obj), digest_size=16).hexdigest()
+
+# Serialized forms up to this size are used as keys verbatim instead of being hashed
+_INLINE_KEY_BYTES = 256
+
+def canonical_key(obj: Any) -> Union[bytes, str]:
+    """
+    Return a compact key that is equal for structurally equal objects.
+    
+    Small objects use their serialized form directly; larger ones use its
+    digest so keys stay small.
+    
+    Raises:
+        TypeError: If obj contains a value that cannot be serialized
+    """
+    payload = dumps(obj)
+    if len(payload) <= _INLINE_KEY_BYTES:
+        return payload
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+class KeyedValue:
+    """
+    Wraps an arbitrary (possibly unhashable) value so it hashes and compares by
+    its canonical key, letting functools.lru_cache memoize functions of it.
+    """
+    __slots__ = ("key", "value")
+    
+    def __init__(self, value: Any):
+        self.key = canonical_key(value)
+        self.value = value
+        
+    def __hash__(self) -> int:
+        return hash(self.key)
+        
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, KeyedValue) and self.key == other.key
+
+def lru_cache_by_key(maxsize: int = 1024) -> Callable[[Callable[[Any], _T]], Callable[[Any], _T]]:
+    """
+    functools.lru_cache for single-argument functions of unhashable values.
+    
+    Calls are keyed by the argument's canonical_key; arguments that cannot be
+    serialized bypass the cache. The wrapper keeps cache_info/cache_clear.
+    """
+    def decorator(fn: Callable[[Any], _T]) -> Callable[[Any], _T]:
+        cached = lru_cache(maxsize=maxsize)(lambda keyed: fn(keyed.value))
+        
+        @wraps(fn)
+        def wrapper(value: Any) -> _T:
+            try:
+                keyed = KeyedValue(value)
+            except TypeError:
+                return fn(value)
+            return cached(keyed)
+            
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+class KeyedLRUCache(Generic[_T]):
+    """
+    Bounded LRU mapping from structurally equal inputs to a stored value.
+    
+    Inputs are keyed by their canonical_key, so only inputs that serialize
+    identically share an entry; inputs that cannot be serialized are never
+    cached.
+    """
+    __slots__ = ("maxsize", "_entries")
+    
+    def __init__(self, maxsize: int = 128):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, _T]" = OrderedDict()
+        
+    def __len__(self) -> int:
+        return len(self._entries)
+        
+    @staticmethod
+    def _key(obj: Any) -> Optional[Hashable]:
+        try:
+            return canonical_key(obj)
+        except TypeError:
+            return None
+            
+    def get(self, obj: Any) -> Optional[_T]:
+        """Return the value stored for an input equal to obj, or None."""
+        key = self._key(obj)
+        if key is None or key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+        
+    def put(self, obj: Any, value: _T):
+        """Store value for obj, evicting the least recently used entry when full."""
+        key = self._key(obj)
+        if key is None:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            
+    def clear(self):
+        """Drop every entry."""
+        self._entries.clear()
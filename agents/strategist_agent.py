@@ -3,10 +3,18 @@ Strategist Agent
 Specializes in long-term planning, goal setting, and strategic direction.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from .base_agent import BaseAgent, AgentPersonality
+from .schemas import StrategicOption, StrategicPlan, StrategicPlanResult
+from .serialization import KeyedLRUCache
 import asyncio
-import json
+import copy
+from datetime import datetime
+import itertools
+import numpy as np
+
+# Strategic approaches every analysis weighs; the same string objects key each risk assessment
+APPROACHES: Tuple[str, ...] = ("innovative", "conservative", "balanced")
 
 class StrategistAgent(BaseAgent):
     """
@@ -14,6 +22,9 @@ class StrategistAgent(BaseAgent):
     It evaluates long-term implications and sets strategic direction.
     """
     
+    # Number of past results kept for reuse on repeated inputs
+    RESULT_CACHE_SIZE = 128
+    
     def __init__(self):
         personality = AgentPersonality(
             name="Strategist",
@@ -34,8 +45,11 @@ class StrategistAgent(BaseAgent):
             description="Strategic thinker focused on long-term planning and direction"
         )
         super().__init__(personality)
-        self.strategic_plans: Dict[str, Any] = {}
+        self.strategic_plans: Dict[int, StrategicPlan] = {}
+        # Source of plan ids; unlike len(strategic_plans) + 1 it never hands out the same id twice
+        self._plan_counter = itertools.count(1)
         self.risk_assessments: Dict[str, List[Dict[str, Any]]] = {}
+        self._result_cache: KeyedLRUCache[StrategicPlanResult] = KeyedLRUCache(self.RESULT_CACHE_SIZE)
         
     async def process(self, input_data: Any) -> Dict[str, Any]:
         """
@@ -45,43 +59,52 @@ class StrategistAgent(BaseAgent):
             input_data: The data or problem to analyze strategically
             
         Returns:
-            Dict containing strategic analysis and recommendations
+            Dict containing the strategic analysis and recommendations
         """
         # Update state
-        await self.update_state({"current_task": "strategic_analysis"})
+        self.update_state({"current_task": "strategic_analysis"})
         
-        try:
-            # Analyze the problem context
-            context_analysis = await self._analyze_context(input_data)
-            
-            # Generate strategic options
-            strategic_options = await self._generate_strategic_options(context_analysis)
-            
-            # Assess risks for each option
-            risk_assessment = await self._assess_risks(strategic_options)
-            
-            # Formulate strategic plan
-            strategic_plan = await self._formulate_strategic_plan(
-                strategic_options,
-                risk_assessment
-            )
-            
-            # Store the plan
-            plan_id = str(len(self.strategic_plans) + 1)
-            self.strategic_plans[plan_id] = strategic_plan
-            
-            return {
-                "plan_id": plan_id,
-                "context_analysis": context_analysis,
-                "strategic_options": strategic_options,
-                "risk_assessment": risk_assessment,
-                "strategic_plan": strategic_plan,
-                "confidence": self.state.confidence
-            }
-            
-        except Exception as e:
-            self.state.confidence *= 0.8  # Reduce confidence on error
-            raise Exception(f"Strategic analysis failed: {str(e)}")
+        async with self._lock:
+            # Reuse the analysis of an identical earlier input
+            cached = self._result_cache.get(input_data)
+            if cached is not None:
+                return copy.deepcopy(cached).to_dict()
+                
+            try:
+                # Analyze the problem context
+                context_analysis = await self._analyze_context(input_data)
+                
+                # Generate strategic options
+                strategic_options = await self._generate_strategic_options(context_analysis)
+                
+                # Assess risks for each option
+                risk_assessment = await self._assess_risks(strategic_options)
+                
+                # Formulate strategic plan
+                strategic_plan = await self._formulate_strategic_plan(
+                    strategic_options,
+                    risk_assessment
+                )
+                
+                # Store the plan
+                plan_id = next(self._plan_counter)
+                self.strategic_plans[plan_id] = strategic_plan
+                
+                result = StrategicPlanResult(
+                    timestamp=datetime.now(),
+                    plan_id=plan_id,
+                    context_analysis=context_analysis,
+                    strategic_options=tuple(strategic_options),
+                    risk_assessment=risk_assessment,
+                    strategic_plan=strategic_plan,
+                    confidence=self.state.confidence
+                )
+                self._result_cache.put(input_data, copy.deepcopy(result))
+                return result.to_dict()
+                
+            except Exception as e:
+                self.state.confidence *= 0.8  # Reduce confidence on error
+                raise Exception(f"Strategic analysis failed: {str(e)}")
             
     async def collaborate(self, other_agent: 'BaseAgent', context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -95,28 +118,33 @@ class StrategistAgent(BaseAgent):
             Dict containing collaboration results
         """
         # Update state
-        await self.update_state({
+        self.update_state({
             "current_task": f"collaboration_with_{other_agent.personality.name}"
         })
         
         try:
-            # Get other agent's perspective
-            other_perspective = await other_agent.process(context)
-            
-            # Integrate perspectives
-            integrated_analysis = await self._integrate_perspectives(
-                context,
-                other_perspective
-            )
+            # Get other agent's perspective without holding our lock, so a partner that calls back into us can't deadlock
+            other_perspective = await self.consult(other_agent, context)
             
-            # Update strategic plans based on collaboration
-            await self._update_strategic_plans(integrated_analysis)
-            
-            return {
-                "integrated_analysis": integrated_analysis,
-                "collaboration_partner": other_agent.personality.name,
-                "updated_plans": self.strategic_plans
-            }
+            async with self._lock:
+                # Integrate perspectives
+                integrated_analysis = await self._integrate_perspectives(
+                    context,
+                    other_perspective
+                )
+                
+                # Update strategic plans based on collaboration
+                await self._update_strategic_plans(integrated_analysis)
+                
+                # The plans just changed, so every cached analysis is outdated
+                self._result_cache.clear()
+                self.invalidate_process_cache()
+                
+                return {
+                    "integrated_analysis": integrated_analysis,
+                    "collaboration_partner": other_agent.personality.name,
+                    "updated_plans": {plan_id: plan.to_dict() for plan_id, plan in self.strategic_plans.items()}
+                }
             
         except Exception as e:
             self.state.confidence *= 0.9  # Slight confidence reduction on collaboration error
@@ -135,65 +163,72 @@ class StrategistAgent(BaseAgent):
             "relevant_knowledge": knowledge
         }
         
-    async def _generate_strategic_options(self, context_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _generate_strategic_options(self, context_analysis: Dict[str, Any]) -> List[StrategicOption]:
         """Generate potential strategic options based on context analysis."""
-        options = []
-        
-        # Generate options based on different strategic approaches
-        approaches = ["innovative", "conservative", "balanced"]
-        for approach in approaches:
-            option = {
-                "approach": approach,
-                "description": self._generate_approach_description(approach, context_analysis),
-                "potential_outcomes": self._predict_outcomes(approach, context_analysis),
-                "resource_requirements": self._estimate_resources(approach),
-                "timeline": self._create_timeline(approach)
-            }
-            options.append(option)
-            
-        return options
+        # Options for the different strategic approaches are independent, so build them concurrently
+        return list(await asyncio.gather(
+            *(self._build_option(approach, context_analysis) for approach in APPROACHES)
+        ))
+        
+    async def _build_option(self, approach: str, context_analysis: Dict[str, Any]) -> StrategicOption:
+        """Build a single strategic option, running its independent parts concurrently."""
+        description, outcomes, resources, timeline = await asyncio.gather(
+            self._generate_approach_description(approach, context_analysis),
+            self._predict_outcomes(approach, context_analysis),
+            self._estimate_resources(approach),
+            self._create_timeline(approach)
+        )
+        return StrategicOption(
+            approach=approach,
+            description=description,
+            potential_outcomes=outcomes,
+            resource_requirements=resources,
+            timeline=timeline
+        )
         
-    async def _assess_risks(self, strategic_options: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    async def _assess_risks(self, strategic_options: List[StrategicOption]) -> Dict[str, List[Dict[str, Any]]]:
         """Assess risks for each strategic option."""
-        risk_assessment = {}
-        
-        for option in strategic_options:
-            risks = []
-            # Identify potential risks
-            operational_risks = self._identify_operational_risks(option)
-            strategic_risks = self._identify_strategic_risks(option)
-            external_risks = self._identify_external_risks(option)
-            
-            risks.extend(operational_risks)
-            risks.extend(strategic_risks)
-            risks.extend(external_risks)
-            
-            # Calculate risk scores
-            for risk in risks:
-                risk["score"] = self._calculate_risk_score(risk)
-                
-            risk_assessment[option["approach"]] = risks
+        assessments = await asyncio.gather(
+            *(self._assess_option_risks(option) for option in strategic_options)
+        )
+        return {
+            option.approach: risks
+            for option, risks in zip(strategic_options, assessments)
+        }
+        
+    async def _assess_option_risks(self, option: StrategicOption) -> List[Dict[str, Any]]:
+        """Identify and score the operational, strategic and external risks of one option."""
+        operational_risks, strategic_risks, external_risks = await asyncio.gather(
+            self._identify_operational_risks(option),
+            self._identify_strategic_risks(option),
+            self._identify_external_risks(option)
+        )
+        risks = [*operational_risks, *strategic_risks, *external_risks]
+        
+        # Score all risks at once
+        for risk, score in zip(risks, self._calculate_risk_scores(risks).tolist()):
+            risk["score"] = score
             
-        return risk_assessment
+        return risks
         
     async def _formulate_strategic_plan(
         self,
-        strategic_options: List[Dict[str, Any]],
+        strategic_options: List[StrategicOption],
         risk_assessment: Dict[str, List[Dict[str, Any]]]
-    ) -> Dict[str, Any]:
+    ) -> StrategicPlan:
         """Formulate a comprehensive strategic plan."""
         # Select best option based on analysis
         selected_option = self._select_best_option(strategic_options, risk_assessment)
         
         # Create detailed plan
-        return {
-            "selected_approach": selected_option["approach"],
-            "rationale": self._generate_rationale(selected_option, risk_assessment),
-            "implementation_steps": self._create_implementation_steps(selected_option),
-            "success_metrics": self._define_success_metrics(selected_option),
-            "contingency_plans": self._create_contingency_plans(selected_option, risk_assessment),
-            "resource_allocation": self._plan_resource_allocation(selected_option)
-        }
+        return StrategicPlan(
+            selected_approach=selected_option.approach,
+            rationale=self._generate_rationale(selected_option, risk_assessment),
+            implementation_steps=self._create_implementation_steps(selected_option),
+            success_metrics=self._define_success_metrics(selected_option),
+            contingency_plans=self._create_contingency_plans(selected_option, risk_assessment),
+            resource_allocation=self._plan_resource_allocation(selected_option)
+        )
         
     # Helper methods (implement based on specific needs)
     def _analyze_scope(self, input_data: Any) -> Dict[str, Any]:
@@ -208,71 +243,73 @@ class StrategistAgent(BaseAgent):
         """Analyze stakeholders and their interests."""
         return [{"stakeholder": "Implementation needed"}]
         
-    def _generate_approach_description(self, approach: str, context: Dict[str, Any]) -> str:
+    async def _generate_approach_description(self, approach: str, context: Dict[str, Any]) -> str:
         """Generate description for a strategic approach."""
         return "Implementation needed"
         
-    def _predict_outcomes(self, approach: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _predict_outcomes(self, approach: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Predict potential outcomes for an approach."""
         return [{"outcome": "Implementation needed"}]
         
-    def _estimate_resources(self, approach: str) -> Dict[str, Any]:
+    async def _estimate_resources(self, approach: str) -> Dict[str, Any]:
         """Estimate required resources for an approach."""
         return {"resources": "Implementation needed"}
         
-    def _create_timeline(self, approach: str) -> List[Dict[str, Any]]:
+    async def _create_timeline(self, approach: str) -> List[Dict[str, Any]]:
         """Create a timeline for an approach."""
         return [{"phase": "Implementation needed"}]
         
-    def _identify_operational_risks(self, option: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _identify_operational_risks(self, option: StrategicOption) -> List[Dict[str, Any]]:
         """Identify operational risks."""
         return [{"risk": "Implementation needed"}]
         
-    def _identify_strategic_risks(self, option: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _identify_strategic_risks(self, option: StrategicOption) -> List[Dict[str, Any]]:
         """Identify strategic risks."""
         return [{"risk": "Implementation needed"}]
         
-    def _identify_external_risks(self, option: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _identify_external_risks(self, option: StrategicOption) -> List[Dict[str, Any]]:
         """Identify external risks."""
         return [{"risk": "Implementation needed"}]
         
-    def _calculate_risk_score(self, risk: Dict[str, Any]) -> float:
-        """Calculate a risk score."""
-        return 0.5  # Implementation needed
+    def _calculate_risk_scores(self, risks: List[Dict[str, Any]]) -> np.ndarray:
+        """Score risks as probability times impact, clipped to [0, 1] (unrated risks: 0.5 x 1.0)."""
+        probabilities = np.fromiter((risk.get("probability", 0.5) for risk in risks), dtype=np.float64, count=len(risks))
+        impacts = np.fromiter((risk.get("impact", 1.0) for risk in risks), dtype=np.float64, count=len(risks))
+        return np.clip(probabilities * impacts, 0.0, 1.0)
         
     def _select_best_option(
         self,
-        options: List[Dict[str, Any]],
+        options: List[StrategicOption],
         risk_assessment: Dict[str, List[Dict[str, Any]]]
-    ) -> Dict[str, Any]:
+    ) -> StrategicOption:
         """Select the best strategic option."""
         return options[0]  # Implementation needed
         
     def _generate_rationale(
         self,
-        option: Dict[str, Any],
+        option: StrategicOption,
         risk_assessment: Dict[str, List[Dict[str, Any]]]
     ) -> str:
         """Generate rationale for selected option."""
         return "Implementation needed"
         
-    def _create_implementation_steps(self, option: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _create_implementation_steps(self, option: StrategicOption) -> List[Dict[str, Any]]:
         """Create detailed implementation steps."""
         return [{"step": "Implementation needed"}]
         
-    def _define_success_metrics(self, option: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _define_success_metrics(self, option: StrategicOption) -> List[Dict[str, Any]]:
         """Define metrics for measuring success."""
         return [{"metric": "Implementation needed"}]
         
     def _create_contingency_plans(
         self,
-        option: Dict[str, Any],
+        option: StrategicOption,
         risk_assessment: Dict[str, List[Dict[str, Any]]]
     ) -> List[Dict[str, Any]]:
         """Create contingency plans for identified risks."""
         return [{"plan": "Implementation needed"}]
         
-    def _plan_resource_allocation(self, option: Dict[str, Any]) -> Dict[str, Any]:
+    def _plan_resource_allocation(self, option: StrategicOption) -> Dict[str, Any]:
         """Plan resource allocation for implementation."""
         return {"allocation": "Implementation needed"}
         
@@ -3,21 +3,185 @@ Synthesizer Agent
 Specializes in connecting concepts, integrating perspectives, and finding common ground between different ideas.
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import Deque, Dict, Any, Iterator, List, Optional, Tuple
 from .base_agent import BaseAgent, AgentPersonality
+from ._graph_kernels import bfs_distance_sums, triangle_counts
+from .embeddings import HashingEmbedder
+from .schemas import SynthesisResult
+from .serialization import KeyedLRUCache
 import asyncio
+import copy
+import sys
+from collections import deque
 from datetime import datetime
-import networkx as nx
+from functools import lru_cache
+import numpy as np
 
 class ConceptNode:
     """Represents a concept node in the synthesis network."""
-    def __init__(self, concept: str, source: str, metadata: Dict[str, Any]):
-        self.concept = concept
+    def __init__(
+        self,
+        concept: str,
+        source: str,
+        metadata: Dict[str, Any],
+        timestamp: Optional[datetime] = None
+    ):
+        # Interned so the many lookups by name compare by identity
+        self.concept = sys.intern(concept)
         self.source = source
         self.metadata = metadata
-        self.connections: Set[str] = set()
         self.weight = 1.0
-        self.timestamp = datetime.now()
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
+        # Unit-length embedding of the concept, set during extraction
+        self.embedding: Optional[np.ndarray] = None
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the concept's descriptive fields as a plain dict (the embedding is left out)."""
+        return {
+            "concept": self.concept,
+            "source": self.source,
+            "metadata": self.metadata,
+            "weight": self.weight,
+            "timestamp": self.timestamp
+        }
+        
+    def neighbors(self, network: 'ConceptNetwork') -> np.ndarray:
+        """Positions of the concepts linked to this one in network (a view into its CSR arrays)."""
+        return network.neighbor_ids(self.concept)
+
+class ConceptNetwork:
+    """
+    Undirected, weighted concept graph stored as CSR adjacency arrays.
+    
+    Node i is nodes[i]; its neighbours are indices[indptr[i]:indptr[i + 1]]
+    with the matching edge strengths in strengths. Every edge is stored in
+    both directions.
+    """
+    __slots__ = ("nodes", "node_index", "indptr", "indices", "strengths")
+    
+    # Largest network whose average shortest path is computed exactly
+    EXACT_PATH_LIMIT = 200
+    
+    # Number of sampled search sources for larger networks
+    PATH_SAMPLE_SIZE = 64
+    
+    def __init__(
+        self,
+        nodes: Optional[List[ConceptNode]] = None,
+        rows: Optional[np.ndarray] = None,
+        cols: Optional[np.ndarray] = None,
+        strengths: Optional[np.ndarray] = None
+    ):
+        """
+        Args:
+            nodes: The concepts, one node each
+            rows, cols: Node positions of each undirected edge, one entry per edge
+            strengths: Strength of each edge
+        """
+        self.nodes = list(nodes or ())
+        self.node_index: Dict[str, int] = {
+            node.concept: i for i, node in enumerate(self.nodes)
+        }
+        n = len(self.nodes)
+        if rows is None:
+            rows = cols = np.empty(0, dtype=np.int32)
+            strengths = np.empty(0, dtype=np.float32)
+            
+        # Mirror every edge, then sort by (row, col) into CSR order
+        src = np.concatenate((rows, cols)).astype(np.int32)
+        dst = np.concatenate((cols, rows)).astype(np.int32)
+        data = np.concatenate((strengths, strengths)).astype(np.float32)
+        order = np.lexsort((dst, src))
+        self.indices = dst[order]
+        self.strengths = data[order]
+        self.indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+        
+    def __len__(self) -> int:
+        return len(self.nodes)
+        
+    def same_structure(self, other: 'ConceptNetwork') -> bool:
+        """Whether other links the same concepts in the same way (edge strengths aside)."""
+        return (
+            list(self.node_index) == list(other.node_index)
+            and np.array_equal(self.indptr, other.indptr)
+            and np.array_equal(self.indices, other.indices)
+        )
+        
+    @property
+    def num_edges(self) -> int:
+        """Number of undirected edges."""
+        return self.indices.size // 2
+        
+    def neighbor_ids(self, concept: str) -> np.ndarray:
+        """Positions of the concepts linked to concept, as a zero-copy int32 view."""
+        i = self.node_index[concept]
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+        
+    def neighbors(self, concept: str) -> List[str]:
+        """Names of the concepts linked to concept."""
+        return [self.nodes[j].concept for j in self.neighbor_ids(concept).tolist()]
+        
+    def edges(self) -> Iterator[Tuple[str, str, float]]:
+        """Yield each undirected edge once as (concept, concept, strength)."""
+        rows = np.repeat(np.arange(len(self.nodes)), np.diff(self.indptr))
+        upper = rows < self.indices
+        for i, j, strength in zip(
+            rows[upper].tolist(), self.indices[upper].tolist(), self.strengths[upper].tolist()
+        ):
+            yield self.nodes[i].concept, self.nodes[j].concept, strength
+            
+    def density(self) -> float:
+        """Fraction of possible edges present."""
+        n = len(self.nodes)
+        return self.indices.size / (n * (n - 1)) if n > 1 else 0.0
+        
+    def average_clustering(self) -> float:
+        """Mean local clustering coefficient; nodes with fewer than two neighbours count as 0."""
+        n = len(self.nodes)
+        if n == 0:
+            return 0.0
+        triangles = triangle_counts(self.indptr, self.indices)
+        degree = np.diff(self.indptr).astype(np.float64)
+        possible = degree * (degree - 1) / 2
+        coefficients = np.divide(triangles, possible, out=np.zeros(n), where=possible > 0)
+        return float(coefficients.mean())
+        
+    def average_shortest_path(self) -> float:
+        """
+        Mean hop distance over all ordered pairs of nodes, or inf if the network is disconnected.
+        
+        Networks of up to EXACT_PATH_LIMIT nodes search from every node. Larger
+        ones search from PATH_SAMPLE_SIZE randomly chosen sources (fixed seed,
+        so the estimate is repeatable) and average their mean distances, which
+        is unbiased with error shrinking as 1/sqrt(sample size).
+        """
+        n = len(self.nodes)
+        if n == 0:
+            return float('inf')
+        if n == 1:
+            return 0.0
+        if n <= self.EXACT_PATH_LIMIT:
+            sources = np.arange(n, dtype=np.int32)
+        else:
+            rng = np.random.default_rng(0)
+            sources = rng.choice(n, size=self.PATH_SAMPLE_SIZE, replace=False).astype(np.int32)
+        sums = bfs_distance_sums(self.indptr, self.indices, sources)
+        # In an undirected network one search reaching everything proves it connected
+        if sums[0, 1] < n:
+            return float('inf')
+        return float(sums[:, 0].mean()) / (n - 1)
+
+_EMBEDDER = HashingEmbedder()
+
+# A concept's embedding depends only on its name, so it is computed once and shared
+# by every node, network and round that mentions the concept
+@lru_cache(maxsize=100_000)
+def _concept_embedding(name: str) -> np.ndarray:
+    """Return the read-only unit-length embedding of a concept name."""
+    embedding = _EMBEDDER.encode(name)
+    embedding.flags.writeable = False
+    return embedding
 
 class SynthesizerAgent(BaseAgent):
     """
@@ -25,6 +189,18 @@ class SynthesizerAgent(BaseAgent):
     It excels at finding relationships and integrating diverse perspectives.
     """
     
+    # Minimum cosine similarity for two concepts to be linked in the network
+    RELATIONSHIP_THRESHOLD = 0.5
+    
+    # Number of past results kept for reuse on repeated inputs
+    RESULT_CACHE_SIZE = 128
+    
+    # Number of inputs whose concepts are identified together in one call
+    CONCEPT_BATCH_SIZE = 32
+    
+    # Maximum number of past syntheses kept in synthesis_history
+    HISTORY_MAX = 128
+    
     def __init__(self):
         personality = AgentPersonality(
             name="Synthesizer",
@@ -47,8 +223,14 @@ class SynthesizerAgent(BaseAgent):
             description="Integration specialist focused on connecting concepts and finding patterns"
         )
         super().__init__(personality)
-        self.concept_network = nx.Graph()
-        self.synthesis_history: List[Dict[str, Any]] = []
+        self._embedder = _EMBEDDER
+        self.concept_network = ConceptNetwork()
+        # Bumped whenever the network's structure changes; metrics are cached against it
+        self._graph_version = 0
+        self._metrics_cache_version = -1
+        self._metrics_cache: Dict[str, float] = {}
+        self._result_cache: KeyedLRUCache[SynthesisResult] = KeyedLRUCache(self.RESULT_CACHE_SIZE)
+        self.synthesis_history: Deque[SynthesisResult] = deque(maxlen=self.HISTORY_MAX)
         
     async def process(self, input_data: Any) -> Dict[str, Any]:
         """
@@ -58,42 +240,52 @@ class SynthesizerAgent(BaseAgent):
             input_data: The concepts or ideas to synthesize
             
         Returns:
-            Dict containing synthesis results and connections
+            Dict containing the synthesis results and connections
         """
-        await self.update_state({"current_task": "concept_synthesis"})
+        self.update_state({"current_task": "concept_synthesis"})
         
-        try:
-            # Extract concepts
-            concepts = await self._extract_concepts(input_data)
-            
-            # Build concept network
-            network = await self._build_concept_network(concepts)
-            
-            # Identify patterns and relationships
-            patterns = await self._identify_patterns(network)
-            
-            # Generate synthesis
-            synthesis = await self._generate_synthesis(network, patterns)
-            
-            # Create integration framework
-            framework = await self._create_integration_framework(synthesis)
-            
-            result = {
-                "timestamp": datetime.now().isoformat(),
-                "concepts": concepts,
-                "patterns": patterns,
-                "synthesis": synthesis,
-                "framework": framework,
-                "network_metrics": self._calculate_network_metrics(),
-                "confidence_score": self.state.confidence
-            }
-            
-            self.synthesis_history.append(result)
-            return result
-            
-        except Exception as e:
-            self.state.confidence *= 0.8
-            raise Exception(f"Synthesis process failed: {str(e)}")
+        async with self._lock:
+            # Reuse the synthesis of an identical earlier input
+            cached = self._result_cache.get(input_data)
+            if cached is not None:
+                return copy.deepcopy(cached).to_dict()
+                
+            try:
+                # One clock reading stamps the concepts, the synthesis and the result alike
+                now = datetime.now()
+                
+                # Extract concepts
+                concepts = await self._extract_concepts(input_data, now)
+                
+                # Build concept network
+                network = await self._build_concept_network(concepts)
+                
+                # Identify patterns and relationships
+                patterns = await self._identify_patterns(network)
+                
+                # Generate synthesis
+                synthesis = await self._generate_synthesis(network, patterns, now)
+                
+                # Create integration framework
+                framework = await self._create_integration_framework(synthesis)
+                
+                result = SynthesisResult(
+                    timestamp=now,
+                    concepts=concepts,
+                    patterns=patterns,
+                    synthesis=synthesis,
+                    framework=framework,
+                    network_metrics=self._calculate_network_metrics(),
+                    confidence_score=self.state.confidence
+                )
+                
+                self.synthesis_history.append(result)
+                self._result_cache.put(input_data, copy.deepcopy(result))
+                return result.to_dict()
+                
+            except Exception as e:
+                self.state.confidence *= 0.8
+                raise Exception(f"Synthesis process failed: {str(e)}")
             
     async def collaborate(self, other_agent: 'BaseAgent', context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -106,13 +298,13 @@ class SynthesizerAgent(BaseAgent):
         Returns:
             Dict containing collaborative synthesis results
         """
-        await self.update_state({
+        self.update_state({
             "current_task": f"collaborative_synthesis_with_{other_agent.personality.name}"
         })
         
         try:
             # Get other agent's perspective
-            other_perspective = await other_agent.process(context)
+            other_perspective = await self.consult(other_agent, context)
             
             # Integrate perspectives
             integrated_concepts = await self._integrate_perspectives(
@@ -138,7 +330,7 @@ class SynthesizerAgent(BaseAgent):
                 "synthesis_framework": synthesis_framework,
                 "collaboration_metadata": {
                     "partner": other_agent.personality.name,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": datetime.now()
                 }
             }
             
@@ -146,60 +338,61 @@ class SynthesizerAgent(BaseAgent):
             self.state.confidence *= 0.9
             raise Exception(f"Collaborative synthesis failed: {str(e)}")
             
-    async def _extract_concepts(self, input_data: Any) -> List[ConceptNode]:
-        """Extract key concepts from input data."""
-        concepts = []
+    async def _extract_concepts(self, input_data: Any, timestamp: Optional[datetime] = None) -> List[ConceptNode]:
+        """Extract key concepts from input data, stamping every node with the same timestamp."""
+        timestamp = timestamp if timestamp is not None else datetime.now()
         try:
-            # Implement concept extraction logic
-            raw_concepts = self._identify_key_concepts(input_data)
+            # Identify concepts for a whole batch of inputs per call instead of one input at a time
+            items = list(input_data) if isinstance(input_data, (list, tuple)) else [input_data]
+            raw_concepts = [
+                concept
+                for start in range(0, len(items), self.CONCEPT_BATCH_SIZE)
+                for concept in self._identify_key_concepts(items[start:start + self.CONCEPT_BATCH_SIZE])
+            ]
             
             # Create concept nodes
-            for concept in raw_concepts:
-                node = ConceptNode(
+            concepts = [
+                ConceptNode(
                     concept=concept["name"],
                     source=concept["source"],
-                    metadata=concept["metadata"]
+                    metadata=concept["metadata"],
+                    timestamp=timestamp
                 )
-                concepts.append(node)
+                for concept in raw_concepts
+            ]
+            
+            # Attach embeddings, reusing those of concepts seen in earlier rounds
+            for concept in concepts:
+                concept.embedding = _concept_embedding(concept.concept)
                 
             return concepts
             
         except Exception as e:
             raise Exception(f"Concept extraction failed: {str(e)}")
             
-    async def _build_concept_network(self, concepts: List[ConceptNode]) -> nx.Graph:
+    async def _build_concept_network(self, concepts: List[ConceptNode]) -> ConceptNetwork:
         """Build a network of related concepts."""
         try:
-            # Create new network
-            network = nx.Graph()
-            
-            # Add nodes
-            for concept in concepts:
-                network.add_node(
-                    concept.concept,
-                    source=concept.source,
-                    metadata=concept.metadata,
-                    weight=concept.weight
-                )
+            # One node per concept name; a repeated name keeps its first position and latest node
+            nodes = list({concept.concept: concept for concept in concepts}.values())
+            
+            # Link every pair of concepts whose embeddings are similar enough,
+            # scoring all pairs with a single matrix product
+            if len(nodes) > 1:
+                embeddings = np.vstack([node.embedding for node in nodes])
+                similarity = embeddings @ embeddings.T
+                rows, cols = np.nonzero(np.triu(similarity > self.RELATIONSHIP_THRESHOLD, k=1))
+                network = ConceptNetwork(nodes, rows, cols, similarity[rows, cols])
+            else:
+                network = ConceptNetwork(nodes)
                 
-            # Add edges based on relationships
-            for i, concept1 in enumerate(concepts):
-                for concept2 in concepts[i+1:]:
-                    relationship = self._analyze_relationship(concept1, concept2)
-                    if relationship["strength"] > 0:
-                        network.add_edge(
-                            concept1.concept,
-                            concept2.concept,
-                            **relationship
-                        )
-                        
-            self.concept_network = network
+            self._set_concept_network(network)
             return network
             
         except Exception as e:
             raise Exception(f"Network building failed: {str(e)}")
             
-    async def _identify_patterns(self, network: nx.Graph) -> List[Dict[str, Any]]:
+    async def _identify_patterns(self, network: ConceptNetwork) -> List[Dict[str, Any]]:
         """Identify patterns in the concept network."""
         patterns = []
         try:
@@ -222,8 +415,9 @@ class SynthesizerAgent(BaseAgent):
             
     async def _generate_synthesis(
         self,
-        network: nx.Graph,
-        patterns: List[Dict[str, Any]]
+        network: ConceptNetwork,
+        patterns: List[Dict[str, Any]],
+        timestamp: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Generate synthesis from network and patterns."""
         try:
@@ -241,9 +435,9 @@ class SynthesizerAgent(BaseAgent):
                 "connections": connections,
                 "framework": framework,
                 "metadata": {
-                    "network_size": len(network.nodes),
+                    "network_size": len(network),
                     "pattern_count": len(patterns),
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp if timestamp is not None else datetime.now()
                 }
             }
             
@@ -251,35 +445,31 @@ class SynthesizerAgent(BaseAgent):
             raise Exception(f"Synthesis generation failed: {str(e)}")
             
     # Helper methods (implement based on specific needs)
-    def _identify_key_concepts(self, input_data: Any) -> List[Dict[str, Any]]:
-        """Identify key concepts from input data."""
+    def _identify_key_concepts(self, batch: List[Any]) -> List[Dict[str, Any]]:
+        """Identify key concepts across a batch of inputs in one pass (one structured request per batch)."""
         return [{"name": "concept", "source": "input", "metadata": {}}]
         
-    def _analyze_relationship(self, concept1: ConceptNode, concept2: ConceptNode) -> Dict[str, Any]:
-        """Analyze relationship between two concepts."""
-        return {"strength": 0.0, "type": "none"}
-        
-    def _find_structural_patterns(self, network: nx.Graph) -> List[Dict[str, Any]]:
+    def _find_structural_patterns(self, network: ConceptNetwork) -> List[Dict[str, Any]]:
         """Find structural patterns in the network."""
         return [{"pattern": "Implementation needed"}]
         
-    def _find_semantic_patterns(self, network: nx.Graph) -> List[Dict[str, Any]]:
+    def _find_semantic_patterns(self, network: ConceptNetwork) -> List[Dict[str, Any]]:
         """Find semantic patterns in the network."""
         return [{"pattern": "Implementation needed"}]
         
-    def _find_temporal_patterns(self, network: nx.Graph) -> List[Dict[str, Any]]:
+    def _find_temporal_patterns(self, network: ConceptNetwork) -> List[Dict[str, Any]]:
         """Find temporal patterns in the network."""
         return [{"pattern": "Implementation needed"}]
         
     def _extract_insights(
         self,
-        network: nx.Graph,
+        network: ConceptNetwork,
         patterns: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Extract insights from network and patterns."""
         return [{"insight": "Implementation needed"}]
         
-    def _generate_connections(self, network: nx.Graph) -> List[Dict[str, Any]]:
+    def _generate_connections(self, network: ConceptNetwork) -> List[Dict[str, Any]]:
         """Generate connections between concepts."""
         return [{"connection": "Implementation needed"}]
         
@@ -291,14 +481,22 @@ class SynthesizerAgent(BaseAgent):
         """Create a framework for synthesis."""
         return {"framework": "Implementation needed"}
         
+    def _set_concept_network(self, network: ConceptNetwork):
+        """Replace the concept network, bumping the graph version only if its structure changed."""
+        if not network.same_structure(self.concept_network):
+            self._graph_version += 1
+        self.concept_network = network
+        
     def _calculate_network_metrics(self) -> Dict[str, float]:
-        """Calculate metrics for the concept network."""
-        return {
-            "density": nx.density(self.concept_network),
-            "average_clustering": nx.average_clustering(self.concept_network),
-            "average_shortest_path": nx.average_shortest_path_length(self.concept_network)
-            if nx.is_connected(self.concept_network) else float('inf')
-        }
+        """Calculate metrics for the concept network, reusing them while its structure is unchanged."""
+        if self._metrics_cache_version != self._graph_version:
+            self._metrics_cache = {
+                "density": self.concept_network.density(),
+                "average_clustering": self.concept_network.average_clustering(),
+                "average_shortest_path": self.concept_network.average_shortest_path()
+            }
+            self._metrics_cache_version = self._graph_version
+        return dict(self._metrics_cache)
         
     async def _create_integration_framework(self, synthesis: Dict[str, Any]) -> Dict[str, Any]:
         """Create a framework for integrating concepts."""
@@ -2,9 +2,12 @@
 Configuration management for the Multi-Agent Think Tank system.
 """
 
-from typing import Dict, Any, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 from pathlib import Path
-from pydantic import BaseModel, BaseSettings
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from decouple import config
 
 class AgentConfig(BaseModel):
@@ -16,6 +19,8 @@ class AgentConfig(BaseModel):
     llm_model: str
     temperature: float
     max_tokens: int
+    
+    model_config = ConfigDict(frozen=True)
 
 class WorkflowConfig(BaseModel):
     """Configuration for workflow nodes."""
@@ -23,78 +28,83 @@ class WorkflowConfig(BaseModel):
     max_iterations: int
     timeout_seconds: int
     auto_loop: bool
+    
+    model_config = ConfigDict(frozen=True)
+
+# Default agent settings; read-only, so every SystemConfig shares them
+_DEFAULT_AGENTS: Mapping[str, AgentConfig] = MappingProxyType({
+    "strategist": AgentConfig(
+        name="Strategist",
+        role="Long-term planning and direction",
+        traits={"analytical": 0.8, "strategic": 0.9, "creative": 0.6},
+        expertise=["strategic planning", "goal setting", "risk assessment"],
+        llm_model="gpt-4",
+        temperature=0.7,
+        max_tokens=1000
+    ),
+    "analyst": AgentConfig(
+        name="Analyst",
+        role="Data-driven pattern recognition",
+        traits={"analytical": 0.95, "detail_oriented": 0.9, "systematic": 0.85},
+        expertise=["data analysis", "pattern recognition", "statistical inference"],
+        llm_model="gpt-4",
+        temperature=0.3,
+        max_tokens=1000
+    ),
+    "creative": AgentConfig(
+        name="Creative Thinker",
+        role="Novel idea generation",
+        traits={"creative": 0.95, "intuitive": 0.8, "open_minded": 0.9},
+        expertise=["brainstorming", "innovation", "lateral thinking"],
+        llm_model="gpt-4",
+        temperature=0.9,
+        max_tokens=1000
+    ),
+    "synthesizer": AgentConfig(
+        name="Synthesizer",
+        role="Concept connection and integration",
+        traits={"analytical": 0.7, "creative": 0.7, "systematic": 0.8},
+        expertise=["concept integration", "pattern synthesis", "knowledge mapping"],
+        llm_model="gpt-4",
+        temperature=0.6,
+        max_tokens=1000
+    ),
+    "implementer": AgentConfig(
+        name="Implementer",
+        role="Practical execution planning",
+        traits={"practical": 0.9, "detail_oriented": 0.85, "systematic": 0.8},
+        expertise=["execution planning", "resource allocation", "task management"],
+        llm_model="gpt-4",
+        temperature=0.4,
+        max_tokens=1000
+    ),
+    "researcher": AgentConfig(
+        name="Researcher",
+        role="Deep knowledge exploration",
+        traits={"analytical": 0.85, "thorough": 0.9, "curious": 0.8},
+        expertise=["research methodology", "information synthesis", "knowledge discovery"],
+        llm_model="gpt-4",
+        temperature=0.5,
+        max_tokens=1000
+    ),
+    "challenger": AgentConfig(
+        name="Challenger",
+        role="Critical evaluation",
+        traits={"critical": 0.9, "analytical": 0.8, "objective": 0.85},
+        expertise=["critical analysis", "risk assessment", "assumption testing"],
+        llm_model="gpt-4",
+        temperature=0.6,
+        max_tokens=1000
+    )
+})
 
 class SystemConfig(BaseSettings):
-    """Main system configuration."""
+    """Main system configuration. Frozen, since load_config() hands one instance to every caller."""
     # API Configuration
     openai_api_key: str = config('OPENAI_API_KEY', default='')
     
     # Agent Settings
-    agents: Dict[str, AgentConfig] = {
-        "strategist": AgentConfig(
-            name="Strategist",
-            role="Long-term planning and direction",
-            traits={"analytical": 0.8, "strategic": 0.9, "creative": 0.6},
-            expertise=["strategic planning", "goal setting", "risk assessment"],
-            llm_model="gpt-4",
-            temperature=0.7,
-            max_tokens=1000
-        ),
-        "analyst": AgentConfig(
-            name="Analyst",
-            role="Data-driven pattern recognition",
-            traits={"analytical": 0.95, "detail_oriented": 0.9, "systematic": 0.85},
-            expertise=["data analysis", "pattern recognition", "statistical inference"],
-            llm_model="gpt-4",
-            temperature=0.3,
-            max_tokens=1000
-        ),
-        "creative": AgentConfig(
-            name="Creative Thinker",
-            role="Novel idea generation",
-            traits={"creative": 0.95, "intuitive": 0.8, "open_minded": 0.9},
-            expertise=["brainstorming", "innovation", "lateral thinking"],
-            llm_model="gpt-4",
-            temperature=0.9,
-            max_tokens=1000
-        ),
-        "synthesizer": AgentConfig(
-            name="Synthesizer",
-            role="Concept connection and integration",
-            traits={"analytical": 0.7, "creative": 0.7, "systematic": 0.8},
-            expertise=["concept integration", "pattern synthesis", "knowledge mapping"],
-            llm_model="gpt-4",
-            temperature=0.6,
-            max_tokens=1000
-        ),
-        "implementer": AgentConfig(
-            name="Implementer",
-            role="Practical execution planning",
-            traits={"practical": 0.9, "detail_oriented": 0.85, "systematic": 0.8},
-            expertise=["execution planning", "resource allocation", "task management"],
-            llm_model="gpt-4",
-            temperature=0.4,
-            max_tokens=1000
-        ),
-        "researcher": AgentConfig(
-            name="Researcher",
-            role="Deep knowledge exploration",
-            traits={"analytical": 0.85, "thorough": 0.9, "curious": 0.8},
-            expertise=["research methodology", "information synthesis", "knowledge discovery"],
-            llm_model="gpt-4",
-            temperature=0.5,
-            max_tokens=1000
-        ),
-        "challenger": AgentConfig(
-            name="Challenger",
-            role="Critical evaluation",
-            traits={"critical": 0.9, "analytical": 0.8, "objective": 0.85},
-            expertise=["critical analysis", "risk assessment", "assumption testing"],
-            llm_model="gpt-4",
-            temperature=0.6,
-            max_tokens=1000
-        )
-    }
+    agents: Mapping[str, AgentConfig] = Field(default_factory=lambda: _DEFAULT_AGENTS)
     
     # Workflow Settings
     workflow: WorkflowConfig = WorkflowConfig(
@@ -110,10 +120,20 @@ class SystemConfig(BaseSettings):
     log_level: str = config('LOG_LEVEL', default='INFO')
     max_concurrent_tasks: int = config('MAX_CONCURRENT_TASKS', default=3, cast=int)
     
-    class Config:
-        env_file = '.env'
-        env_file_encoding = 'utf-8'
+    model_config = SettingsConfigDict(env_file='.env', env_file_encoding='utf-8', frozen=True)
+    
+    @field_validator('agents', mode='after')
+    @classmethod
+    def _read_only_agents(cls, agents: Mapping[str, AgentConfig]) -> Mapping[str, AgentConfig]:
+        """Wrap agent settings passed in by the caller in a read-only view."""
+        return MappingProxyType(dict(agents))
+        
+    @field_serializer('agents')
+    def _agents_as_dict(self, agents: Mapping[str, AgentConfig]) -> Dict[str, AgentConfig]:
+        """Dump the read-only view as a plain dict."""
+        return dict(agents)
 
+@lru_cache(maxsize=1)
 def load_config() -> SystemConfig:
-    """Load and return the system configuration."""
+    """Load and return the system configuration, built once per process."""
     return SystemConfig()
@@ -1,14 +1,24 @@
-import os
 import requests
+import shlex
+import subprocess
 import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def create_github_repo(token):
-    """Create a new GitHub repository using the GitHub API."""
-    headers = {
+def create_session(token):
+    """Create an authenticated GitHub API session that reuses its connections."""
+    session = requests.Session()
+    session.headers.update({
         'Authorization': f'token {token}',
         'Accept': 'application/vnd.github.v3+json'
-    }
-    
+    })
+    # Transient gateway errors are retried with backoff; POSTs are not, so a repo is never created twice
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries))
+    return session
+
+def create_github_repo(session):
+    """Create a new GitHub repository using the GitHub API."""
     data = {
         'name': 'multi-agent-think-tank',
         'description': 'A sophisticated multi-agent system that leverages collaborative AI agents for complex problem-solving and analysis',
@@ -18,9 +28,8 @@ def create_github_repo(token):
         'has_wiki': True
     }
     
-    response = requests.post(
+    response = session.post(
         'https://api.github.com/user/repos',
-        headers=headers,
         json=data
     )
     
@@ -35,9 +44,13 @@ def create_github_repo(token):
 
 def setup_git_remote(clone_url):
     """Set up the Git remote and push the code."""
-    os.system('git remote add origin ' + clone_url)
-    os.system('git branch -M main')
-    os.system('git push -u origin main')
+    # One shell for all three steps; && stops at the first failure and check=True raises on it.
+    # clone_url is quoted, so it is never parsed as shell syntax
+    subprocess.run(
+        f"git remote add origin {shlex.quote(clone_url)} && git branch -M main && git push -u origin main",
+        shell=True,
+        check=True
+    )
 
 if __name__ == "__main__":
     if len(sys.argv) != 2:
@@ -45,7 +58,8 @@ if __name__ == "__main__":
         sys.exit(1)
         
     token = sys.argv[1]
-    clone_url = create_github_repo(token)
+    with create_session(token) as session:
+        clone_url = create_github_repo(session)
     
     if clone_url:
         setup_git_remote(clone_url)
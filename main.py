@@ -7,10 +7,21 @@ and manages the workflow execution.
 
 import asyncio
 import logging
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Generic, Optional, Tuple, TypeVar
 from pathlib import Path
 from rich.console import Console
 from rich.logging import RichHandler
+from agents.base_agent import BaseAgent
+from workflow.base_node import BaseWorkflowNode, TASK_STARTED, TASK_COMPLETED, TASK_FAILED
+from workflow.scheduler import WorkflowScheduler
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:  # pragma: no cover - not available on Windows
+    uvloop = None
+    HAS_UVLOOP = False
 
 # Configure logging
 logging.basicConfig(
@@ -21,13 +32,52 @@ logging.basicConfig(
 logger = logging.getLogger("think_tank")
 console = Console()
 
+_T = TypeVar("_T")
+
+@dataclass(slots=True)
+class Registry(Generic[_T]):
+    """Named components, looked up by name or iterated in registration order."""
+    by_name: Dict[str, _T] = field(default_factory=dict)
+    ordered: List[_T] = field(default_factory=list)
+    
+    def add(self, name: str, item: _T):
+        """Register item under name, replacing any earlier item with that name."""
+        previous = self.by_name.get(name)
+        if previous is not None:
+            self.ordered.remove(previous)
+        self.by_name[name] = item
+        self.ordered.append(item)
+        
+    def __len__(self) -> int:
+        return len(self.ordered)
+
+class AgentRegistry(Registry[BaseAgent]):
+    """Agents keyed by their normalized personality name."""
+    __slots__ = ()
+    
+    def add_agent(self, agent: BaseAgent):
+        """Register an agent under its normalized name."""
+        self.add(agent.personality.normalized_name, agent)
+
+class NodeRegistry(Registry[BaseWorkflowNode]):
+    """Workflow nodes keyed by their configured name."""
+    __slots__ = ()
+    
+    def add_node(self, node: BaseWorkflowNode):
+        """Register a workflow node under its name."""
+        self.add(node.config.name, node)
+
 class ThinkTank:
     """Main orchestrator for the Multi-Agent Think Tank system."""
     
     def __init__(self):
-        self.agents = {}
-        self.workflow = {}
-        self.knowledge_bases = {}
+        self.agents = AgentRegistry()
+        self.workflow = NodeRegistry()
+        self.scheduler: Optional[WorkflowScheduler] = None
+        # Node lifecycle events, handled by _orchestrator_loop while nodes keep running
+        self.events: asyncio.Queue = asyncio.Queue()
+        self._orchestrator: Optional[asyncio.Task] = None
+        self.knowledge_bases: Registry[Any] = Registry()
         self.config = self._load_config()
         
     def _load_config(self) -> Dict[str, Any]:
@@ -42,8 +92,36 @@ class ThinkTank:
         
     async def setup_workflow(self):
         """Set up the workflow nodes and their connections."""
-        # TODO: Implement workflow setup
-        pass
+        # TODO: Create the workflow nodes and their connections
+        # Sorts the workflow once; raises ValueError if it is not a DAG
+        self.scheduler = WorkflowScheduler(self.workflow.ordered)
+        for node in self.workflow.ordered:
+            node.events = self.events
+        if self._orchestrator is None:
+            self._orchestrator = asyncio.create_task(self._orchestrator_loop())
+            
+    async def _orchestrator_loop(self):
+        """Handle node lifecycle events as they arrive."""
+        while True:
+            event = await self.events.get()
+            try:
+                self._dispatch_event(event)
+            except Exception as e:
+                logger.error(f"Failed to handle workflow event {event[:2]}: {str(e)}", exc_info=True)
+            finally:
+                self.events.task_done()
+                
+    def _dispatch_event(self, event: Tuple[Any, ...]):
+        """React to a single node lifecycle event."""
+        kind, node_name = event[0], event[1]
+        if kind == TASK_STARTED:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Node {node_name} started")
+        elif kind == TASK_COMPLETED:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Node {node_name} completed")
+        elif kind == TASK_FAILED:
+            logger.warning(f"Node {node_name} failed: {event[2]}")
         
     async def load_knowledge_bases(self):
         """Load knowledge bases for each agent."""
@@ -79,7 +157,9 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # uvloop's libuv-based loop schedules coroutines faster than the default one
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if HAS_UVLOOP else None) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         logger.info("Application terminated by user")
     except Exception as e:
@@ -0,0 +1,39 @@
+"""Shared fixtures for the test suite."""
+
+import importlib
+import sys
+
+import pytest
+
+from agents._jit import HAS_NUMBA
+
+def _import_without_numba(name: str, monkeypatch: pytest.MonkeyPatch):
+    """Import a fresh copy of module name with numba hidden, restored when the test ends."""
+    monkeypatch.setitem(sys.modules, "numba", None)
+    for module_name in ("agents._jit", name):
+        package_name, _, attribute = module_name.rpartition(".")
+        package = sys.modules[package_name]
+        if hasattr(package, attribute):
+            # Importing rebinds the package attribute too, so it has to be restored as well
+            monkeypatch.setattr(package, attribute, getattr(package, attribute))
+        monkeypatch.delitem(sys.modules, module_name, raising=False)
+    return importlib.import_module(name)
+
+@pytest.fixture(params=[pytest.param(True, id="numba"), pytest.param(False, id="python")])
+def load_kernels(request, monkeypatch):
+    """
+    Return a loader for kernel modules, run once compiled and once as plain Python.
+    
+    The plain-Python run imports the module with numba hidden, so it takes
+    the same fallback path as an installation without numba.
+    """
+    if request.param and not HAS_NUMBA:
+        pytest.skip("numba is not installed")
+        
+    def load(name: str):
+        if request.param:
+            return importlib.import_module(name)
+        module = _import_without_numba(name, monkeypatch)
+        assert not module.njit.__module__.startswith("numba")
+        return module
+    return load
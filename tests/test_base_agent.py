@@ -0,0 +1,155 @@
+"""Tests for the agent base class: shared personalities, the process() cache and consultation."""
+
+import asyncio
+
+import pytest
+
+from agents.base_agent import AgentPersonality, BaseAgent
+from agents.strategist_agent import StrategistAgent
+
+class CountingAgent(BaseAgent):
+    """Agent that counts its process() calls and can be told to fail."""
+    PROCESS_CACHE_SIZE = 2
+    PROCESS_CACHE_MIN_BYTES = 0
+    
+    def __init__(self):
+        super().__init__(AgentPersonality(name="Counter", traits={"analytical": 0.5}, expertise=["counting"], description=""))
+        self.calls = 0
+        self.fail = False
+        
+    async def process(self, input_data):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("failed")
+        return {"echo": input_data, "call": self.calls}
+
+def test_personality_copies_and_freezes_its_inputs():
+    traits, expertise = {"analytical": 0.5}, ["maths"]
+    personality = AgentPersonality(name="Some Name", traits=traits, expertise=expertise, description="")
+    traits["analytical"] = 0.9
+    expertise.append("physics")
+    
+    assert personality.traits == {"analytical": 0.5}
+    assert personality.expertise == ("maths",)
+    assert personality.trait_vec[AgentPersonality.TRAIT_NAMES.index("analytical")] == 0.5
+    assert personality.normalized_name == "some name"
+    with pytest.raises(TypeError):
+        personality.traits["analytical"] = 1.0
+    assert personality.to_dict() == {
+        "name": "Some Name", "traits": {"analytical": 0.5}, "expertise": ["maths"], "description": ""
+    }
+
+def test_affinity_is_the_trait_dot_product():
+    a = AgentPersonality(name="a", traits={"analytical": 0.5, "creative": 1.0}, expertise=[], description="")
+    b = AgentPersonality(name="b", traits={"analytical": 0.4, "critical": 1.0}, expertise=[], description="")
+    assert a.affinity(b) == pytest.approx(0.2)
+
+def test_identical_inputs_are_processed_once():
+    agent = CountingAgent()
+    
+    async def main():
+        concurrent = await asyncio.gather(*(agent.process_cached({"q": 1}) for _ in range(3)))
+        later = await agent.process_cached({"q": 1})
+        return concurrent, later
+        
+    concurrent, later = asyncio.run(main())
+    assert agent.calls == 1
+    assert all(result == {"echo": {"q": 1}, "call": 1} for result in [*concurrent, later])
+
+def test_callers_get_independent_copies():
+    agent = CountingAgent()
+    
+    async def main():
+        first, second = await asyncio.gather(agent.process_cached({"q": [1]}), agent.process_cached({"q": [1]}))
+        first["echo"]["q"].append(2)
+        return first, second, await agent.process_cached({"q": [1]})
+        
+    first, second, later = asyncio.run(main())
+    assert agent.calls == 1
+    assert first is not second
+    assert second["echo"] == later["echo"] == {"q": [1]}
+
+def test_invalidation_forgets_cached_results():
+    agent = CountingAgent()
+    
+    async def main():
+        await agent.process_cached({"q": 1})
+        agent.invalidate_process_cache()
+        return await agent.process_cached({"q": 1})
+        
+    assert asyncio.run(main())["call"] == 2
+
+def test_agents_with_side_effects_are_never_cached():
+    agent = CountingAgent()
+    agent.PROCESS_CACHEABLE = False
+    
+    async def main():
+        await agent.process_cached({"q": 1})
+        await agent.process_cached({"q": 1})
+        
+    asyncio.run(main())
+    assert agent.calls == 2
+
+class StaticKnowledgeBase:
+    """Knowledge base that echoes every query."""
+    
+    async def query(self, query):
+        return {"query": query}
+
+def test_strategist_collaboration_invalidates_cached_plans():
+    strategist = StrategistAgent()
+    strategist.PROCESS_CACHE_MIN_BYTES = 0
+    strategist.knowledge_base = StaticKnowledgeBase()
+    
+    async def main():
+        await strategist.process_cached({"goal": "grow"})
+        cached = len(strategist._process_cache)
+        await strategist.collaborate(CountingAgent(), {"goal": "grow"})
+        return cached, len(strategist._process_cache)
+        
+    assert asyncio.run(main()) == (1, 0)
+
+def test_small_inputs_bypass_the_cache():
+    agent = CountingAgent()
+    agent.PROCESS_CACHE_MIN_BYTES = 1024
+    
+    async def main():
+        await agent.process_cached({"q": 1})
+        await agent.process_cached({"q": 1})
+        
+    asyncio.run(main())
+    assert agent.calls == 2
+
+def test_failures_are_not_cached():
+    agent = CountingAgent()
+    agent.fail = True
+    
+    async def main():
+        with pytest.raises(RuntimeError):
+            await agent.process_cached({"q": 1})
+        agent.fail = False
+        return await agent.process_cached({"q": 1})
+        
+    assert asyncio.run(main())["call"] == 2
+
+def test_least_recently_used_results_are_evicted():
+    agent = CountingAgent()
+    
+    async def main():
+        for q in (1, 2, 1, 3, 1, 2):
+            await agent.process_cached({"q": q})
+            
+    asyncio.run(main())
+    # 1, 2 and 3 miss once each; 1 stays cached because it keeps being used, 2 is evicted by 3
+    assert agent.calls == 4
+
+def test_consult_works_across_event_loops():
+    agent, partner = CountingAgent(), CountingAgent()
+    
+    async def main():
+        return await asyncio.gather(*(agent.consult(partner, {"q": i}) for i in range(10)))
+        
+    # The LLM semaphore of the first loop must not leak into the second
+    assert len(asyncio.run(main())) == 10
+    assert len(asyncio.run(main())) == 10
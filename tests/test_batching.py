@@ -0,0 +1,143 @@
+"""Tests for request batching and its use by the workflow scheduler."""
+
+import asyncio
+
+import pytest
+
+from agents.base_agent import AgentPersonality, BaseAgent
+from workflow.base_node import BaseWorkflowNode, NodeConfig
+from workflow.batching import BatchedDispatcher, BatchedKnowledgeBase, get_dispatcher
+from workflow.scheduler import WorkflowScheduler
+
+class RecordingBackend:
+    """Batch function that records every batch it receives."""
+    
+    def __init__(self, fail: bool = False, short: bool = False):
+        self.batches = []
+        self.fail = fail
+        self.short = short
+        
+    async def __call__(self, requests):
+        self.batches.append(list(requests))
+        if self.fail:
+            raise ValueError("backend down")
+        results = [f"result:{request}" for request in requests]
+        return results[:-1] if self.short else results
+
+def test_concurrent_requests_share_one_batch():
+    backend = RecordingBackend()
+    
+    async def main():
+        dispatcher = BatchedDispatcher(backend, max_batch_size=16, max_delay=0.01)
+        return await asyncio.gather(*(dispatcher.submit(i) for i in range(5)))
+        
+    assert asyncio.run(main()) == [f"result:{i}" for i in range(5)]
+    assert backend.batches == [[0, 1, 2, 3, 4]]
+
+def test_full_batches_go_out_without_waiting():
+    backend = RecordingBackend()
+    
+    async def main():
+        # A delay far beyond the test's runtime: only the size limit can flush
+        dispatcher = BatchedDispatcher(backend, max_batch_size=2, max_delay=60)
+        return await asyncio.wait_for(asyncio.gather(*(dispatcher.submit(i) for i in range(4))), 5)
+        
+    assert asyncio.run(main()) == [f"result:{i}" for i in range(4)]
+    assert backend.batches == [[0, 1], [2, 3]]
+
+@pytest.mark.parametrize("backend, error", [
+    (RecordingBackend(fail=True), ValueError),
+    (RecordingBackend(short=True), RuntimeError),
+])
+def test_failed_batch_fails_every_caller(backend, error):
+    async def main():
+        dispatcher = BatchedDispatcher(backend, max_delay=0.001)
+        return await asyncio.gather(*(dispatcher.submit(i) for i in range(3)), return_exceptions=True)
+        
+    results = asyncio.run(main())
+    assert len(results) == 3
+    assert all(isinstance(result, error) for result in results)
+
+def test_invalid_batch_size_is_rejected():
+    with pytest.raises(ValueError):
+        BatchedDispatcher(RecordingBackend(), max_batch_size=0)
+
+def test_dispatchers_are_shared_per_event_loop():
+    backend = RecordingBackend()
+    
+    async def lookup():
+        first = get_dispatcher("backend", backend)
+        second = get_dispatcher("backend", backend)
+        assert first is second
+        assert await first.submit("q") == "result:q"
+        return first
+        
+    # Each asyncio.run creates a new loop, which must not inherit the old loop's dispatcher
+    assert asyncio.run(lookup()) is not asyncio.run(lookup())
+
+class BatchingKnowledgeBase:
+    """Knowledge base that only answers batched queries."""
+    
+    def __init__(self):
+        self.batches = []
+        
+    async def query_batch(self, queries):
+        self.batches.append(list(queries))
+        return [{"answer": query} for query in queries]
+
+class LookupAgent(BaseAgent):
+    """Agent whose processing is a single knowledge base query."""
+    
+    def __init__(self, name: str):
+        super().__init__(AgentPersonality(name=name, traits={}, expertise=[], description=""))
+        
+    async def process(self, input_data):
+        return await self.access_knowledge_base(input_data)
+
+class LookupNode(BaseWorkflowNode):
+    """Node that asks each of its agents about the node's own name."""
+    
+    async def process(self, input_data):
+        agents = list(self.participating_agents.values())
+        answers = await self.dispatch(agent.process(self.config.name) for agent in agents)
+        return {"answers": answers}
+
+def make_node(name: str, *agents: LookupAgent) -> LookupNode:
+    node = LookupNode(NodeConfig(
+        name=name,
+        description="",
+        required_agents=[agent.personality.name for agent in agents],
+        max_iterations=1,
+        timeout_seconds=5
+    ))
+    node.connect_agents(agents)
+    return node
+
+def test_scheduler_batches_sibling_nodes_knowledge_queries():
+    knowledge_base = BatchingKnowledgeBase()
+    agents = [LookupAgent("left agent"), LookupAgent("right agent")]
+    for agent in agents:
+        agent.knowledge_base = knowledge_base
+    source, left, right = make_node("source"), make_node("left", agents[0]), make_node("right", agents[1])
+    source.add_next_node(left)
+    source.add_next_node(right)
+    
+    results = asyncio.run(WorkflowScheduler([source, left, right]).run({}))
+    
+    assert results["left"] == {"answers": [{"answer": "left"}]}
+    assert results["right"] == {"answers": [{"answer": "right"}]}
+    # Both siblings became ready together, so their queries went out as one batch
+    assert len(knowledge_base.batches) == 1
+    assert sorted(knowledge_base.batches[0]) == ["left", "right"]
+
+def test_knowledge_bases_without_batch_support_are_left_alone():
+    class PlainKnowledgeBase:
+        async def query(self, query):
+            return query
+            
+    agent = LookupAgent("plain")
+    plain = agent.knowledge_base = PlainKnowledgeBase()
+    node = make_node("only", agent)
+    assert asyncio.run(WorkflowScheduler([node]).run({})) == {"only": {"answers": ["only"]}}
+    assert agent.knowledge_base is plain
+    assert not BatchedKnowledgeBase.supports(BatchedKnowledgeBase(BatchingKnowledgeBase()))
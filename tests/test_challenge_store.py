@@ -0,0 +1,101 @@
+"""Tests for the Challenger agent's columnar challenge history."""
+
+import asyncio
+import random
+import threading
+
+import numpy as np
+import pytest
+
+from agents.challenger_agent import ChallengeStore, ChallengerAgent
+
+def _challenges(rng: random.Random, count: int, tag: str):
+    return [
+        {
+            "severity": rng.random(),
+            "confidence": rng.random(),
+            "type": rng.choice(["logical", "practical", "strategic"]),
+            "description": f"{tag}-{i}"
+        }
+        for i in range(count)
+    ]
+
+@pytest.mark.parametrize("quantized", [False, True])
+def test_store_keeps_the_newest_rows_in_order(quantized):
+    rng = random.Random(0)
+    for _ in range(100):
+        max_size = rng.randint(1, 20)
+        store = ChallengeStore(max_size, initial_capacity=rng.randint(1, 8), quantized=quantized)
+        expected = []
+        for batch_number in range(rng.randint(0, 12)):
+            batch = _challenges(rng, rng.randint(0, 7), str(batch_number))
+            store.extend(batch, f"target-{batch_number}", batch_number)
+            expected.extend(
+                (f"target-{batch_number}", c["type"], c["description"], batch_number, c["severity"], c["confidence"])
+                for c in batch
+            )
+            expected = expected[-max_size:]
+            
+            assert len(store) == len(expected)
+            assert store.records() == [row[:4] for row in expected]
+            tolerance = 1 / ChallengeStore.QUANT_SCALE if quantized else 1e-6
+            np.testing.assert_allclose(store.severities(), [row[4] for row in expected], atol=tolerance)
+            np.testing.assert_allclose(store.confidences(), [row[5] for row in expected], atol=tolerance)
+            # Storage never grows beyond max_size rows
+            assert store.severity.shape[0] <= max_size
+
+def test_full_store_overwrites_in_place():
+    store = ChallengeStore(4, initial_capacity=4)
+    store.extend(_challenges(random.Random(1), 4, "old"), "t", 0)
+    severity = store.severity
+    
+    store.extend(_challenges(random.Random(2), 3, "new"), "t", 1)
+    
+    assert store.severity is severity
+    assert [record[2] for record in store.records()] == ["old-3", "new-0", "new-1", "new-2"]
+
+def test_scores_are_clipped_and_read_only():
+    store = ChallengeStore(8)
+    store.extend([
+        {"severity": 1.5, "type": "logical", "description": "a"},
+        {"severity": -0.5, "type": "logical", "description": "b"}
+    ], "t", 0)
+    
+    severities = store.severities()
+    assert severities.tolist() == [1.0, 0.0]
+    # Confidence defaults to 0 when a challenge has none
+    assert store.confidences().tolist() == [0.0, 0.0]
+    with pytest.raises(ValueError):
+        severities[0] = 0.5
+
+def test_invalid_size_is_rejected():
+    with pytest.raises(ValueError):
+        ChallengeStore(0)
+
+def test_agent_history_is_derived_from_the_store():
+    agent = ChallengerAgent()
+    asyncio.run(agent.process("first idea"))
+    asyncio.run(agent.process("second idea"))
+    
+    records = agent.history_snapshot()
+    assert records == agent.challenge_store.records()
+    assert [record[0] for record in records][-1] == "second idea"
+    challenges = list(agent.iter_challenges())
+    assert [(c.target, c.challenge_type, c.description) for c in challenges] == [r[:3] for r in records]
+
+def test_severity_history_is_read_on_the_event_loop_thread(monkeypatch):
+    agent = ChallengerAgent()
+    asyncio.run(agent.process("first idea"))
+    readers = []
+    severities = ChallengeStore.severities
+    
+    def record_reader(store):
+        readers.append(threading.get_ident())
+        return severities(store)
+        
+    monkeypatch.setattr(ChallengeStore, "severities", record_reader)
+    result = asyncio.run(agent.process("second idea"))
+    
+    # Worker threads only see a snapshot, so concurrent appends cannot tear their read
+    assert readers and set(readers) == {threading.get_ident()}
+    assert result["impact"]["severity_assessment"]["historical_mean"] is not None
@@ -0,0 +1,72 @@
+"""Tests for hashing embeddings, similarity search and the semantic cache."""
+
+import numpy as np
+import pytest
+
+from agents.embeddings import HashingEmbedder, SemanticCache, as_text, embed_all, top_k_similar
+
+def test_embeddings_are_deterministic_unit_vectors():
+    embedder = HashingEmbedder(dim=64)
+    vectors = embedder.encode_batch(["alpha beta", "Alpha BETA", "", "gamma"])
+    
+    assert vectors.shape == (4, 64) and vectors.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(vectors[[0, 1, 3]], axis=1), 1.0, rtol=1e-6)
+    np.testing.assert_array_equal(vectors[0], vectors[1])
+    # Text without tokens embeds as the zero vector
+    assert not vectors[2].any()
+    np.testing.assert_array_equal(embedder.encode("gamma"), vectors[3])
+
+def test_invalid_dimension_is_rejected():
+    with pytest.raises(ValueError):
+        HashingEmbedder(dim=0)
+
+def test_top_k_similar_matches_full_sort():
+    rng = np.random.default_rng(0)
+    bank = rng.normal(size=(30, 8)).astype(np.float32)
+    queries = rng.normal(size=(5, 8)).astype(np.float32)
+    for k in (0, 1, 5, 30, 50):
+        indices, similarities = top_k_similar(queries, bank, k)
+        
+        expected = np.argsort(-(queries @ bank.T), axis=1, kind="stable")[:, :min(k, 30)]
+        np.testing.assert_array_equal(indices, expected)
+        np.testing.assert_allclose(similarities, np.take_along_axis(queries @ bank.T, expected, axis=1))
+
+def test_as_text_keeps_dict_keys():
+    assert as_text({"goal": "grow", "tags": ["a", ("b",)]}) == "goal grow tags a b"
+    embedder = HashingEmbedder()
+    goal, avoid = embed_all(embedder, [{"goal": "cut costs"}, {"avoid": "cut costs"}])
+    assert float(goal @ avoid) < 0.95
+
+def test_semantic_cache_returns_most_similar_entry_above_threshold():
+    cache = SemanticCache(dim=2, capacity=4, threshold=0.9)
+    east, north = np.array([1.0, 0.0], np.float32), np.array([0.0, 1.0], np.float32)
+    cache.put(east, "east")
+    cache.put(north, "north")
+    
+    assert cache.get(np.array([0.99, 0.14], np.float32)) == "east"
+    assert cache.get(np.array([0.7071, 0.7071], np.float32)) is None
+    assert len(cache) == 2
+
+def test_semantic_cache_replaces_oldest_entry_when_full():
+    cache = SemanticCache(dim=3, capacity=2, threshold=0.9)
+    vectors = np.eye(3, dtype=np.float32)
+    for i, vector in enumerate(vectors):
+        cache.put(vector, i)
+        
+    assert cache.get(vectors[0]) is None
+    assert cache.get(vectors[1]) == 1
+    assert cache.get(vectors[2]) == 2
+
+def test_semantic_cache_invalidation():
+    cache = SemanticCache(dim=2, capacity=4, threshold=0.9)
+    east, north = np.array([1.0, 0.0], np.float32), np.array([0.0, 1.0], np.float32)
+    cache.put(east, "east")
+    cache.put(north, "north")
+    
+    assert cache.invalidate(east, 0.5) == 1
+    assert cache.get(east) is None
+    assert cache.get(north) == "north"
+    assert len(cache) == 1
+    # An invalidated input can be cached again
+    cache.put(east, "east again")
+    assert cache.get(east) == "east again"
@@ -0,0 +1,76 @@
+"""Tests for the concept network kernels."""
+
+import numpy as np
+import pytest
+
+def _random_graph(rng: np.random.Generator, n: int, density: float) -> np.ndarray:
+    """Random undirected simple graph as a dense boolean adjacency matrix."""
+    upper = np.triu(rng.random((n, n)) < density, k=1)
+    return upper | upper.T
+
+def _csr(adjacency: np.ndarray):
+    indptr = np.zeros(adjacency.shape[0] + 1, dtype=np.int32)
+    np.cumsum(adjacency.sum(axis=1), out=indptr[1:])
+    indices = np.nonzero(adjacency)[1].astype(np.int32)
+    return indptr, indices
+
+def _hop_distances(adjacency: np.ndarray, source: int) -> np.ndarray:
+    """Hop distance from source to every node (-1 if unreachable), by repeated frontier expansion."""
+    dist = np.full(adjacency.shape[0], -1)
+    dist[source] = 0
+    frontier = np.zeros(adjacency.shape[0], dtype=bool)
+    frontier[source] = True
+    hops = 0
+    while frontier.any():
+        hops += 1
+        frontier = adjacency[frontier].any(axis=0) & (dist < 0)
+        dist[frontier] = hops
+    return dist
+
+def test_triangle_counts_match_dense_matrix_power(load_kernels):
+    triangle_counts = load_kernels("agents._graph_kernels").triangle_counts
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        adjacency = _random_graph(rng, int(rng.integers(1, 25)), float(rng.uniform(0.05, 0.8)))
+        a = adjacency.astype(np.int64)
+        # (A^3)_ii counts each triangle through i twice, once per direction
+        expected = np.diag(a @ a @ a) // 2
+        np.testing.assert_array_equal(triangle_counts(*_csr(adjacency)), expected)
+
+def test_bfs_distance_sums_match_frontier_expansion(load_kernels):
+    bfs_distance_sums = load_kernels("agents._graph_kernels").bfs_distance_sums
+    rng = np.random.default_rng(1)
+    for _ in range(30):
+        n = int(rng.integers(1, 25))
+        adjacency = _random_graph(rng, n, float(rng.uniform(0.05, 0.5)))
+        sources = np.arange(n, dtype=np.int32)
+        
+        sums = bfs_distance_sums(*_csr(adjacency), sources)
+        
+        for source in range(n):
+            dist = _hop_distances(adjacency, source)
+            reached = dist >= 0
+            assert sums[source, 0] == dist[reached].sum()
+            assert sums[source, 1] == reached.sum()
+
+def test_kernels_agree_with_networkx(load_kernels):
+    nx = pytest.importorskip("networkx")
+    kernels = load_kernels("agents._graph_kernels")
+    graph = nx.gnp_random_graph(40, 0.15, seed=2)
+    adjacency = nx.to_numpy_array(graph, nodelist=range(40), dtype=bool)
+    indptr, indices = _csr(adjacency)
+    
+    triangles = kernels.triangle_counts(indptr, indices)
+    sums = kernels.bfs_distance_sums(indptr, indices, np.arange(40, dtype=np.int32))
+    
+    assert triangles.tolist() == [nx.triangles(graph, node) for node in range(40)]
+    for node in range(40):
+        lengths = nx.single_source_shortest_path_length(graph, node)
+        assert sums[node].tolist() == [sum(lengths.values()), len(lengths)]
+
+def test_isolated_nodes(load_kernels):
+    kernels = load_kernels("agents._graph_kernels")
+    indptr, indices = _csr(np.zeros((3, 3), dtype=bool))
+    
+    assert kernels.triangle_counts(indptr, indices).tolist() == [0, 0, 0]
+    assert kernels.bfs_distance_sums(indptr, indices, np.array([0, 2], dtype=np.int32)).tolist() == [[0, 1], [0, 1]]
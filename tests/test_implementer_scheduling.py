@@ -0,0 +1,145 @@
+"""Tests for the Implementer agent's task graph, Backflow priorities and list scheduling."""
+
+import asyncio
+import random
+from datetime import timedelta
+
+import pytest
+
+from agents import implementer_agent
+from agents.implementer_agent import ImplementationPlan, ImplementerAgent, Task
+
+@pytest.fixture(params=[pytest.param(True, id="numba"), pytest.param(False, id="python")])
+def agent(request, monkeypatch):
+    """An Implementer using the compiled Backflow kernel, or the level-by-level NumPy path."""
+    if request.param and not implementer_agent.HAS_NUMBA:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(implementer_agent, "HAS_NUMBA", request.param)
+    return ImplementerAgent(plan_cache_enabled=False)
+
+def _random_tasks(rng: random.Random, n: int):
+    return [
+        Task(
+            f"t{i}",
+            "",
+            timedelta(hours=rng.randint(0, 10)),
+            [f"t{j}" for j in range(i) if rng.random() < 0.3],
+            {}
+        )
+        for i in range(n)
+    ]
+
+def _scheduled_plan(agent: ImplementerAgent, tasks):
+    plan = ImplementationPlan(name="plan", description="")
+    agent._build_task_graph(plan, tasks)
+    timeline = asyncio.run(agent._create_timeline(plan, tasks, {}))
+    plan.timeline = timeline["tasks"]
+    plan.dirty.clear()
+    return plan, timeline
+
+def _longest_path(tasks_by_name, successors, name):
+    return tasks_by_name[name].duration.total_seconds() + max(
+        (_longest_path(tasks_by_name, successors, successor) for successor in successors[name]),
+        default=0.0
+    )
+
+def _assert_valid(timeline, tasks, slots):
+    entries = timeline["tasks"]
+    for task in tasks:
+        entry = entries[task.name]
+        assert entry["end"] - entry["start"] == task.duration
+        for dependency in task.dependencies:
+            assert entries[dependency]["end"] <= entry["start"]
+    # Occupancy only rises when a task starts, so checking every start suffices
+    for entry in entries.values():
+        running = sum(other["start"] <= entry["start"] < other["end"] for other in entries.values())
+        assert running <= slots
+
+def test_task_graph_csr_matches_dependencies(agent):
+    rng = random.Random(1)
+    tasks = _random_tasks(rng, 12)
+    plan = ImplementationPlan(name="plan", description="")
+    agent._build_task_graph(plan, tasks)
+    
+    order = plan._topo_order
+    assert sorted(order) == sorted(task.name for task in tasks)
+    for task in tasks:
+        i = plan.tasks[task.name].id
+        assert order[i] == task.name
+        predecessors = {order[j] for j in plan._pred_idx[plan._pred_ptr[i]:plan._pred_ptr[i + 1]]}
+        assert predecessors == set(task.dependencies)
+        assert all(plan.tasks[dependency].id < i for dependency in task.dependencies)
+        successors = {order[j] for j in plan._succ_idx[plan._succ_ptr[i]:plan._succ_ptr[i + 1]]}
+        assert successors == {other.name for other in tasks if task.name in other.dependencies}
+
+def test_cycles_and_unknown_dependencies_are_rejected(agent):
+    plan = ImplementationPlan(name="plan", description="")
+    with pytest.raises(ValueError, match="cycle"):
+        agent._build_task_graph(plan, [
+            Task("a", "", timedelta(hours=1), ["b"], {}),
+            Task("b", "", timedelta(hours=1), ["a"], {})
+        ])
+    with pytest.raises(ValueError):
+        agent._build_task_graph(plan, [Task("a", "", timedelta(hours=1), ["missing"], {})])
+
+def test_priorities_are_longest_paths(agent):
+    rng = random.Random(2)
+    for _ in range(30):
+        tasks = _random_tasks(rng, rng.randint(1, 10))
+        plan, _ = _scheduled_plan(agent, tasks)
+        by_name = {task.name: task for task in tasks}
+        for i, name in enumerate(plan._topo_order):
+            expected = _longest_path(by_name, plan._adjacency, name)
+            assert plan._task_arr["prio"][i] == pytest.approx(expected)
+
+def test_schedule_respects_dependencies_and_slots(agent):
+    rng = random.Random(3)
+    for _ in range(30):
+        tasks = _random_tasks(rng, rng.randint(1, 12))
+        _, timeline = _scheduled_plan(agent, tasks)
+        _assert_valid(timeline, tasks, agent.MAX_PARALLEL_TASKS)
+        assert timeline["makespan"] >= timeline["critical_path_length"]
+
+def test_independent_tasks_fill_every_slot(agent):
+    tasks = [Task(f"t{i}", "", timedelta(days=1), [], {}) for i in range(6)]
+    _, timeline = _scheduled_plan(agent, tasks)
+    starts = sorted((entry["start"] - timeline["start"]).days for entry in timeline["tasks"].values())
+    assert starts == [0, 0, 0, 0, 1, 1]
+
+def test_incremental_reschedule_keeps_slots_and_copies_timeline(agent):
+    tasks = [Task(f"t{i}", "", timedelta(days=1), [], {}) for i in range(6)]
+    plan, timeline = _scheduled_plan(agent, tasks)
+    before = {name: dict(entry) for name, entry in plan.timeline.items()}
+    
+    plan.set_duration("t5", timedelta(days=1))
+    updated = agent._incremental_reschedule(plan)
+    
+    # Day 0 already runs four tasks, so t5 cannot move there
+    assert updated["tasks"]["t5"] == before["t5"]
+    # The timeline handed out by the first scheduling run is left untouched
+    assert timeline["tasks"] == before
+    assert plan.timeline is not timeline["tasks"]
+    assert not plan.dirty
+
+def test_incremental_reschedule_stays_valid(agent):
+    rng = random.Random(4)
+    for _ in range(30):
+        tasks = _random_tasks(rng, rng.randint(1, 12))
+        plan, _ = _scheduled_plan(agent, tasks)
+        for _ in range(3):
+            plan.set_duration(f"t{rng.randrange(len(tasks))}", timedelta(hours=rng.randint(0, 10)))
+            timeline = agent._incremental_reschedule(plan)
+        _assert_valid(timeline, tasks, agent.MAX_PARALLEL_TASKS)
+        by_name = {task.name: task for task in tasks}
+        for i, name in enumerate(plan._topo_order):
+            assert plan._task_arr["prio"][i] == pytest.approx(_longest_path(by_name, plan._adjacency, name))
+
+def test_incremental_reschedule_places_added_tasks(agent):
+    tasks = [Task("a", "", timedelta(hours=2), [], {}), Task("b", "", timedelta(hours=1), ["a"], {})]
+    plan, _ = _scheduled_plan(agent, tasks)
+    
+    plan.add_task(Task("c", "", timedelta(hours=3), ["b"], {}))
+    timeline = agent._incremental_reschedule(plan)
+    
+    assert timeline["tasks"]["c"]["start"] == timeline["tasks"]["b"]["end"]
+    assert timeline["critical_path"] == ["a", "b", "c"]
@@ -0,0 +1,40 @@
+"""Tests for the Researcher agent's streamed results."""
+
+import asyncio
+import gc
+
+import pytest
+
+from agents.researcher_agent import ResearchSource, ResearcherAgent
+
+class FailingExtractionResearcher(ResearcherAgent):
+    """Researcher whose every extraction fails, keeping track of the extraction tasks."""
+    
+    def __init__(self):
+        super().__init__()
+        self.extractions = []
+        
+    async def _search_external_sources(self, query):
+        return [ResearchSource(f"title {i}", "external") for i in range(4)]
+        
+    def _start_extraction(self, sources):
+        self.extractions = super()._start_extraction(sources)
+        return self.extractions
+        
+    def _build_finding(self, source, timestamp):
+        raise RuntimeError(f"cannot extract {source.title}")
+
+def test_failed_extraction_retrieves_every_outstanding_task(caplog):
+    agent = FailingExtractionResearcher()
+    
+    async def main():
+        with pytest.raises(RuntimeError, match="cannot extract"):
+            async for _ in agent.stream("topic"):
+                pass
+        assert len(agent.extractions) > 1
+        assert all(extraction.done() for extraction in agent.extractions)
+        
+    asyncio.run(main())
+    agent.extractions.clear()
+    gc.collect()
+    assert "never retrieved" not in caplog.text
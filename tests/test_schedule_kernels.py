@@ -0,0 +1,48 @@
+"""Tests for the Backflow priority kernel."""
+
+import numpy as np
+
+def _random_dag(rng: np.random.Generator, n: int, density: float):
+    """Random DAG over ids in topological order, as successor lists."""
+    return [sorted(j for j in range(i + 1, n) if rng.random() < density) for i in range(n)]
+
+def _csr(successors):
+    ptr = np.zeros(len(successors) + 1, dtype=np.int32)
+    np.cumsum([len(s) for s in successors], out=ptr[1:])
+    idx = np.fromiter((j for s in successors for j in s), dtype=np.int32, count=int(ptr[-1]))
+    return ptr, idx
+
+def _longest_path_brute_force(successors, durations, u):
+    """Length of the longest path from u, found by walking every path."""
+    return durations[u] + max(
+        (_longest_path_brute_force(successors, durations, v) for v in successors[u]),
+        default=0.0
+    )
+
+def test_backflow_matches_brute_force_on_random_dags(load_kernels):
+    backflow = load_kernels("agents._schedule_kernels").backflow
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        n = int(rng.integers(1, 10))
+        successors = _random_dag(rng, n, float(rng.uniform(0.1, 0.7)))
+        durations = rng.uniform(0.0, 10.0, n)
+        ptr, idx = _csr(successors)
+        
+        priorities = backflow(ptr, idx, durations)
+        
+        expected = [_longest_path_brute_force(successors, durations, u) for u in range(n)]
+        np.testing.assert_allclose(priorities, expected)
+
+def test_backflow_on_chain_and_independent_tasks(load_kernels):
+    backflow = load_kernels("agents._schedule_kernels").backflow
+    durations = np.array([1.0, 2.0, 3.0])
+    
+    chain = backflow(*_csr([[1], [2], []]), durations)
+    independent = backflow(*_csr([[], [], []]), durations)
+    
+    np.testing.assert_allclose(chain, [6.0, 5.0, 3.0])
+    np.testing.assert_allclose(independent, durations)
+
+def test_backflow_on_empty_graph(load_kernels):
+    backflow = load_kernels("agents._schedule_kernels").backflow
+    assert backflow(*_csr([]), np.zeros(0)).shape == (0,)
@@ -0,0 +1,50 @@
+"""Tests for the Challenger agent's scoring kernels."""
+
+import numpy as np
+import pytest
+
+def _scores(rng: np.random.Generator, n: int) -> np.ndarray:
+    return rng.random(n, dtype=np.float32)
+
+def test_weighted_score_matches_numpy(load_kernels):
+    weighted_score = load_kernels("agents._scoring_kernels").weighted_score
+    rng = np.random.default_rng(0)
+    for n in range(1, 20):
+        values, weights = _scores(rng, n), _scores(rng, n)
+        expected = np.average(values.astype(np.float64), weights=weights.astype(np.float64))
+        assert weighted_score(values, weights) == pytest.approx(expected)
+
+def test_weighted_score_edge_cases(load_kernels):
+    weighted_score = load_kernels("agents._scoring_kernels").weighted_score
+    empty = np.zeros(0, dtype=np.float32)
+    assert weighted_score(empty, empty) == 0.0
+    assert weighted_score(np.ones(3, dtype=np.float32), np.zeros(3, dtype=np.float32)) == 0.0
+    # Results are clipped to [0, 1]
+    assert weighted_score(np.array([2.0, 3.0], dtype=np.float32), np.ones(2, dtype=np.float32)) == 1.0
+    assert weighted_score(np.array([-1.0], dtype=np.float32), np.ones(1, dtype=np.float32)) == 0.0
+
+def test_combined_confidence_is_noisy_or(load_kernels):
+    combined_confidence = load_kernels("agents._scoring_kernels").combined_confidence
+    rng = np.random.default_rng(1)
+    for n in range(1, 20):
+        strengths = _scores(rng, n)
+        expected = 1.0 - np.prod(1.0 - strengths.astype(np.float64))
+        assert combined_confidence(strengths) == pytest.approx(expected)
+
+def test_combined_confidence_edge_cases(load_kernels):
+    combined_confidence = load_kernels("agents._scoring_kernels").combined_confidence
+    assert combined_confidence(np.zeros(0, dtype=np.float32)) == 0.0
+    assert combined_confidence(np.array([0.5, 1.0], dtype=np.float32)) == 1.0
+    # Strengths outside [0, 1] are clipped
+    assert combined_confidence(np.array([-3.0, 0.5], dtype=np.float32)) == pytest.approx(0.5)
+    assert combined_confidence(np.array([7.0], dtype=np.float32)) == 1.0
+
+def test_impact_score_matches_numpy(load_kernels):
+    impact_score = load_kernels("agents._scoring_kernels").impact_score
+    rng = np.random.default_rng(2)
+    for n in range(1, 20):
+        severities, implications, risks = _scores(rng, n), _scores(rng, n), _scores(rng, n)
+        expected = np.mean(severities.astype(np.float64) * implications * risks)
+        assert impact_score(severities, implications, risks) == pytest.approx(expected)
+    empty = np.zeros(0, dtype=np.float32)
+    assert impact_score(empty, empty, empty) == 0.0
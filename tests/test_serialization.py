@@ -0,0 +1,110 @@
+"""Tests for result serialization, canonical keys and the key-based caches."""
+
+import json
+import math
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from types import MappingProxyType
+
+import numpy as np
+import pytest
+
+from agents import serialization
+from agents.serialization import KeyedLRUCache, canonical_key, dumps, lru_cache_by_key, stable_hash
+
+@pytest.fixture(params=[pytest.param(True, id="orjson"), pytest.param(False, id="stdlib")])
+def encoder(request, monkeypatch):
+    """Run a test with orjson, and again with the standard library fallback."""
+    if request.param and not serialization.HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(serialization, "HAS_ORJSON", request.param)
+    return request.param
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+def test_dumps_handles_rich_values(encoder):
+    value = {
+        "b": MappingProxyType({"z": 1, "a": 2}),
+        "a": (1, deque([2, 3])),
+        "when": datetime(2024, 1, 2, 3, 4, 5),
+        "took": timedelta(seconds=90),
+        "point": Point(1, 2),
+        "array": np.arange(3, dtype=np.int64),
+        "scalar": np.int32(7)
+    }
+    assert json.loads(dumps(value)) == {
+        "a": [1, [2, 3]],
+        "array": [0, 1, 2],
+        "b": {"a": 2, "z": 1},
+        "point": {"x": 1, "y": 2},
+        "scalar": 7,
+        "took": 90.0,
+        "when": "2024-01-02T03:04:05"
+    }
+    # Keys are sorted and the output is compact
+    assert dumps({"b": 1, "a": 2}) == b'{"a":2,"b":1}'
+
+def test_dumps_orders_sets(encoder):
+    words = ["delta", "alpha", "charlie", "bravo", "echo"]
+    assert dumps(set(words)) == dumps(frozenset(reversed(words))) == dumps(sorted(words))
+
+def test_dumps_writes_non_finite_floats_as_null(encoder):
+    value = {"nan": math.nan, "inf": [math.inf, -math.inf], "nested": Point(math.nan, 1)}
+    assert json.loads(dumps(value)) == {"inf": [None, None], "nan": None, "nested": {"x": None, "y": 1}}
+
+def test_dumps_rejects_unknown_types(encoder):
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+def test_canonical_key_and_stable_hash(encoder):
+    small = {"a": 1, "b": [1, 2]}
+    assert canonical_key(small) == canonical_key({"b": [1, 2], "a": 1}) == dumps(small)
+    large = {"text": "x" * 1000}
+    assert canonical_key(large) == stable_hash(large)
+    assert len(stable_hash(large)) == 32
+    assert stable_hash({"a": 1}) != stable_hash({"a": 2})
+
+def test_lru_cache_by_key_memoizes_unhashable_arguments():
+    calls = []
+    
+    @lru_cache_by_key(maxsize=2)
+    def describe(value):
+        calls.append(value)
+        return len(value)
+        
+    assert describe({"a": [1, 2]}) == 1
+    assert describe({"a": [1, 2]}) == 1
+    assert describe(["x", "y"]) == 2
+    assert len(calls) == 2
+    assert describe.cache_info().hits == 1
+    # Unserializable arguments bypass the cache instead of failing
+    assert describe([object()]) == 1
+    assert describe.cache_info().currsize == 2
+    describe.cache_clear()
+    assert describe.cache_info().currsize == 0
+
+def test_keyed_lru_cache_matches_only_identical_inputs():
+    cache = KeyedLRUCache(maxsize=2)
+    cache.put({"goal": "merge"}, "first")
+    
+    assert cache.get({"goal": "merge"}) == "first"
+    assert cache.get({"avoid": "merge"}) is None
+    assert cache.get({"goal": "merge", "extra": 1}) is None
+    
+    cache.put({"b": 1}, "second")
+    # Reading "first" made it recent, so "second" is evicted next
+    cache.get({"goal": "merge"})
+    cache.put({"c": 1}, "third")
+    assert cache.get({"b": 1}) is None
+    assert len(cache) == 2
+    
+    cache.put([object()], "ignored")
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        KeyedLRUCache(maxsize=0)
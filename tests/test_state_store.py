@@ -0,0 +1,86 @@
+"""Tests for the workflow state stores."""
+
+import asyncio
+
+import pytest
+
+from workflow.state_store import FileStateStore, InMemoryStateStore
+
+@pytest.fixture(params=["memory", "file"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryStateStore()
+    return FileStateStore(tmp_path / "states")
+
+def test_save_load_and_clear(store):
+    async def main():
+        missing = await store.load("a")
+        await store.save("a", '{"v": 1}')
+        await store.save("b", '{"v": 2}')
+        await store.save("a", '{"v": 3}')
+        loaded = (await store.load("a"), await store.load("b"))
+        await store.clear()
+        return missing, loaded, await store.load("a"), await store.load("b")
+        
+    missing, loaded, a, b = asyncio.run(main())
+    assert missing is None
+    assert loaded == ('{"v": 3}', '{"v": 2}')
+    assert a is None and b is None
+
+def test_file_store_survives_a_new_instance(tmp_path):
+    async def main():
+        await FileStateStore(tmp_path).save("node", "{}")
+        return await FileStateStore(tmp_path).load("node")
+        
+    assert asyncio.run(main()) == "{}"
+
+def test_file_names_are_quoted(tmp_path):
+    store = FileStateStore(tmp_path)
+    names = ["../escape", "a/b", "with space", "ünïcode"]
+    
+    async def main():
+        for i, name in enumerate(names):
+            await store.save(name, str(i))
+        return [await FileStateStore(tmp_path).load(name) for name in names]
+        
+    assert asyncio.run(main()) == ["0", "1", "2", "3"]
+    assert sorted(path.parent for path in tmp_path.rglob("*.json")) == [tmp_path] * len(names)
+    assert not (tmp_path.parent / "escape.json").exists()
+
+def test_writes_leave_no_temporary_files(tmp_path):
+    store = FileStateStore(tmp_path)
+    
+    async def main():
+        await store.save("node", "first")
+        await store.save("node", "second")
+        
+    asyncio.run(main())
+    assert [path.name for path in tmp_path.iterdir()] == ["node.json"]
+    assert (tmp_path / "node.json").read_text(encoding="utf-8") == "second"
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    store = FileStateStore(tmp_path, cache_size=2)
+    
+    async def main():
+        await store.save("a", "1")
+        await store.save("b", "2")
+        await store.load("a")
+        await store.save("c", "3")
+        cached = list(store._cache)
+        # Evicted states are still read back from disk
+        return cached, await store.load("b")
+        
+    cached, b = asyncio.run(main())
+    assert cached == ["a", "c"]
+    assert b == "2"
+
+def test_clear_only_removes_state_files(tmp_path):
+    (tmp_path / "notes.txt").write_text("keep", encoding="utf-8")
+    store = FileStateStore(tmp_path)
+    
+    async def main():
+        await store.save("node", "{}")
+        await store.clear()
+        
+    asyncio.run(main())
+    assert [path.name for path in tmp_path.iterdir()] == ["notes.txt"]
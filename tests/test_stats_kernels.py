@@ -0,0 +1,87 @@
+"""Tests for the Analyst agent's statistics kernels."""
+
+import numpy as np
+import pytest
+
+def _random_matrix(rng: np.random.Generator, order: str = "C") -> np.ndarray:
+    n_rows, n_cols = int(rng.integers(2, 40)), int(rng.integers(1, 6))
+    return np.asarray(rng.normal(5.0, 3.0, (n_rows, n_cols)), dtype=np.float32, order=order)
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_basic_stats_match_numpy(load_kernels, order):
+    basic_stats = load_kernels("agents._stats_kernels").basic_stats
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        x = _random_matrix(rng, order)
+        values = x.astype(np.float64)
+        
+        stats = basic_stats(x)
+        
+        np.testing.assert_array_equal(stats[0], x.shape[0])
+        np.testing.assert_allclose(stats[1], values.mean(axis=0), rtol=1e-9)
+        np.testing.assert_allclose(stats[2], values.var(axis=0, ddof=1), rtol=1e-9)
+        np.testing.assert_array_equal(stats[3], values.min(axis=0))
+        np.testing.assert_array_equal(stats[4], values.max(axis=0))
+
+def test_basic_stats_of_a_single_row_has_no_variance(load_kernels):
+    basic_stats = load_kernels("agents._stats_kernels").basic_stats
+    stats = basic_stats(np.array([[1.0, 2.0]], dtype=np.float32))
+    assert stats[:2].tolist() == [[1.0, 1.0], [1.0, 2.0]]
+    assert np.isnan(stats[2]).all()
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_shape_stats_match_central_moments(load_kernels, order):
+    shape_stats = load_kernels("agents._stats_kernels").shape_stats
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        x = _random_matrix(rng, order)
+        centered = x.astype(np.float64) - x.astype(np.float64).mean(axis=0)
+        m2, m3, m4 = ((centered ** k).mean(axis=0) for k in (2, 3, 4))
+        
+        skewness, kurtosis = shape_stats(x)
+        
+        np.testing.assert_allclose(skewness, m3 / m2 ** 1.5, rtol=1e-7, atol=1e-9)
+        np.testing.assert_allclose(kurtosis, m4 / m2 ** 2 - 3.0, rtol=1e-7, atol=1e-9)
+
+def test_shape_stats_of_constant_column_are_nan(load_kernels):
+    shape_stats = load_kernels("agents._stats_kernels").shape_stats
+    skewness, kurtosis = shape_stats(np.array([[3.0, 1.0], [3.0, 2.0], [3.0, 4.0]], dtype=np.float32))
+    assert np.isnan(skewness[0]) and np.isnan(kurtosis[0])
+    assert np.isfinite(skewness[1]) and np.isfinite(kurtosis[1])
+
+def _patterns_reference(column):
+    """Direction score, turning points and longest one-directional streak of a column."""
+    steps = np.sign(np.diff(column.astype(np.float64))).astype(int).tolist()
+    turns = sum(a * b < 0 for a, b in zip(steps, steps[1:]))
+    longest = run = 0
+    previous = 0
+    for step in steps:
+        run = run + 1 if step != 0 and step == previous else int(step != 0)
+        longest = max(longest, run)
+        previous = step
+    direction = sum(steps) / len(steps) if steps else 0.0
+    return direction, turns, longest
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_find_all_patterns_matches_reference(load_kernels, order):
+    find_all_patterns = load_kernels("agents._stats_kernels").find_all_patterns
+    rng = np.random.default_rng(2)
+    for _ in range(20):
+        # Small integers make flat steps (ties) common
+        x = np.asarray(rng.integers(0, 4, (int(rng.integers(1, 30)), 3)), dtype=np.float32, order=order)
+        
+        temporal, structural, behavioral = find_all_patterns(x)
+        
+        for j in range(x.shape[1]):
+            direction, turns, longest = _patterns_reference(x[:, j])
+            assert temporal[j] == pytest.approx(direction)
+            assert structural[j] == turns
+            assert behavioral[j] == longest
+
+def test_find_all_patterns_on_monotonic_columns(load_kernels):
+    find_all_patterns = load_kernels("agents._stats_kernels").find_all_patterns
+    x = np.array([[1, 5], [2, 4], [3, 3], [4, 2]], dtype=np.float32)
+    temporal, structural, behavioral = find_all_patterns(x)
+    assert temporal.tolist() == [1.0, -1.0]
+    assert structural.tolist() == [0, 0]
+    assert behavioral.tolist() == [3, 3]
@@ -0,0 +1,366 @@
+"""Tests for the workflow scheduler and node-level caching and dispatch."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from workflow.base_node import BaseWorkflowNode, NodeConfig, ProcessWorkflowNode
+from workflow.scheduler import WorkflowScheduler
+from workflow.state_store import InMemoryStateStore
+
+class RecordingNode(BaseWorkflowNode):
+    """Node that records its calls and can be told to fail."""
+    
+    def __init__(self, config: NodeConfig, log: list, failures: int = 0, delay: float = 0.0):
+        super().__init__(config)
+        self.log = log
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+        
+    async def process(self, input_data):
+        self.calls += 1
+        self.log.append(self.config.name)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError(f"{self.config.name} failed")
+        return {
+            "name": self.config.name,
+            "input": input_data["input"],
+            "previous": sorted(input_data["previous_results"]),
+        }
+
+def make_node(name, log, max_iterations=1, timeout_seconds=5, **kwargs):
+    config_options = {
+        key: kwargs.pop(key) for key in ("cacheable", "cache_ttl_seconds", "max_concurrent") if key in kwargs
+    }
+    config = NodeConfig(
+        name=name, description="", required_agents=[],
+        max_iterations=max_iterations, timeout_seconds=timeout_seconds, **config_options
+    )
+    return RecordingNode(config, log, **kwargs)
+
+def diamond(log, **kwargs):
+    """a -> (b, c) -> d"""
+    a, b, c, d = (make_node(name, log, **kwargs) for name in "abcd")
+    a.add_next_node(b)
+    a.add_next_node(c)
+    b.add_next_node(d)
+    c.add_next_node(d)
+    return a, b, c, d
+
+def test_order_is_topological():
+    a, b, c, d = diamond([])
+    scheduler = WorkflowScheduler([d, c, b, a])
+    position = {node: i for i, node in enumerate(scheduler.order)}
+    for node in (a, b, c, d):
+        for next_node in node.next_nodes:
+            assert position[node] < position[next_node]
+
+def test_cycles_and_unknown_nodes_are_rejected():
+    x, y = make_node("x", []), make_node("y", [])
+    x.add_next_node(y)
+    y.add_next_node(x)
+    with pytest.raises(ValueError, match="cycle"):
+        WorkflowScheduler([x, y])
+        
+    a, b = make_node("a", []), make_node("b", [])
+    a.add_next_node(b)
+    with pytest.raises(ValueError, match="not part of the workflow"):
+        WorkflowScheduler([a])
+
+def test_edges_added_later_are_picked_up():
+    a, b = make_node("a", []), make_node("b", [])
+    scheduler = WorkflowScheduler([b, a])
+    b.add_next_node(a)
+    assert scheduler.runnable_nodes() == [b]
+    assert [node.config.name for node in scheduler.order] == ["b", "a"]
+
+def test_run_passes_previous_results():
+    log = []
+    a, b, c, d = diamond(log)
+    results = asyncio.run(WorkflowScheduler([a, b, c, d]).run({"q": 1}))
+    
+    assert set(results) == {"a", "b", "c", "d"}
+    assert results["d"] == {"name": "d", "input": {"q": 1}, "previous": ["b", "c"]}
+    assert log[0] == "a" and log[-1] == "d"
+
+def test_independent_nodes_run_concurrently():
+    log = []
+    nodes = [make_node(name, log, delay=0.1) for name in "abcd"]
+    
+    async def main():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await WorkflowScheduler(nodes).run({})
+        return loop.time() - start
+        
+    assert asyncio.run(main()) < 0.3
+
+def test_longest_critical_path_goes_first():
+    log = []
+    short = make_node("short", log, timeout_seconds=1)
+    long_head = make_node("long_head", log, timeout_seconds=1)
+    long_tail = make_node("long_tail", log, timeout_seconds=10)
+    long_head.add_next_node(long_tail)
+    
+    asyncio.run(WorkflowScheduler([short, long_head, long_tail]).run({}, n_workers=1))
+    assert log == ["long_head", "long_tail", "short"]
+
+def test_runnable_nodes_follow_completion():
+    a, b, c, d = diamond([])
+    scheduler = WorkflowScheduler([a, b, c, d])
+    assert scheduler.runnable_nodes() == [a]
+    
+    a.complete({})
+    assert set(scheduler.runnable_nodes()) == {b, c}
+    b.complete({})
+    assert scheduler.runnable_nodes() == [c]
+    c.complete({})
+    assert scheduler.runnable_nodes() == [d]
+
+def test_failing_node_is_recorded_and_blocks_successors():
+    log = []
+    a, b, c, d = diamond(log, max_iterations=2)
+    c.failures = 5
+    scheduler = WorkflowScheduler([a, b, c, d])
+    results = asyncio.run(scheduler.run({}))
+    
+    assert set(results) == {"a", "b"}
+    assert set(scheduler.errors) == {"c"}
+    assert c.calls == 2
+    assert "d" not in log
+
+def test_failures_within_max_iterations_are_retried():
+    log = []
+    a, b, c, d = diamond(log, max_iterations=3)
+    b.failures = 2
+    scheduler = WorkflowScheduler([a, b, c, d])
+    results = asyncio.run(scheduler.run({}))
+    
+    assert scheduler.errors == {}
+    assert b.calls == 3
+    assert results["d"]["previous"] == ["b", "c"]
+
+def test_timeouts_count_as_failures():
+    slow = make_node("slow", [], timeout_seconds=1, delay=10.0)
+    scheduler = WorkflowScheduler([slow])
+    assert asyncio.run(scheduler.run({})) == {}
+    assert set(scheduler.errors) == {"slow"}
+
+@pytest.mark.parametrize("with_store", [False, True], ids=["no_store", "store"])
+def test_rerun_with_different_input_returns_new_results(with_store):
+    nodes = diamond([])
+    scheduler = WorkflowScheduler(nodes, InMemoryStateStore() if with_store else None)
+    
+    async def main():
+        first = await scheduler.run({"q": 1})
+        second = await scheduler.run({"q": 2})
+        return first, second
+        
+    first, second = asyncio.run(main())
+    assert first["d"]["input"] == {"q": 1}
+    assert second["d"]["input"] == {"q": 2}
+    assert all(node.calls == 2 for node in nodes)
+
+def test_restart_after_failure_skips_completed_nodes():
+    log = []
+    a, b, c, d = diamond(log)
+    c.failures = 1
+    store = InMemoryStateStore()
+    
+    async def main():
+        first = await WorkflowScheduler([a, b, c, d], store).run({"q": 1})
+        saved = {name: await store.load(name) for name in "abcd"}
+        log.clear()
+        second = await WorkflowScheduler([a, b, c, d], store).run({"q": 1})
+        after = {name: await store.load(name) for name in "abcd"}
+        return first, saved, second, after
+        
+    first, saved, second, after = asyncio.run(main())
+    assert set(first) == {"a", "b"}
+    assert saved["a"] is not None and saved["c"] is None
+    assert json.loads(saved["b"])["state"]["completed"]
+    # Only the nodes that had not finished are processed again
+    assert sorted(log) == ["c", "d"]
+    assert second["d"]["previous"] == ["b", "c"]
+    assert second["a"] == first["a"]
+    # A clean run leaves nothing to resume
+    assert after == dict.fromkeys("abcd")
+
+def test_saved_state_for_other_input_is_ignored():
+    log = []
+    a, b = make_node("a", log), make_node("b", log)
+    a.add_next_node(b)
+    b.failures = 1
+    store = InMemoryStateStore()
+    
+    async def main():
+        await WorkflowScheduler([a, b], store).run({"q": 1})
+        log.clear()
+        return await WorkflowScheduler([a, b], store).run({"q": 2})
+        
+    results = asyncio.run(main())
+    assert log == ["a", "b"]
+    assert results["a"]["input"] == {"q": 2}
+
+class FailingSaveStore(InMemoryStateStore):
+    """Store whose writes always fail."""
+    
+    async def save(self, node_id, state_json):
+        raise OSError("disk full")
+
+@pytest.mark.parametrize("n_workers", [1, 8])
+def test_unexpected_errors_are_recorded_without_stalling_the_run(n_workers):
+    a, b = make_node("a", []), make_node("b", [])
+    a.add_next_node(b)
+    scheduler = WorkflowScheduler([a, b], FailingSaveStore())
+    asyncio.run(asyncio.wait_for(scheduler.run({}, n_workers=n_workers), 5))
+    assert isinstance(scheduler.errors["a"], OSError)
+
+def test_failed_save_fails_the_node_and_keeps_the_store():
+    log = []
+    a, b = make_node("a", log), make_node("b", log)
+    a.add_next_node(b)
+    store = FailingSaveStore()
+    store._states["stale"] = "{}"
+    scheduler = WorkflowScheduler([a, b], store)
+    results = asyncio.run(scheduler.run({}))
+    
+    assert results == {}
+    assert set(scheduler.errors) == {"a"}
+    assert log == ["a"]
+    assert store._states == {"stale": "{}"}
+
+class FailingLoadStore(InMemoryStateStore):
+    """Store whose reads always fail."""
+    
+    async def load(self, node_id):
+        raise OSError("unreadable")
+
+@pytest.mark.parametrize("saved", ["not json", "{}", '{"input_digest": null}', "[1]"])
+def test_unreadable_saved_state_counts_as_missing(saved):
+    log = []
+    a = make_node("a", log)
+    store = InMemoryStateStore()
+    store._states["a"] = saved
+    scheduler = WorkflowScheduler([a], store)
+    
+    assert asyncio.run(scheduler.run({}))["a"]["name"] == "a"
+    assert scheduler.errors == {}
+    assert log == ["a"]
+
+def test_failing_load_counts_as_missing():
+    log = []
+    a = make_node("a", log)
+    scheduler = WorkflowScheduler([a], FailingLoadStore())
+    
+    assert set(asyncio.run(scheduler.run({}))) == {"a"}
+    assert scheduler.errors == {}
+
+def test_process_cached_only_caches_cacheable_nodes():
+    plain = make_node("plain", [])
+    cached = make_node("cached", [], cacheable=True)
+    node_input = {"input": {"q": 1}, "previous_results": {}}
+    
+    async def main():
+        for node in (plain, cached):
+            await node.process_cached(node_input)
+            await node.process_cached(dict(node_input))
+        await cached.process_cached({"input": {"q": 2}, "previous_results": {}})
+        
+    asyncio.run(main())
+    assert plain.calls == 2
+    assert cached.calls == 2
+
+def test_process_cached_recomputes_expired_entries(monkeypatch):
+    from workflow import base_node
+    
+    now = [100.0]
+    monkeypatch.setattr(base_node.time, "monotonic", lambda: now[0])
+    node = make_node("cached", [], cacheable=True, cache_ttl_seconds=10)
+    node_input = {"input": {}, "previous_results": {}}
+    
+    async def call():
+        await node.process_cached(node_input)
+        
+    asyncio.run(call())
+    now[0] += 5
+    asyncio.run(call())
+    assert node.calls == 1
+    now[0] += 10
+    asyncio.run(call())
+    assert node.calls == 2
+
+def test_process_cached_is_bounded(monkeypatch):
+    monkeypatch.setattr(RecordingNode, "PROCESS_CACHE_SIZE", 2)
+    node = make_node("cached", [], cacheable=True)
+    
+    async def main():
+        for q in (1, 2, 3, 1):
+            await node.process_cached({"input": {"q": q}, "previous_results": {}})
+            
+    asyncio.run(main())
+    assert len(node._process_cache) == 2
+    assert node.calls == 4
+
+def test_process_cached_skips_unserializable_input():
+    node = make_node("cached", [], cacheable=True)
+    node_input = {"input": {"handle": object()}, "previous_results": {}}
+    
+    async def main():
+        await node.process_cached(node_input)
+        await node.process_cached(node_input)
+        
+    asyncio.run(main())
+    assert node.calls == 2
+
+class SumOfSquaresNode(ProcessWorkflowNode):
+    """CPU-bound node that also reports which process computed it."""
+    
+    @staticmethod
+    def compute(input_data):
+        n = input_data["input"]["n"] + sum(result["total"] for result in input_data["previous_results"].values())
+        return {"total": sum(i * i for i in range(n)), "pid": os.getpid()}
+
+def test_process_nodes_compute_in_worker_processes():
+    config = dict(description="", required_agents=[], max_iterations=1, timeout_seconds=60)
+    first = SumOfSquaresNode(NodeConfig(name="first", **config))
+    second = SumOfSquaresNode(NodeConfig(name="second", **config))
+    first.add_next_node(second)
+    
+    results = asyncio.run(WorkflowScheduler([first, second]).run({"n": 4}))
+    assert results["first"]["total"] == 14
+    assert results["second"]["total"] == sum(i * i for i in range(18))
+    assert os.getpid() not in {results["first"]["pid"], results["second"]["pid"]}
+
+def test_dispatch_keeps_order_and_limits_concurrency():
+    node = make_node("fan_out", [], max_concurrent=2)
+    running = [0]
+    peak = [0]
+    
+    async def call(i):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.01 * (5 - i))
+        running[0] -= 1
+        return i
+        
+    assert asyncio.run(node.dispatch(call(i) for i in range(5))) == list(range(5))
+    assert peak[0] == 2
+
+def test_dispatch_propagates_the_first_error():
+    node = make_node("fan_out", [], max_concurrent=1)
+    
+    async def fail():
+        raise KeyError("boom")
+        
+    async def never():
+        raise AssertionError("should not run")
+        
+    with pytest.raises(KeyError):
+        asyncio.run(node.dispatch([fail(), never()]))
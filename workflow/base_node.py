@@ -3,37 +3,105 @@ Base Workflow Node
 Defines the core functionality for workflow nodes in the think tank system.
 """
 
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel
-from ..agents.base_agent import BaseAgent
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Annotated, Any, Awaitable, Callable, ClassVar, Deque, FrozenSet, Iterable, List, Optional, Set, Tuple, TypeVar
+from pydantic import BaseModel, field_validator
+from agents.base_agent import BaseAgent
+from agents.serialization import stable_hash
 
-class NodeState(BaseModel):
+_T = TypeVar("_T")
+
+# Worker processes for CPU-bound node work, created on first use so importers that never offload pay nothing
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+def _process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        # Spawned rather than forked, since the agents' thread pools may already be running
+        _PROCESS_POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        )
+    return _PROCESS_POOL
+
+# Lifecycle event kinds put on a node's events queue, as (kind, node name, ...) tuples
+TASK_STARTED = 'started'
+TASK_COMPLETED = 'completed'
+TASK_FAILED = 'failed'
+
+def dict_merge(current: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """Reducer that merges update into current in place and returns current."""
+    current.update(update)
+    return current
+
+@dataclass(slots=True)
+class NodeState:
     """Represents the current state of a workflow node."""
     active: bool = False
     completed: bool = False
     iteration: int = 0
-    results: Dict[str, Any] = {}
-    errors: List[str] = []
+    # Results accumulate through the reducer instead of being replaced
+    results: Annotated[Dict[str, Any], dict_merge] = field(default_factory=dict)
+    # Most recent errors only; nodes size it to their max_iterations
+    errors: Deque[str] = field(default_factory=deque)
 
 class NodeConfig(BaseModel):
     """Configuration for a workflow node."""
     name: str
     description: str
-    required_agents: List[str]
+    required_agents: FrozenSet[str]
     max_iterations: int
     timeout_seconds: int
     auto_proceed: bool = True
+    # Reuse results of earlier runs with identical input (None keeps them until evicted)
+    cacheable: bool = False
+    cache_ttl_seconds: Optional[int] = None
+    # Most agent calls a node's dispatch() runs at the same time
+    max_concurrent: int = 16
+    
+    @field_validator('required_agents', mode='before')
+    @classmethod
+    def _normalize_agent_names(cls, names: Iterable[str]) -> FrozenSet[str]:
+        """Lowercase and intern agent names once so lookups need no normalization."""
+        return frozenset(sys.intern(name.lower()) for name in names)
 
 class BaseWorkflowNode(ABC):
     """Abstract base class for all workflow nodes."""
     
+    # Bound for the memoized process() results of cacheable nodes
+    PROCESS_CACHE_SIZE = 1024
+    
+    # Bumped on every edge added to any workflow, so schedulers know when their derived data is stale
+    _graph_version: ClassVar[int] = 0
+    
     def __init__(self, config: NodeConfig):
         self.config = config
-        self.state = NodeState()
+        # The name never changes, so __str__ only formats the live state
+        self._str_prefix = f"{config.name} Node"
+        self.state = NodeState(errors=deque(maxlen=config.max_iterations))
         self.next_nodes: List['BaseWorkflowNode'] = []
         self.previous_nodes: List['BaseWorkflowNode'] = []
         self.participating_agents: Dict[str, BaseAgent] = {}
+        # Input digest -> (monotonic time stored, results)
+        self._process_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Required agents not yet connected, shrunk by connect_agent
+        self._missing: Set[str] = set(config.required_agents)
+        # Number of previous nodes not yet completed; kept current by their start()/complete()
+        self._pending = 0
+        self._ready_event = asyncio.Event()
+        self._ready_event.set()
+        # When set, complete() puts next nodes that become ready on this queue
+        self.ready_queue: Optional[asyncio.Queue] = None
+        # When set, lifecycle events are put on this queue without waiting for its consumer
+        self.events: Optional[asyncio.Queue] = None
         
     @abstractmethod
     async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -48,22 +116,127 @@ class BaseWorkflowNode(ABC):
         """
         pass
         
-    async def connect_agent(self, agent: BaseAgent):
+    async def process_cached(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Process input data, reusing the results of an earlier identical run.
+        
+        Only nodes configured as cacheable keep results, in an LRU keyed by a
+        digest of the input; entries older than cache_ttl_seconds are
+        recomputed. Inputs that cannot be serialized are always processed.
+        
+        Args:
+            input_data: Data to be processed by this node
+            
+        Returns:
+            Dict containing the processing results
+        """
+        if not self.config.cacheable:
+            return await self.process(input_data)
+        try:
+            key = stable_hash(input_data)
+        except (TypeError, ValueError):
+            return await self.process(input_data)
+            
+        entry = self._process_cache.get(key)
+        if entry is not None:
+            stored_at, results = entry
+            ttl = self.config.cache_ttl_seconds
+            if ttl is None or time.monotonic() - stored_at < ttl:
+                self._process_cache.move_to_end(key)
+                return results
+            del self._process_cache[key]
+            
+        results = await self.process(input_data)
+        self._process_cache[key] = (time.monotonic(), results)
+        if len(self._process_cache) > self.PROCESS_CACHE_SIZE:
+            self._process_cache.popitem(last=False)
+        return results
+        
+    async def dispatch(self, calls: Iterable[Awaitable[_T]]) -> List[_T]:
+        """
+        Await agent calls concurrently, at most config.max_concurrent at a time.
+        
+        A fixed set of workers pulls calls one by one, so a large fan-out
+        never has more than max_concurrent tasks on the event loop. If a
+        call fails, the others are cancelled and the error propagates.
+        
+        Args:
+            calls: Awaitables (typically agent coroutines) that have not been awaited yet
+            
+        Returns:
+            The results, in the order of calls
+        """
+        calls = list(calls)
+        results: List[Any] = [None] * len(calls)
+        remaining = iter(enumerate(calls))
+        
+        async def worker():
+            for i, call in remaining:
+                results[i] = await call
+                
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(min(self.config.max_concurrent, len(calls))):
+                    group.create_task(worker())
+        except BaseExceptionGroup as eg:
+            # Close the calls no worker got to, so they don't warn about never being awaited
+            for _, call in remaining:
+                if asyncio.iscoroutine(call):
+                    call.close()
+            raise eg.exceptions[0]
+        return results
+        
+    def run_in_process(self, fn: Callable[..., _T], *args: Any) -> "asyncio.Future[_T]":
+        """
+        Run a CPU-bound helper in the shared worker process pool.
+        
+        Unlike threads, worker processes are not serialized by the GIL, so
+        CPU-bound work in concurrently scheduled nodes runs in parallel.
+        
+        Args:
+            fn: A picklable callable, e.g. a module-level function
+            *args: Picklable positional arguments passed to fn
+            
+        Returns:
+            Awaitable resolving to fn's return value
+        """
+        return asyncio.get_running_loop().run_in_executor(_process_pool(), fn, *args)
+        
+    def connect_agent(self, agent: BaseAgent):
         """
         Connect an agent to this workflow node.
         
         Args:
             agent: The agent to connect to this node
         """
-        if agent.personality.name.lower() in self.config.required_agents:
-            self.participating_agents[agent.personality.name.lower()] = agent
+        self.connect_agents((agent,))
+        
+    def connect_agents(self, agents: Iterable[BaseAgent]):
+        """
+        Connect several agents to this workflow node in one pass.
+        
+        Agents this node does not require are ignored.
+        
+        Args:
+            agents: The agents to connect to this node
+        """
+        required = self.config.required_agents
+        for agent in agents:
+            name = agent.personality.normalized_name
+            if name in required:
+                self.participating_agents[name] = agent
+                self._missing.discard(name)
             
     def add_next_node(self, node: 'BaseWorkflowNode'):
         """Add a node that should be processed after this one."""
         self.next_nodes.append(node)
         node.previous_nodes.append(self)
+        BaseWorkflowNode._graph_version += 1
+        if not self.state.completed:
+            node._pending += 1
+            node._ready_event.clear()
         
-    async def validate_readiness(self) -> bool:
+    def validate_readiness(self) -> bool:
         """
         Check if the node is ready to process data.
         
@@ -71,37 +244,69 @@ class BaseWorkflowNode(ABC):
             bool indicating if the node is ready
         """
         # Check if we have all required agents
-        missing_agents = set(self.config.required_agents) - set(self.participating_agents.keys())
-        if missing_agents:
-            raise ValueError(f"Missing required agents: {missing_agents}")
+        if self._missing:
+            raise ValueError(f"Missing required agents: {self._missing}")
             
-        # Check if previous nodes are completed if any
-        for prev_node in self.previous_nodes:
-            if not prev_node.state.completed:
-                return False
-                
-        return True
+        # Previous nodes report their completion, so no need to poll them
+        return self._pending == 0
         
-    async def start(self):
-        """Prepare the node for processing."""
-        self.state.active = True
+    async def wait_ready(self):
+        """Wait until every previous node has completed."""
+        await self._ready_event.wait()
+        
+    def reset(self):
+        """Return the node to its not yet run state."""
+        if self.state.completed:
+            # Rerunning: next nodes must wait for this run too
+            for node in self.next_nodes:
+                node._pending += 1
+                node._ready_event.clear()
+        self.state.active = False
         self.state.iteration = 0
         self.state.completed = False
-        self.state.results.clear()
-        self.state.errors.clear()
+        self.state.results = {}
+        self.state.errors = deque(maxlen=self.config.max_iterations)
         
-    async def complete(self, results: Dict[str, Any]):
+    def start(self):
+        """Prepare the node for processing."""
+        self.reset()
+        self.state.active = True
+        if self.events is not None:
+            self.events.put_nowait((TASK_STARTED, self.config.name))
+            
+    def merge_results(self, results: Dict[str, Any]):
+        """
+        Merge partial results into the node's results while it is still running.
+        
+        Args:
+            results: The results to add
+        """
+        self.state.results = dict_merge(self.state.results, results)
+        
+    def complete(self, results: Dict[str, Any]):
         """
         Mark the node as completed with the given results.
         
         Args:
-            results: The final results from this node's processing
+            results: The final results from this node's processing, merged
+                into any partial results it already reported
         """
+        was_completed = self.state.completed
         self.state.active = False
         self.state.completed = True
-        self.state.results = results
+        self.state.results = dict_merge(self.state.results, results)
+        if was_completed:
+            return
+        for node in self.next_nodes:
+            node._pending -= 1
+            if node._pending == 0:
+                node._ready_event.set()
+                if self.ready_queue is not None:
+                    self.ready_queue.put_nowait(node)
+        if self.events is not None:
+            self.events.put_nowait((TASK_COMPLETED, self.config.name, results))
         
-    async def handle_error(self, error: Exception):
+    def handle_error(self, error: Exception):
         """
         Handle an error that occurred during processing.
         
@@ -109,8 +314,38 @@ class BaseWorkflowNode(ABC):
             error: The error that occurred
         """
         self.state.errors.append(str(error))
-        if len(self.state.errors) >= self.config.max_iterations:
+        if self.events is not None:
+            self.events.put_nowait((TASK_FAILED, self.config.name, str(error)))
+        if len(self.state.errors) == self.state.errors.maxlen:
             raise RuntimeError(f"Max iterations ({self.config.max_iterations}) reached with errors")
             
     def __str__(self) -> str:
-        return f"{self.config.name} Node (Active: {self.state.active}, Completed: {self.state.completed})"
+        state = self.state
+        return f"{self._str_prefix} (Active: {state.active}, Completed: {state.completed})"
+
+class ProcessWorkflowNode(BaseWorkflowNode):
+    """
+    Workflow node whose work is pure, CPU-bound Python, run in a worker process.
+    
+    Subclasses implement compute() as a static method of a module-level
+    class, so it and its input pickle by reference. Such nodes hold no
+    agents, locks or event loop state; nodes that await agents keep
+    subclassing BaseWorkflowNode.
+    """
+    
+    @staticmethod
+    @abstractmethod
+    def compute(input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compute this node's results in a worker process.
+        
+        Args:
+            input_data: The node's input, with the run input and previous results
+            
+        Returns:
+            Dict containing the processing results
+        """
+        pass
+        
+    async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.run_in_process(type(self).compute, input_data)
@@ -0,0 +1,136 @@
+"""
+Request Batching
+Coalesces requests that sibling workflow nodes make to the same backend into batched calls.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Sequence, Set, Tuple, TypeVar
+from weakref import WeakKeyDictionary
+
+_Req = TypeVar("_Req")
+_Res = TypeVar("_Res")
+
+BatchFn = Callable[[List[_Req]], Awaitable[Sequence[_Res]]]
+
+class BatchedDispatcher(Generic[_Req, _Res]):
+    """
+    Collects requests for a short window and sends them as one batch.
+    
+    A batch goes out max_delay seconds after its first request arrives, or
+    as soon as max_batch_size requests are waiting, whichever comes first.
+    Each caller gets back the result at its own position in the batch; if
+    the batch call fails, every caller in it gets the error.
+    """
+    
+    def __init__(self, batch_fn: BatchFn, max_batch_size: int = 16, max_delay: float = 0.005):
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: List[Tuple[_Req, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The event loop only keeps weak references to tasks, so in-flight batches are held here
+        self._in_flight: Set[asyncio.Task] = set()
+        
+    async def submit(self, request: _Req) -> _Res:
+        """
+        Queue a request for the next batch and wait for its result.
+        
+        Args:
+            request: The request to send
+            
+        Returns:
+            The batch call's result for this request
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+        
+    def _flush(self):
+        """Send everything waiting as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+            
+    async def _run_batch(self, batch: List[Tuple[_Req, asyncio.Future]]):
+        """Make the batch call and hand each caller its result."""
+        try:
+            results = await self.batch_fn([request for request, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch call returned {len(results)} results for {len(batch)} requests")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            # Callers that were cancelled meanwhile simply drop their result
+            if not future.done():
+                future.set_result(result)
+
+# Dispatchers hold timers and futures bound to the loop they were used on, so each
+# event loop gets its own registry, dropped together with the loop
+_DISPATCHERS: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, BatchedDispatcher]]" = WeakKeyDictionary()
+
+def get_dispatcher(key: Hashable, batch_fn: BatchFn, **options) -> BatchedDispatcher:
+    """
+    Return the dispatcher shared by every caller of one backend on the running event loop.
+    
+    Args:
+        key: Identifies the backend, e.g. (backend_url, model)
+        batch_fn: Sends a list of requests in one call; used when the dispatcher is created
+        **options: max_batch_size / max_delay for a newly created dispatcher
+        
+    Returns:
+        The existing dispatcher for key on this loop, or a new one
+    """
+    loop = asyncio.get_running_loop()
+    dispatchers = _DISPATCHERS.get(loop)
+    if dispatchers is None:
+        dispatchers = _DISPATCHERS[loop] = {}
+    dispatcher = dispatchers.get(key)
+    if dispatcher is None:
+        dispatcher = dispatchers[key] = BatchedDispatcher(batch_fn, **options)
+    return dispatcher
+
+class BatchedKnowledgeBase:
+    """
+    Knowledge base front that coalesces concurrent queries into batched lookups.
+    
+    Wraps a knowledge base with an async query_batch(queries) returning one
+    result per query. Queries made at about the same time, e.g. by the
+    agents of sibling nodes the scheduler runs together, share one
+    query_batch call instead of issuing one request each.
+    """
+    __slots__ = ("knowledge_base", "options")
+    
+    def __init__(self, knowledge_base: Any, **options):
+        self.knowledge_base = knowledge_base
+        self.options = options
+        
+    @staticmethod
+    def supports(knowledge_base: Any) -> bool:
+        """Whether knowledge_base can be wrapped, i.e. has query_batch and is not wrapped yet."""
+        return (
+            not isinstance(knowledge_base, BatchedKnowledgeBase)
+            and callable(getattr(knowledge_base, "query_batch", None))
+        )
+        
+    async def query(self, query: Any) -> Any:
+        """Look up a single query as part of the next batch."""
+        # The wrapped knowledge base stays alive with its dispatcher, so its id is not reused meanwhile
+        dispatcher = get_dispatcher(
+            ("knowledge_base", id(self.knowledge_base)), self.knowledge_base.query_batch, **self.options
+        )
+        return await dispatcher.submit(query)
@@ -0,0 +1,304 @@
+"""
+Workflow Scheduler
+Runs a DAG of workflow nodes, dispatching each node as soon as all of its previous nodes complete.
+"""
+
+import asyncio
+import contextvars
+import dataclasses
+import heapq
+import itertools
+import json
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from agents.serialization import dumps, stable_hash
+from .base_node import BaseWorkflowNode, NodeState, dict_merge
+from .batching import BatchedKnowledgeBase
+from .state_store import StateStore
+
+class CriticalPathQueue(asyncio.Queue):
+    """
+    Ready queue that hands out the node with the longest remaining critical path first.
+    
+    Nodes are put and got as plain nodes, like with asyncio.Queue, so
+    BaseWorkflowNode.complete() can feed it directly; ties keep FIFO order.
+    """
+    
+    def __init__(self, critical_path: Dict[BaseWorkflowNode, float]):
+        self.critical_path = critical_path
+        self._counter = itertools.count()
+        super().__init__()
+        
+    def _init(self, maxsize):
+        self._queue = []
+        
+    def _put(self, node):
+        heapq.heappush(self._queue, (-self.critical_path[node], next(self._counter), node))
+        
+    def _get(self):
+        return heapq.heappop(self._queue)[2]
+
+class WorkflowScheduler:
+    """
+    Executes workflow nodes concurrently in dependency order.
+    
+    The graph is topologically sorted once, on construction. Nodes without
+    previous nodes seed a ready queue; each completed node puts the next
+    nodes it unblocks on the same queue, so workers never walk the graph
+    looking for work and the run takes as long as the DAG's critical path.
+    When more nodes are ready than there are workers, those heading the
+    longest chains of remaining work go first.
+    
+    The order and everything derived from it are rebuilt lazily when
+    edges are added after construction.
+    
+    Knowledge bases of participating agents that offer query_batch are
+    wrapped in a BatchedKnowledgeBase before a run, so the queries of
+    nodes running side by side go out as shared batches.
+    
+    With a state store, every completed node's state is saved together with
+    a digest of the node's input, and a node whose saved state is completed
+    for the same input is not processed again, so a restarted run only
+    redoes the nodes that had not finished. The store is cleared once a run
+    finishes without errors, so later runs start fresh. A saved state that
+    cannot be read is treated as missing; a state that cannot be saved
+    fails its node, so the run keeps the store for a later resume.
+    """
+    
+    def __init__(self, nodes: Iterable[BaseWorkflowNode], store: Optional[StateStore] = None):
+        self.nodes: List[BaseWorkflowNode] = list(nodes)
+        self.store = store
+        self.ready = CriticalPathQueue({})
+        self.errors: Dict[str, BaseException] = {}
+        # Workflow code doesn't use context variables, so every task shares one empty
+        # context instead of paying for a copy of the current one per task
+        self._context = contextvars.Context()
+        self._seen_version = -1
+        self._refresh()
+        
+    def _refresh(self):
+        """
+        Recompute the order, critical paths and adjacency matrix if the graph changed.
+        
+        Raises:
+            ValueError: If the nodes no longer form a DAG
+        """
+        if BaseWorkflowNode._graph_version == self._seen_version:
+            return
+        self.order = self._topological_order(self.nodes)
+        self.critical_path = self._critical_path_lengths(self.order)
+        self.index = {node: i for i, node in enumerate(self.order)}
+        self.adjacency = self._adjacency_matrix(self.order, self.index)
+        self.in_degree = self.adjacency.sum(axis=0, dtype=np.int32)
+        self.ready.critical_path = self.critical_path
+        for node in self.nodes:
+            node.ready_queue = self.ready
+        self._seen_version = BaseWorkflowNode._graph_version
+        
+    @staticmethod
+    def _topological_order(nodes: List[BaseWorkflowNode]) -> List[BaseWorkflowNode]:
+        """
+        Sort nodes with Kahn's algorithm.
+        
+        Raises:
+            ValueError: If the nodes contain a cycle or depend on nodes outside the list
+        """
+        in_degree = {node: len(node.previous_nodes) for node in nodes}
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for next_node in node.next_nodes:
+                if next_node not in in_degree:
+                    raise ValueError(f"Node {next_node.config.name} is not part of the workflow")
+                in_degree[next_node] -= 1
+                if in_degree[next_node] == 0:
+                    queue.append(next_node)
+                    
+        if len(order) != len(in_degree):
+            blocked = sorted(node.config.name for node, degree in in_degree.items() if degree > 0)
+            raise ValueError(f"Workflow contains a cycle or unknown dependencies: {blocked}")
+        return order
+        
+    @staticmethod
+    def _critical_path_lengths(order: List[BaseWorkflowNode]) -> Dict[BaseWorkflowNode, float]:
+        """
+        Compute, for each node, the cost of the longest path from it to a sink.
+        
+        A node's timeout_seconds stands in for its cost.
+        """
+        lengths: Dict[BaseWorkflowNode, float] = {}
+        for node in reversed(order):
+            lengths[node] = node.config.timeout_seconds + max(
+                (lengths[next_node] for next_node in node.next_nodes), default=0
+            )
+        return lengths
+        
+    @staticmethod
+    def _adjacency_matrix(order: List[BaseWorkflowNode], index: Dict[BaseWorkflowNode, int]) -> np.ndarray:
+        """
+        Build the boolean adjacency matrix of the workflow in topological order.
+        
+        adjacency[i, j] is 1 when order[j] follows order[i]; the matrix is
+        strictly upper triangular because edges only point forward.
+        """
+        adjacency = np.zeros((len(order), len(order)), dtype=np.uint8)
+        for i, node in enumerate(order):
+            adjacency[i, [index[next_node] for next_node in node.next_nodes]] = 1
+        return adjacency
+        
+    def runnable_nodes(self) -> List[BaseWorkflowNode]:
+        """
+        Return the unfinished nodes whose previous nodes have all completed.
+        
+        Answers the global query with one matrix-vector product instead of
+        walking every node's previous nodes; dispatch itself still relies on
+        the per-node dependency counters.
+        """
+        self._refresh()
+        completed = np.fromiter((node.state.completed for node in self.order), dtype=np.int32, count=len(self.order))
+        runnable = (self.adjacency.T @ completed == self.in_degree) & (completed == 0)
+        return [self.order[i] for i in np.flatnonzero(runnable)]
+        
+    async def run(self, input_data: Dict[str, Any], n_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Process every node of the workflow.
+        
+        Each node receives the original input together with the results of
+        its previous nodes. A node whose processing keeps failing until it
+        runs out of iterations is recorded in errors, and the nodes after it
+        are not run. Any other error raised while running a node is recorded
+        the same way, so it can neither stall the run nor go unnoticed.
+        
+        Args:
+            input_data: Data given to every node
+            n_workers: Maximum number of nodes processed at the same time
+            
+        Returns:
+            Results of each completed node, keyed by node name
+        """
+        self._refresh()
+        self.errors.clear()
+        self._batch_knowledge_queries()
+        # Reset every node first so a rerun cannot release a node before all its previous nodes restart
+        for node in self.order:
+            node.reset()
+        for node in self.order:
+            if not node.previous_nodes:
+                self.ready.put_nowait(node)
+                
+        workers = [
+            asyncio.create_task(self._worker(input_data), context=self._context)
+            for _ in range(n_workers)
+        ]
+        try:
+            await self.ready.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            
+        # Saved states only serve to resume an interrupted run
+        if self.store is not None and not self.errors:
+            await self.store.clear()
+        return {node.config.name: node.state.results for node in self.order if node.state.completed}
+        
+    def _batch_knowledge_queries(self):
+        """Route the knowledge base queries of every participating agent through a shared batcher."""
+        for node in self.order:
+            for agent in node.participating_agents.values():
+                if BatchedKnowledgeBase.supports(agent.knowledge_base):
+                    agent.knowledge_base = BatchedKnowledgeBase(agent.knowledge_base)
+                    
+    async def _worker(self, input_data: Dict[str, Any]):
+        """Process nodes from the ready queue until cancelled."""
+        while True:
+            node = await self.ready.get()
+            try:
+                await self._run_node(node, input_data)
+            except Exception as e:
+                # A dead worker would leave queued nodes unprocessed and hide the failure
+                node.state.active = False
+                self.errors[node.config.name] = e
+            finally:
+                self.ready.task_done()
+                
+    async def _run_node(self, node: BaseWorkflowNode, input_data: Dict[str, Any]):
+        """Process a single node, retrying failures until the node gives up."""
+        try:
+            node.validate_readiness()
+        except ValueError as e:
+            self.errors[node.config.name] = e
+            return
+        node.start()
+        node_input = {
+            'input': input_data,
+            'previous_results': {prev.config.name: prev.state.results for prev in node.previous_nodes}
+        }
+        input_digest = None
+        if self.store is not None:
+            try:
+                input_digest = stable_hash(node_input)
+            except (TypeError, ValueError):
+                pass  # Inputs that cannot be serialized are neither resumed nor saved
+        if input_digest is not None:
+            saved_results = await self._load_results(node, input_digest)
+            if saved_results is not None:
+                node.complete(saved_results)
+                return
+                
+        while True:
+            try:
+                # Passing wait_for a task, rather than a coroutine, keeps it from wrapping one with a copied context
+                task = asyncio.create_task(node.process_cached(node_input), context=self._context)
+                results = await asyncio.wait_for(task, node.config.timeout_seconds)
+            except Exception as e:
+                try:
+                    node.handle_error(e)
+                except RuntimeError as fatal:
+                    node.state.active = False
+                    self.errors[node.config.name] = fatal
+                    return
+                node.state.iteration += 1
+                continue
+            if input_digest is not None:
+                # Save before completing, so next nodes only start once this node can be resumed
+                state = dataclasses.replace(
+                    node.state, active=False, completed=True,
+                    results=dict_merge(dict(node.state.results), results)
+                )
+                payload = {'input_digest': input_digest, 'state': state}
+                try:
+                    await self.store.save(node.config.name, dumps(payload).decode())
+                except Exception as e:
+                    node.state.active = False
+                    self.errors[node.config.name] = e
+                    return
+            # complete() puts the next nodes this one unblocks on the ready queue
+            node.complete(results)
+            return
+            
+    async def _load_results(self, node: BaseWorkflowNode, input_digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the results saved for node if it completed for the same input.
+        
+        Returns:
+            The saved results, or None if there are none or they cannot be read
+        """
+        try:
+            saved = await self.store.load(node.config.name)
+            if saved is None:
+                return None
+            saved = json.loads(saved)
+            # A state saved for different input (another run, or changed upstream results) is stale
+            if saved['input_digest'] != input_digest:
+                return None
+            state = NodeState(**saved['state'])
+        except Exception:
+            # Unreadable or corrupt states are as good as missing; the node simply runs again
+            return None
+        return state.results if state.completed else None
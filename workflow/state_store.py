@@ -0,0 +1,119 @@
+"""
+Workflow State Store
+Persists the state of completed workflow nodes so an interrupted run can resume without redoing them.
+"""
+
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+from urllib.parse import quote
+
+class StateStore(ABC):
+    """Abstract key-value store for serialized node states."""
+    
+    @abstractmethod
+    async def save(self, node_id: str, state_json: str):
+        """
+        Store the serialized state of a node, replacing any earlier one.
+        
+        Args:
+            node_id: Name of the node
+            state_json: The node's state as JSON
+        """
+        pass
+        
+    @abstractmethod
+    async def load(self, node_id: str) -> Optional[str]:
+        """
+        Load the serialized state of a node.
+        
+        Args:
+            node_id: Name of the node
+            
+        Returns:
+            The node's state as JSON, or None if none was saved
+        """
+        pass
+        
+    @abstractmethod
+    async def clear(self):
+        """Drop every saved state."""
+        pass
+
+class InMemoryStateStore(StateStore):
+    """Keeps states in a dict; survives reruns within a process, not restarts."""
+    
+    def __init__(self):
+        self._states: Dict[str, str] = {}
+        
+    async def save(self, node_id: str, state_json: str):
+        self._states[node_id] = state_json
+        
+    async def load(self, node_id: str) -> Optional[str]:
+        return self._states.get(node_id)
+        
+    async def clear(self):
+        self._states.clear()
+
+class FileStateStore(StateStore):
+    """
+    Keeps one JSON file per node in a directory, fronted by a write-through LRU.
+    
+    Files are written to a temporary name and renamed into place, so a crash
+    mid-write never leaves a truncated state behind. Disk I/O runs in the
+    loop's default executor to keep the event loop free; unlike
+    asyncio.to_thread, that does not copy the context for every call.
+    """
+    
+    def __init__(self, directory: Union[str, Path], cache_size: int = 256):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        
+    def _path(self, node_id: str) -> Path:
+        return self.directory / f"{quote(node_id, safe='')}.json"
+        
+    def _remember(self, node_id: str, state_json: str):
+        self._cache[node_id] = state_json
+        self._cache.move_to_end(node_id)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            
+    @staticmethod
+    def _write(path: Path, state_json: str):
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(state_json, encoding='utf-8')
+        os.replace(tmp, path)
+        
+    @staticmethod
+    def _read(path: Path) -> Optional[str]:
+        try:
+            return path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+            
+    def _remove_all(self):
+        for path in self.directory.glob('*.json'):
+            path.unlink(missing_ok=True)
+            
+    async def save(self, node_id: str, state_json: str):
+        await asyncio.get_running_loop().run_in_executor(None, self._write, self._path(node_id), state_json)
+        self._remember(node_id, state_json)
+        
+    async def load(self, node_id: str) -> Optional[str]:
+        state_json = self._cache.get(node_id)
+        if state_json is not None:
+            self._cache.move_to_end(node_id)
+            return state_json
+        state_json = await asyncio.get_running_loop().run_in_executor(None, self._read, self._path(node_id))
+        if state_json is not None:
+            self._remember(node_id, state_json)
+        return state_json
+        
+    async def clear(self):
+        self._cache.clear()
+        await asyncio.get_running_loop().run_in_executor(None, self._remove_all)